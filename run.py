@@ -15,6 +15,14 @@ import uvicorn
 from src.endpoints.config import get_api_config
 
 if __name__ == "__main__":
+    # `python run.py migrate` applies schema migrations and exits; it runs once per
+    # deploy as the pre-deploy command (railway.toml), never on replica start
+    if sys.argv[1:] == ["migrate"]:
+        from src.db.migrate import run_migrations
+        
+        run_migrations()
+        sys.exit(0)
+    
     api_config = get_api_config()
     
     # Railway provides PORT environment variable
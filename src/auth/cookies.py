@@ -43,7 +43,7 @@ def create_credentials_cookie(email: str) -> str:
     Create a signed cookie token for credentials form access.
     
     Args:
-        email: The user's email address
+        email: The user's email address (stored lowercased in the cookie)
     
     Returns:
         A signed token string that can be used as a cookie value
@@ -54,14 +54,14 @@ def create_credentials_cookie(email: str) -> str:
     # Create payload with email and expiration timestamp
     expires_at = datetime.now(timezone.utc) + timedelta(minutes=COOKIE_EXPIRATION_MINUTES)
     payload = {
-        "email": email,
+        "email": email.lower(),
         "expires_at": expires_at.isoformat()
     }
     
     # Sign the payload
     token = serializer.dumps(payload)
     
-    logger.info(f"Created credentials cookie for email: {email}")
+    logger.info("Created credentials cookie for email: %s", email)
     return token
 
 
@@ -73,7 +73,7 @@ def verify_credentials_cookie(token: str) -> str:
         token: The signed token from the cookie
     
     Returns:
-        The user's email address
+        The user's email address, lowercased
     
     Raises:
         ValueError: If token is invalid or expired
@@ -96,13 +96,14 @@ def verify_credentials_cookie(token: str) -> str:
             if datetime.now(timezone.utc) > expires_at:
                 raise ValueError("Cookie has expired")
         
-        return email
+        # Cookies are minted lowercased; normalizing here covers any issued earlier
+        return email.lower()
     
     except SignatureExpired:
         raise ValueError("Cookie has expired")
     except BadSignature:
         raise ValueError("Invalid cookie signature")
     except Exception as e:
-        logger.error(f"Error verifying cookie: {e}")
+        logger.error("Error verifying cookie: %s", e)
         raise ValueError("Invalid cookie")
 
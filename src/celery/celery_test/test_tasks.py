@@ -3,6 +3,7 @@ Test tasks for verifying Celery configuration and credential decryption.
 These tasks do NOT run signoff automation - only test infrastructure.
 """
 import logging
+from sqlalchemy import select
 from .. import celery_app
 from src.db import SessionLocal
 from src.db.models import User
@@ -25,10 +26,12 @@ def test_decrypt_credentials(user_email: str):
     """
     db = SessionLocal()
     try:
-        logger.info(f"Testing credential decryption for: {user_email}")
+        logger.info("Testing credential decryption for: %s", user_email)
         
         # Test database connection
-        user = db.query(User).filter(User.email == user_email.lower()).first()
+        user = db.execute(
+            select(User).where(User.email == user_email.lower())
+        ).scalar_one_or_none()
         if not user:
             return {
                 "success": False,
@@ -63,7 +66,7 @@ def test_decrypt_credentials(user_email: str):
             }
         
         except Exception as decrypt_error:
-            logger.error(f"Decryption test failed for {user_email}: {decrypt_error}", exc_info=True)
+            logger.error("Decryption test failed for %s: %s", user_email, decrypt_error, exc_info=True)
             return {
                 "success": False,
                 "error": f"Decryption failed: {str(decrypt_error)}",
@@ -78,7 +81,7 @@ def test_decrypt_credentials(user_email: str):
             }
     
     except Exception as e:
-        logger.error(f"Test task failed: {e}", exc_info=True)
+        logger.error("Test task failed: %s", e, exc_info=True)
         return {
             "success": False,
             "error": str(e),
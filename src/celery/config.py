@@ -34,6 +34,10 @@ def get_celery_config() -> Dict[str, Any]:
     # Get worker concurrency (defaults to 1 for safe operation)
     worker_concurrency = int(os.getenv("CELERY_WORKER_CONCURRENCY", "1"))
     
+    # Queue for API email tasks (set to e.g. "email" and run a worker with -Q email -c 2
+    # to keep email sends from waiting behind signoff jobs)
+    email_queue = os.getenv("CELERY_EMAIL_QUEUE", "default")
+    
     config = {
         # Broker settings
         'broker_url': redis_url,
@@ -86,6 +90,9 @@ def get_celery_config() -> Dict[str, Any]:
         'task_default_exchange': 'default',
         'task_default_exchange_type': 'direct',
         'task_default_routing_key': 'default',
+        'task_routes': {
+            'src.celery.email_tasks.*': {'queue': email_queue},
+        },
         
         # Logging
         'worker_log_format': '[%(asctime)s: %(levelname)s/%(processName)s] %(message)s',
@@ -94,6 +101,7 @@ def get_celery_config() -> Dict[str, Any]:
         # Import settings
         'imports': (
             'src.celery.tasks',
+            'src.celery.email_tasks',
         ),
         
         # Beat schedule - periodic tasks
@@ -106,10 +114,11 @@ def get_celery_config() -> Dict[str, Any]:
     }
     
     logger.info("Celery configuration loaded")
-    logger.info(f"Broker: Redis at {redis_url.split('@')[-1] if '@' in redis_url else 'configured'}")
-    logger.info(f"Result backend: None (disabled)")
-    logger.info(f"Timezone: America/Los_Angeles (enable_utc=False)")
-    logger.info(f"Worker concurrency: {worker_concurrency}")
-    logger.info(f"Beat schedule: enqueue-signoffs-weekly-sun-0830 (Sunday 8:30am LA time)")
+    logger.info("Broker: Redis at %s", redis_url.split("@")[-1] if "@" in redis_url else "configured")
+    logger.info("Result backend: None (disabled)")
+    logger.info("Timezone: America/Los_Angeles (enable_utc=False)")
+    logger.info("Worker concurrency: %s", worker_concurrency)
+    logger.info("Email task queue: %s", email_queue)
+    logger.info("Beat schedule: enqueue-signoffs-weekly-sun-0830 (Sunday 8:30am LA time)")
     
     return config
\ No newline at end of file
@@ -0,0 +1,48 @@
+"""
+Celery tasks for sending emails off the API request path.
+"""
+import logging
+from typing import Optional
+from . import celery_app
+from src.db import SessionLocal  # SQLAlchemy session
+from src.mail.email_service import get_shared_email_service
+
+logger = logging.getLogger(__name__)
+
+
+@celery_app.task(name="src.celery.email_tasks.send_admin_alert_email")
+def send_admin_alert_email(subject: str, message: str, error_details: Optional[str] = None):
+    """
+    Send an admin alert email via Mailtrap.
+
+    Args:
+        subject: The subject line of the alert email
+        message: The main message/description of the issue
+        error_details: Optional detailed error information (traceback, etc.)
+    """
+    get_shared_email_service().send_admin_alert(subject, message, error_details)
+
+
+@celery_app.task(name="src.celery.email_tasks.send_credentials_confirmation_email")
+def send_credentials_confirmation_email(email: str, first_name: Optional[str] = None):
+    """
+    Send the credentials-saved confirmation email to a user.
+    Uses its own database session to create the deletion link included in the email.
+
+    Args:
+        email: The recipient's email address
+        first_name: Optional first name for personalization
+    """
+    db = SessionLocal()
+    try:
+        email_sent = get_shared_email_service().send_credentials_confirmation(
+            email=email,
+            first_name=first_name,
+            db_session=db
+        )
+        if email_sent:
+            logger.info("Credentials confirmation email sent to %s", email)
+        else:
+            logger.warning("Failed to send credentials confirmation email to %s", email)
+    finally:
+        db.close()
@@ -1,5 +1,6 @@
 from datetime import datetime, timezone
 import logging
+from sqlalchemy import select
 from playwright.sync_api import sync_playwright
 from . import celery_app
 from src.db import SessionLocal  # SQLAlchemy session
@@ -14,7 +15,7 @@ logger = logging.getLogger(__name__)
 
 # Try to import EmailService for admin alerts
 try:
-    from src.mail.email_service import EmailService
+    from src.mail.email_service import get_shared_email_service
     EMAIL_SERVICE_AVAILABLE = True
 except ImportError:
     EMAIL_SERVICE_AVAILABLE = False
@@ -72,14 +73,14 @@ def signoff_user_timecard(user_id: int):
     timecard_run = None
     user = None
     try:
-        user = db.query(User).filter(User.id == user_id).first()
+        user = db.get(User, user_id)
         if not user:
-            logger.warning(f"User with id {user_id} not found")
+            logger.warning("User with id %s not found", user_id)
             return
 
         # Skip if flagged for password update
         if user.needs_password:
-            logger.info(f"Skipping user {user.email} - needs password update")
+            logger.info("Skipping user %s - needs password update", user.email)
             return
 
         # Optionally: Guard against double-runs (check last_signoff_date)
@@ -87,17 +88,15 @@ def signoff_user_timecard(user_id: int):
         #     return
 
         # 1. Get credential record (needed for TimecardRun)
-        credential = (
-            db.query(Credential)
-            .filter(
+        credential = db.execute(
+            select(Credential).where(
                 Credential.user_db_id == user.id,
                 Credential.site == "timecard_portal"
-            )
-            .first()
-        )
+            ).limit(1)
+        ).scalars().first()
         
         if not credential:
-            logger.error(f"No credentials found for user {user.email}")
+            logger.error("No credentials found for user %s", user.email)
             # Set last_timecard_check_at even when credentials are missing
             user.last_timecard_check_at = datetime.now(timezone.utc)
             user.last_timecard_check_status = TimecardRunStatus.LOGIN_FAILED_BAD_CREDENTIALS
@@ -106,7 +105,7 @@ def signoff_user_timecard(user_id: int):
             # Send admin alert about missing credentials
             if EMAIL_SERVICE_AVAILABLE:
                 try:
-                    email_service = EmailService()
+                    email_service = get_shared_email_service()
                     email_service.send_admin_alert(
                         "User Missing Credentials",
                         f"User {user.email} (ID: {user.id}) was queued for signoff but has no credentials stored. "
@@ -114,7 +113,7 @@ def signoff_user_timecard(user_id: int):
                         f"User ID: {user.id}\nUser Email: {user.email}\nUser Name: {user.first_name} {user.last_name}"
                     )
                 except Exception as alert_error:
-                    logger.error(f"Failed to send admin alert for missing credentials: {alert_error}")
+                    logger.error("Failed to send admin alert for missing credentials: %s", alert_error)
             
             return
 
@@ -137,7 +136,7 @@ def signoff_user_timecard(user_id: int):
         )
         db.add(timecard_run)
         db.commit()  # Commit early to get the ID
-        logger.info(f"Created TimecardRun record {timecard_run.id} for user {user.email}")
+        logger.info("Created TimecardRun record %s for user %s", timecard_run.id, user.email)
 
         # 4. Decrypt credentials using KMS
         # Check for race condition: credentials may have been updated after TimecardRun was created
@@ -148,10 +147,11 @@ def signoff_user_timecard(user_id: int):
             
             if current_dek_version != stored_dek_version:
                 logger.warning(
-                    f"Credential version changed during signoff run for user {user.email}. "
-                    f"TimecardRun was created with dek_version={stored_dek_version}, "
-                    f"but current version is {current_dek_version}. "
-                    f"Using current credentials (credentials were updated mid-run)."
+                    "Credential version changed during signoff run for user %s. "
+                    "TimecardRun was created with dek_version=%s, "
+                    "but current version is %s. "
+                    "Using current credentials (credentials were updated mid-run).",
+                    user.email, stored_dek_version, current_dek_version
                 )
                 # Update TimecardRun to reflect the version actually used
                 timecard_run.credential_dek_version = current_dek_version
@@ -159,7 +159,7 @@ def signoff_user_timecard(user_id: int):
             
             creds_dict = get_user_credentials_for_signoff(db, user_id=user_id)
         except ValueError as e:
-            logger.error(f"Failed to get credentials for user {user.email}: {e}")
+            logger.error("Failed to get credentials for user %s: %s", user.email, e)
             # Ensure last_timecard_check_at is set even on early failure
             if user.last_timecard_check_at is None:
                 user.last_timecard_check_at = datetime.now(timezone.utc)
@@ -169,7 +169,7 @@ def signoff_user_timecard(user_id: int):
             db.commit()
             return
         except Exception as e:
-            logger.error(f"Error decrypting credentials for user {user.email}: {e}")
+            logger.error("Error decrypting credentials for user %s: %s", user.email, e)
             # Ensure last_timecard_check_at is set even on early failure
             if user.last_timecard_check_at is None:
                 user.last_timecard_check_at = datetime.now(timezone.utc)
@@ -239,24 +239,25 @@ def signoff_user_timecard(user_id: int):
                 # Note: last_timecard_check_at was already set at the start of the attempt
                 
                 db.commit()
-                logger.info(f"Signoff completed for user {user.email}: {result.message}")
-                
-                # 11. Send email notification with screenshot (if available)
-                if EMAIL_SERVICE_AVAILABLE and result.success:
-                    try:
-                        email_service = EmailService()
-                        email_service.send_signoff_result(result, db)
-                        logger.info(f"Email notification sent to {user.email}")
-                    except Exception as email_error:
-                        logger.error(f"Failed to send email notification to {user.email}: {email_error}")
-                        # Don't fail the task if email fails
+                logger.info("Signoff completed for user %s: %s", user.email, result.message)
                 
             finally:
                 browser.close()
 
+        # 11. Send email notification with screenshot (if available)
+        # Sent after the browser and Playwright driver are shut down so they aren't held open for the Resend round trip
+        if EMAIL_SERVICE_AVAILABLE and result.success:
+            try:
+                email_service = get_shared_email_service()
+                email_service.send_signoff_result(result, db)
+                logger.info("Email notification sent to %s", user.email)
+            except Exception as email_error:
+                logger.error("Failed to send email notification to %s: %s", user.email, email_error)
+                # Don't fail the task if email fails
+
     except Exception as e:
         db.rollback()
-        logger.error(f"Error in signoff task for user_id {user_id}: {e}", exc_info=True)
+        logger.error("Error in signoff task for user_id %s: %s", user_id, e, exc_info=True)
         
         # Determine error type based on exception class and message
         error_msg = str(e)
@@ -268,14 +269,14 @@ def signoff_user_timecard(user_id: int):
         try:
             if timecard_run is not None:
                 # Re-query timecard_run after rollback since it's detached from the session
-                timecard_run = db.query(TimecardRun).filter(TimecardRun.id == timecard_run.id).first()
+                timecard_run = db.get(TimecardRun, timecard_run.id)
                 if timecard_run:
                     timecard_run.completed_at = datetime.now(timezone.utc)
                     timecard_run.status = run_status
                     timecard_run.error_reason = f"Exception: {str(e)[:255]}"  # Truncate to fit String(255)
             if user is not None:
                 # Re-query user after rollback since it's detached from the session
-                user = db.query(User).filter(User.id == user_id).first()
+                user = db.get(User, user_id)
                 if user:
                     # Ensure last_timecard_check_at is set even on exception
                     if user.last_timecard_check_at is None:
@@ -284,7 +285,7 @@ def signoff_user_timecard(user_id: int):
                     user.failed_login_count += 1
             db.commit()
         except Exception as update_error:
-            logger.error(f"Failed to update records on error: {update_error}")
+            logger.error("Failed to update records on error: %s", update_error)
             db.rollback()
         raise
     finally:
@@ -308,13 +309,11 @@ def enqueue_all_signoffs_if_needed():
         # Only users who:
         # - do NOT need password update
         # - have credentials stored
-        users = (
-            db.query(User)
-            .filter(
+        users = db.execute(
+            select(User).where(
                 User.needs_password == False,
             )
-            .all()
-        )
+        ).scalars().all()
 
         # Filter users who have credentials
         eligible_users = []
@@ -324,13 +323,13 @@ def enqueue_all_signoffs_if_needed():
             if user.credentials:
                 eligible_users.append(user)
             else:
-                logger.warning(f"User {user.email} has no credentials stored")
+                logger.warning("User %s has no credentials stored", user.email)
                 users_without_credentials.append(user)
         
         # Send admin alert if there are users without credentials
         if users_without_credentials and EMAIL_SERVICE_AVAILABLE:
             try:
-                email_service = EmailService()
+                email_service = get_shared_email_service()
                 user_list = ", ".join([f"{u.email} (ID: {u.id})" for u in users_without_credentials])
                 email_service.send_admin_alert(
                     "Users Missing Credentials During Enqueue",
@@ -339,15 +338,15 @@ def enqueue_all_signoffs_if_needed():
                     f"Users without credentials:\n{user_list}\n\nTotal eligible users enqueued: {len(eligible_users)}"
                 )
             except Exception as alert_error:
-                logger.error(f"Failed to send admin alert for users without credentials: {alert_error}")
+                logger.error("Failed to send admin alert for users without credentials: %s", alert_error)
 
-        logger.info(f"Enqueuing signoff tasks for {len(eligible_users)} eligible users")
+        logger.info("Enqueuing signoff tasks for %s eligible users", len(eligible_users))
         for user in eligible_users:
             async_result = signoff_user_timecard.delay(user.id)
-            logger.info(f"Enqueued signoff_user_timecard for user={user.id} (email={user.email}) task_id={async_result.id}")
+            logger.info("Enqueued signoff_user_timecard for user=%s (email=%s) task_id=%s", user.id, user.email, async_result.id)
 
     except Exception as e:
-        logger.error(f"Error in enqueue_all_signoffs_if_needed: {e}", exc_info=True)
+        logger.error("Error in enqueue_all_signoffs_if_needed: %s", e, exc_info=True)
         raise
     finally:
         db.close()
@@ -2,6 +2,7 @@
 Base/shared configuration management for time card sign-off automation.
 """
 import os
+from functools import lru_cache
 import json
 from pathlib import Path
 from typing import List, Optional, Dict, Any
@@ -62,12 +63,12 @@ def load_users(config_path: Optional[str] = None) -> List[SignoffUser]:
                         employee_id=user_data.get('employee_id')
                     ))
             
-            logger.info(f"Loaded {len(users)} users from {config_file}")
+            logger.info("Loaded %s users from %s", len(users), config_file)
         except Exception as e:
-            logger.error(f"Error loading users from {config_file}: {e}")
+            logger.error("Error loading users from %s: %s", config_file, e)
             raise
     else:
-        logger.warning(f"Config file not found: {config_file}. Trying environment variables.")
+        logger.warning("Config file not found: %s. Trying environment variables.", config_file)
         
         # Fallback to environment variables (single user)
         username = os.getenv("APIHC_USERNAME")
@@ -95,12 +96,14 @@ def load_users(config_path: Optional[str] = None) -> List[SignoffUser]:
     return users
 
 
+@lru_cache(maxsize=1)
 def get_app_config() -> Dict[str, Any]:
     """
     Get application configuration settings.
     
     Returns:
-        Dictionary with application configuration
+        Dictionary with application configuration (read from the environment once and
+        shared by all callers - treat as read-only)
     """
     return {
         "base_url": os.getenv("APIHC_BASE_URL", "https://llca419.apihealthcare.com"),
@@ -108,6 +111,10 @@ def get_app_config() -> Dict[str, Any]:
         "default_timeout": int(os.getenv("APIHC_TIMEOUT", "30000")),
         "headless": os.getenv("APIHC_HEADLESS", "false").lower() == "true",
         "slow_mo": int(os.getenv("APIHC_SLOW_MO", "0")),
+        "browser_pool_size": int(os.getenv("APIHC_BROWSER_POOL_SIZE", "2")),
+        "max_concurrent_logins": int(
+            os.getenv("APIHC_MAX_CONCURRENT_LOGINS", os.getenv("APIHC_BROWSER_POOL_SIZE", "2"))
+        ),
     }
 
 
@@ -135,12 +142,12 @@ def validate_config() -> bool:
         app_config = get_app_config()
         
         logger.info("Configuration validated successfully")
-        logger.info(f"Base URL: {app_config['base_url']}")
-        logger.info(f"Email from: {email_config['from_email']}")
-        logger.info(f"Number of users: {len(users)}")
+        logger.info("Base URL: %s", app_config["base_url"])
+        logger.info("Email from: %s", email_config["from_email"])
+        logger.info("Number of users: %s", len(users))
         
         return True
     except Exception as e:
-        logger.error(f"Configuration validation failed: {e}")
+        logger.error("Configuration validation failed: %s", e)
         raise
 
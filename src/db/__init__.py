@@ -2,7 +2,15 @@
 Database module for PostgreSQL with SQLAlchemy.
 """
 from .models import Base
-from .database import init_db, get_engine, get_session_local
+from .database import (
+    init_db,
+    get_engine,
+    get_session_local,
+    init_async_db,
+    get_async_engine,
+    get_async_session_local,
+    get_async_db,
+)
 from .config import get_db_config
 
 # For backward compatibility, expose these as properties
@@ -19,6 +27,10 @@ __all__ = [
     "init_db",
     "get_engine",
     "get_session_local",
+    "init_async_db",
+    "get_async_engine",
+    "get_async_session_local",
+    "get_async_db",
     "get_db_config",
     "engine",  # Available via __getattr__
     "SessionLocal",  # Available via __getattr__
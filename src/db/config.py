@@ -2,9 +2,11 @@
 Database configuration for PostgreSQL with SQLAlchemy.
 """
 import os
-from typing import Dict, Any
+from typing import Dict, Any, Tuple
 import logging
 
+from sqlalchemy.engine import make_url
+
 # Try to load python-dotenv if available
 try:
     from dotenv import load_dotenv
@@ -45,11 +47,64 @@ def get_db_config() -> Dict[str, Any]:
                 "set DB_USER, DB_PASSWORD, and DB_NAME environment variables."
             )
     
+    async_database_url, async_connect_args = get_async_database_settings(database_url)
+    
     return {
         "database_url": database_url,
+        "async_database_url": async_database_url,
+        "async_connect_args": async_connect_args,  # libpq URL parameters translated for asyncpg
         "echo": os.getenv("DB_ECHO", "false").lower() == "true",  # SQLAlchemy echo mode
         "pool_size": int(os.getenv("DB_POOL_SIZE", "5")),
         "max_overflow": int(os.getenv("DB_MAX_OVERFLOW", "10")),
         "pool_pre_ping": os.getenv("DB_POOL_PRE_PING", "true").lower() == "true",
+        "pool_use_lifo": os.getenv("DB_POOL_USE_LIFO", "true").lower() == "true",  # Reuse most recent connection so idle ones age out
+        "pool_recycle": int(os.getenv("DB_POOL_RECYCLE", "1800")),  # Seconds before a connection is replaced
+        "query_cache_size": int(os.getenv("DB_QUERY_CACHE_SIZE", "500")),  # Compiled statement cache entries
+        "statement_cache_size": int(os.getenv("DB_STATEMENT_CACHE_SIZE", "500")),  # asyncpg prepared statements per connection
     }
 
+
+
+# libpq URL parameters asyncpg.connect() accepts under the same name
+_ASYNCPG_PASSTHROUGH_PARAMS = {"target_session_attrs", "krbsrvname", "gsslib", "passfile"}
+
+
+def get_async_database_settings(database_url: str) -> Tuple[str, Dict[str, Any]]:
+    """
+    Convert a PostgreSQL URL to its asyncpg form for the async engine.
+    
+    asyncpg takes URL query parameters as connect() keyword arguments, so libpq
+    ones are translated (sslmode -> ssl, application_name -> server_settings)
+    and any it doesn't accept are dropped instead of failing every connect.
+    
+    Args:
+        database_url: A postgres://, postgresql:// or postgresql+<driver>:// URL
+    
+    Returns:
+        Tuple of (URL using the postgresql+asyncpg driver with no query string,
+        connect_args for create_async_engine)
+    """
+    url = make_url(database_url)
+    if not (url.drivername == "postgres" or url.drivername.startswith("postgresql")):
+        return database_url, {}
+    
+    connect_args: Dict[str, Any] = {}
+    dropped = []
+    for key, value in url.query.items():
+        # Repeated parameters come back as a tuple; the last one wins, as in libpq
+        if isinstance(value, tuple):
+            value = value[-1]
+        if key in ("sslmode", "ssl"):
+            # asyncpg's ssl= accepts the libpq sslmode names (disable ... verify-full)
+            connect_args["ssl"] = value
+        elif key == "application_name":
+            connect_args["server_settings"] = {"application_name": value}
+        elif key in _ASYNCPG_PASSTHROUGH_PARAMS:
+            connect_args[key] = value
+        else:
+            dropped.append(key)
+    if dropped:
+        logger.warning("Ignoring database URL parameters not supported by asyncpg: %s", ", ".join(sorted(dropped)))
+    
+    async_url = url.set(drivername="postgresql+asyncpg", query={})
+    return async_url.render_as_string(hide_password=False), connect_args
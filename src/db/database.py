@@ -2,9 +2,10 @@
 Database connection and session management using SQLAlchemy.
 """
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
-from typing import Optional
+from typing import AsyncIterator, Optional
 import logging
 
 logger = logging.getLogger(__name__)
@@ -13,6 +14,9 @@ logger = logging.getLogger(__name__)
 # Lazy initialization - these will be set when init_db() is called
 _engine: Optional[create_engine] = None
 _SessionLocal: Optional[sessionmaker] = None
+# Async engine/session factory for the API (set when init_async_db() is called)
+_async_engine: Optional[AsyncEngine] = None
+_AsyncSessionLocal: Optional[async_sessionmaker] = None
 
 
 def init_db():
@@ -37,6 +41,9 @@ def init_db():
         pool_size=db_config["pool_size"],
         max_overflow=db_config["max_overflow"],
         pool_pre_ping=db_config["pool_pre_ping"],
+        pool_use_lifo=db_config["pool_use_lifo"],
+        pool_recycle=db_config["pool_recycle"],
+        query_cache_size=db_config["query_cache_size"],
     )
     
     # Create session factory
@@ -44,6 +51,47 @@ def init_db():
     logger.info("Database initialized successfully")
 
 
+def init_async_db():
+    """
+    Initialize the asyncpg-backed engine used by the API so queries don't block the event loop.
+    The Celery worker and other sync callers keep using init_db().
+    
+    Raises:
+        ValueError: If database configuration is missing
+    """
+    global _async_engine, _AsyncSessionLocal
+    
+    if _async_engine is not None:
+        return  # Already initialized
+    
+    from .config import get_db_config
+    db_config = get_db_config()
+    
+    _async_engine = create_async_engine(
+        db_config["async_database_url"],
+        echo=db_config["echo"],
+        pool_size=db_config["pool_size"],
+        max_overflow=db_config["max_overflow"],
+        pool_pre_ping=db_config["pool_pre_ping"],
+        pool_use_lifo=db_config["pool_use_lifo"],
+        pool_recycle=db_config["pool_recycle"],
+        query_cache_size=db_config["query_cache_size"],
+        # Repeat lookups (token, email, credential) reuse server-side prepared statements
+        connect_args={
+            "prepared_statement_cache_size": db_config["statement_cache_size"],
+            "statement_cache_size": db_config["statement_cache_size"],
+            **db_config["async_connect_args"],
+        },
+    )
+    
+    # expire_on_commit=False matters more here: an expired attribute would need
+    # an implicit lazy load, which AsyncSession cannot do
+    _AsyncSessionLocal = async_sessionmaker(
+        _async_engine, class_=AsyncSession, autoflush=False, expire_on_commit=False
+    )
+    logger.info("Async database initialized successfully")
+
+
 def get_engine():
     """Get the database engine, initializing if necessary."""
     if _engine is None:
@@ -58,6 +106,29 @@ def get_session_local():
     return _SessionLocal
 
 
+def get_async_engine() -> AsyncEngine:
+    """Get the async database engine, initializing if necessary."""
+    if _async_engine is None:
+        init_async_db()
+    return _async_engine
+
+
+def get_async_session_local() -> async_sessionmaker:
+    """Get the async session factory, initializing if necessary."""
+    if _AsyncSessionLocal is None:
+        init_async_db()
+    return _AsyncSessionLocal
+
+
+async def dispose_async_db():
+    """Close all pooled async connections (call on API shutdown)."""
+    global _async_engine, _AsyncSessionLocal
+    if _async_engine is not None:
+        await _async_engine.dispose()
+    _async_engine = None
+    _AsyncSessionLocal = None
+
+
 # For direct access (will initialize on first use)
 def __getattr__(name):
     if name == "engine":
@@ -81,3 +152,15 @@ def get_db():
     finally:
         db.close()
 
+
+
+async def get_async_db() -> AsyncIterator[AsyncSession]:
+    """
+    Dependency function for FastAPI to get an async database session.
+    
+    Yields:
+        Async database session
+    """
+    AsyncSessionLocal = get_async_session_local()
+    async with AsyncSessionLocal() as db:
+        yield db
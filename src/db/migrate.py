@@ -0,0 +1,98 @@
+"""
+Schema migrations, run once per deploy instead of on every web worker boot.
+
+Run with ``python run.py migrate``, configured as the pre-deploy command in
+railway.toml so it runs once before new replicas start.
+"""
+import logging
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+
+from .database import get_engine
+from .models import Base
+
+logger = logging.getLogger(__name__)
+
+
+def _constraint_exists(connection: Connection, name: str) -> bool:
+    """Check whether a named constraint already exists."""
+    return connection.execute(
+        text("SELECT 1 FROM pg_constraint WHERE conname = :name"),
+        {"name": name},
+    ).first() is not None
+
+
+def _add_email_lowercase_check(connection: Connection):
+    """
+    Add ck_users_email_lowercase to an existing users table.
+
+    Mixed-case emails are lowercased first where that can't collide with another row;
+    if any are left, the constraint stays NOT VALID (enforced for new writes only).
+    """
+    if _constraint_exists(connection, "ck_users_email_lowercase"):
+        return
+
+    connection.execute(text(
+        "UPDATE users SET email = lower(email) "
+        "WHERE email <> lower(email) AND lower(email) IN "
+        "(SELECT lower(email) FROM users GROUP BY lower(email) HAVING count(*) = 1)"
+    ))
+    connection.execute(text(
+        "ALTER TABLE users ADD CONSTRAINT ck_users_email_lowercase "
+        "CHECK (email = lower(email)) NOT VALID"
+    ))
+
+    remaining = connection.execute(
+        text("SELECT count(*) FROM users WHERE email <> lower(email)")
+    ).scalar_one()
+    if remaining:
+        logger.warning(
+            "%s user(s) have mixed-case emails that collide with another account; "
+            "ck_users_email_lowercase left NOT VALID until they are merged",
+            remaining,
+        )
+    else:
+        connection.execute(text("ALTER TABLE users VALIDATE CONSTRAINT ck_users_email_lowercase"))
+    logger.info("Added constraint ck_users_email_lowercase")
+
+
+def _add_credential_site_unique(connection: Connection):
+    """Add uq_credentials_user_site to an existing credentials table, unless duplicates exist."""
+    if _constraint_exists(connection, "uq_credentials_user_site"):
+        return
+
+    duplicates = connection.execute(text(
+        "SELECT count(*) FROM (SELECT 1 FROM credentials "
+        "GROUP BY user_db_id, site HAVING count(*) > 1) AS dup"
+    )).scalar_one()
+    if duplicates:
+        # Credentials are referenced by timecard_runs, so don't delete rows automatically
+        logger.error(
+            "%s (user, site) pair(s) have duplicate credentials; "
+            "uq_credentials_user_site not added until they are removed",
+            duplicates,
+        )
+        return
+
+    connection.execute(text(
+        "ALTER TABLE credentials ADD CONSTRAINT uq_credentials_user_site UNIQUE (user_db_id, site)"
+    ))
+    logger.info("Added constraint uq_credentials_user_site")
+
+
+def run_migrations():
+    """
+    Create missing tables, then add constraints that create_all() skips on existing tables.
+
+    Safe to run repeatedly; every step checks the current schema first.
+    """
+    engine = get_engine()
+    Base.metadata.create_all(bind=engine)
+
+    with engine.begin() as connection:
+        _add_email_lowercase_check(connection)
+        _add_credential_site_unique(connection)
+
+    engine.dispose()
+    logger.info("Database migrations complete")
@@ -17,6 +17,8 @@ from sqlalchemy import (
     Text,
     Enum,
     Boolean,
+    UniqueConstraint,
+    CheckConstraint,
 )
 
 from sqlalchemy.dialects.postgresql import UUID
@@ -75,6 +77,11 @@ class MagicLink(Base):
 class User(Base):
     """App user (your own auth / profile). No external credential stuff here."""
     __tablename__ = "users"
+    __table_args__ = (
+        # Emails are stored lowercased so lookups can use the unique index directly
+        # (added to existing databases by src/db/migrate.py)
+        CheckConstraint("email = lower(email)", name="ck_users_email_lowercase"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     user_id: Mapped[str] = mapped_column(
@@ -133,6 +140,11 @@ class User(Base):
 class Credential(Base):
     """Encrypted external login (timecard credentials) for a user."""
     __tablename__ = "credentials"
+    __table_args__ = (
+        # One credential per user per site; also backs the (user, site) lookup
+        # (added to existing databases by src/db/migrate.py)
+        UniqueConstraint("user_db_id", "site", name="uq_credentials_user_site"),
+    )
 
     # Credential record id
     id: Mapped[str] = mapped_column(
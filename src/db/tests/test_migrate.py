@@ -0,0 +1,133 @@
+"""
+Tests for the once-per-deploy schema migration step.
+
+These run against a recording stand-in for the SQLAlchemy connection, so they
+check which statements are issued for each schema state without a database.
+
+Run from the project root:
+
+```
+python -m pytest src/db/tests/test_migrate.py
+```
+"""
+import runpy
+import sys
+from contextlib import contextmanager
+from pathlib import Path
+
+import pytest
+
+from src.db import migrate
+
+RUN_PY = Path(__file__).parent.parent.parent.parent / "run.py"
+
+
+class _Result:
+    def __init__(self, value):
+        self.value = value
+
+    def first(self):
+        return (1,) if self.value else None
+
+    def scalar_one(self):
+        return self.value
+
+
+class _Connection:
+    """Records executed SQL and answers the migration's schema checks."""
+
+    def __init__(self, existing_constraints=(), mixed_case_emails=0, duplicate_credentials=0):
+        self.existing_constraints = set(existing_constraints)
+        self.mixed_case_emails = mixed_case_emails
+        self.duplicate_credentials = duplicate_credentials
+        self.statements = []
+
+    def execute(self, statement, params=None):
+        sql = str(statement)
+        self.statements.append(sql)
+        if sql.startswith("SELECT 1 FROM pg_constraint"):
+            return _Result(params["name"] in self.existing_constraints)
+        if sql.startswith("SELECT count(*) FROM users"):
+            return _Result(self.mixed_case_emails)
+        if sql.startswith("SELECT count(*) FROM (SELECT 1 FROM credentials"):
+            return _Result(self.duplicate_credentials)
+        return _Result(None)
+
+    def ran(self, prefix: str) -> bool:
+        return any(sql.startswith(prefix) for sql in self.statements)
+
+
+def test_existing_constraints_are_left_alone():
+    connection = _Connection(existing_constraints={"ck_users_email_lowercase", "uq_credentials_user_site"})
+    migrate._add_email_lowercase_check(connection)
+    migrate._add_credential_site_unique(connection)
+    assert not connection.ran("ALTER TABLE")
+    assert not connection.ran("UPDATE")
+
+
+def test_email_check_is_added_and_validated():
+    connection = _Connection()
+    migrate._add_email_lowercase_check(connection)
+    assert connection.ran("UPDATE users SET email = lower(email)")
+    assert connection.ran("ALTER TABLE users ADD CONSTRAINT ck_users_email_lowercase")
+    assert connection.ran("ALTER TABLE users VALIDATE CONSTRAINT ck_users_email_lowercase")
+
+
+def test_email_check_stays_not_valid_while_collisions_remain():
+    connection = _Connection(mixed_case_emails=2)
+    migrate._add_email_lowercase_check(connection)
+    assert connection.ran("ALTER TABLE users ADD CONSTRAINT ck_users_email_lowercase")
+    assert not connection.ran("ALTER TABLE users VALIDATE CONSTRAINT")
+
+
+def test_unique_credential_constraint_is_added():
+    connection = _Connection()
+    migrate._add_credential_site_unique(connection)
+    assert connection.ran("ALTER TABLE credentials ADD CONSTRAINT uq_credentials_user_site")
+
+
+def test_unique_credential_constraint_skipped_while_duplicates_exist():
+    connection = _Connection(duplicate_credentials=1)
+    migrate._add_credential_site_unique(connection)
+    assert not connection.ran("ALTER TABLE credentials")
+    assert not connection.ran("DELETE")
+
+
+class _Engine:
+    def __init__(self, connection):
+        self.connection = connection
+        self.disposed = False
+
+    @contextmanager
+    def begin(self):
+        yield self.connection
+
+    def dispose(self):
+        self.disposed = True
+
+
+def test_run_migrations_creates_tables_then_adds_constraints(monkeypatch):
+    connection = _Connection()
+    engine = _Engine(connection)
+    created = []
+    monkeypatch.setattr(migrate, "get_engine", lambda: engine)
+    monkeypatch.setattr(migrate.Base.metadata, "create_all", lambda bind: created.append(bind))
+
+    migrate.run_migrations()
+
+    assert created == [engine]
+    assert connection.ran("ALTER TABLE users ADD CONSTRAINT ck_users_email_lowercase")
+    assert connection.ran("ALTER TABLE credentials ADD CONSTRAINT uq_credentials_user_site")
+    assert engine.disposed
+
+
+def test_run_py_migrate_only_migrates(monkeypatch):
+    calls = []
+    monkeypatch.setattr(migrate, "run_migrations", lambda: calls.append("migrate"))
+    monkeypatch.setattr(sys, "argv", ["run.py", "migrate"])
+
+    with pytest.raises(SystemExit) as exc_info:
+        runpy.run_path(str(RUN_PY), run_name="__main__")
+
+    assert exc_info.value.code == 0
+    assert calls == ["migrate"]
@@ -2,6 +2,7 @@
 FastAPI endpoints configuration.
 """
 import os
+from functools import lru_cache
 from typing import Dict, Any
 import logging
 
@@ -15,12 +16,14 @@ except ImportError:
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=1)
 def get_api_config() -> Dict[str, Any]:
     """
     Get API configuration settings.
     
     Returns:
-        Dictionary with API configuration
+        Dictionary with API configuration (read from the environment once and
+        shared by all callers - treat as read-only)
     """
     return {
         "title": os.getenv("API_TITLE", "Time Card Sign-Off API"),
@@ -29,5 +32,6 @@ def get_api_config() -> Dict[str, Any]:
         "host": os.getenv("API_HOST", "0.0.0.0"),
         "port": int(os.getenv("API_PORT", "8000")),
         "reload": os.getenv("API_RELOAD", "false").lower() == "true",
+        "threadpool_size": int(os.getenv("API_THREADPOOL_SIZE", "64")),  # anyio worker threads for sync calls
     }
 
@@ -1,74 +1,103 @@
 """
 FastAPI application main file.
 """
-from fastapi import FastAPI, Request, HTTPException, Depends, status, Query
-from fastapi.responses import JSONResponse, RedirectResponse, HTMLResponse
+from fastapi import FastAPI, Request, HTTPException, Depends, status, Query, Form, BackgroundTasks
+from fastapi.responses import RedirectResponse, HTMLResponse, Response, ORJSONResponse
 from starlette.templating import Jinja2Templates
+from jinja2 import Environment, FileSystemLoader, FileSystemBytecodeCache
 from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel, EmailStr, Field
-from sqlalchemy.orm import Session
-from typing import Optional
+from sqlalchemy import select, update, delete, text, literal_column
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session, selectinload
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Optional, Union, TYPE_CHECKING
 from contextlib import asynccontextmanager
 import os
+import re
+import anyio
+import asyncio
+import hmac
+import json
 import logging
 import secrets
 import traceback
+from uuid import uuid4
 from datetime import datetime, timedelta, timezone
 import hashlib
-from playwright.sync_api import sync_playwright
-from slowapi import Limiter, _rate_limit_exceeded_handler
-from slowapi.util import get_remote_address
-from slowapi.errors import RateLimitExceeded
 from .config import get_api_config
+from .rate_limit import SlidingWindowRateLimiter, rate_limit, get_remote_address
 from src.config import get_app_config
-from src.db.database import init_db, get_db, get_engine
-from src.db.models import MagicLink, MagicLinkType, User, Credential, Base
-from src.kms.service import KMSEncryptService
-from src.kms.utils import obfuscate_credential
-from src.play.pages.login_page import LoginPage
-from src.play.pages.dashboard_page import DashboardPage
+from src.db.database import init_async_db, get_async_db, get_async_engine, dispose_async_db, get_session_local
+from src.db.models import MagicLink, MagicLinkType, User, Credential
+from src.kms.service import KMSEncryptService, get_kms_encrypt_service, clear_dek_pool
+from src.kms.utils import secure_wipe
+from src.play.browser_pool import BrowserPool, LoginSessionCache
 from src.auth.cookies import (
     create_credentials_cookie, 
     verify_credentials_cookie,
     COOKIE_NAME,
     COOKIE_EXPIRATION_MINUTES
 )
-from src.mail.email_service import EmailService
+from src.mail.email_service import EmailService, RESEND_AVAILABLE, get_shared_email_service
+
+# Try to import the Celery email tasks (needs REDIS_URL); without them emails are
+# sent from in-process background tasks instead
+try:
+    from celery import group
+    from src.celery.email_tasks import send_admin_alert_email, send_credentials_confirmation_email
+    CELERY_EMAIL_AVAILABLE = True
+except Exception:
+    CELERY_EMAIL_AVAILABLE = False
+
+if TYPE_CHECKING:
+    from playwright.async_api import Browser, BrowserContext
 
 logger = logging.getLogger(__name__)
 
-# Get API configuration
+# Get API and application configuration (env does not change at runtime)
 api_config = get_api_config()
+app_config = get_app_config()
+
+IS_PRODUCTION = os.getenv("ENVIRONMENT", "development") == "production"
+
+# Base URL for magic links (backend URL for API endpoint)
+BACKEND_URL = os.getenv("BACKEND_URL", os.getenv("API_URL", "http://localhost:8000"))
 
 # Initialize Jinja2 templates
-templates = Jinja2Templates(directory=os.path.join(os.path.dirname(__file__), "templates"))
+# Bytecode cache turns first render per worker into a load instead of a parse; in
+# production, templates are not stat()ed for changes on every render.
+# autoescape=True matches what Jinja2Templates(directory=...) sets up.
+templates = Jinja2Templates(env=Environment(
+    loader=FileSystemLoader(os.path.join(os.path.dirname(__file__), "templates")),
+    autoescape=True,
+    auto_reload=not IS_PRODUCTION,
+    bytecode_cache=FileSystemBytecodeCache(),
+))
+
+# Prebuilt Set-Cookie header for the credentials cookie (30 minute expiration).
+# Same attributes response.set_cookie() would emit; only the value varies.
+# Cookie values are itsdangerous URL-safe tokens, so no quoting is needed.
+_COOKIE_HEADER_TEMPLATE = (
+    f"{COOKIE_NAME}={{value}}; HttpOnly; Max-Age={COOKIE_EXPIRATION_MINUTES * 60}; Path=/; SameSite=lax"
+    + ("; Secure" if IS_PRODUCTION else "")
+)
+
+# Where each magic link type redirects after validation
+_MAGIC_LINK_REDIRECTS = {
+    MagicLinkType.CREDENTIALS: "/form",
+    MagicLinkType.DELETION: "/delete-account",
+}
+
 
 # Initialize rate limiter with separate Redis instance/database (isolated from Celery)
 # Use RATE_LIMIT_REDIS_URL if provided, otherwise fall back to in-memory
 # This prevents attackers from accessing Celery if they compromise rate limiting Redis
-rate_limit_redis_url = os.getenv("RATE_LIMIT_REDIS_URL")
-if rate_limit_redis_url:
-    try:
-        limiter = Limiter(
-            key_func=get_remote_address,
-            storage_uri=rate_limit_redis_url,
-            default_limits=["200/hour", "50/minute"]
-        )
-        logger.info("Rate limiter initialized with dedicated Redis backend (isolated from Celery)")
-    except Exception as e:
-        logger.warning(f"Failed to initialize Redis-backed rate limiter: {e}. Using in-memory fallback.")
-        limiter = Limiter(
-            key_func=get_remote_address,
-            default_limits=["200/hour", "50/minute"]
-        )
-        logger.warning("WARNING: Using in-memory rate limiting. This will NOT work correctly with multiple web instances!")
+rate_limiter = SlidingWindowRateLimiter(os.getenv("RATE_LIMIT_REDIS_URL"))
+if rate_limiter.uses_redis:
+    logger.info("Rate limiter initialized with dedicated Redis backend (isolated from Celery)")
 else:
-    # Fallback to in-memory storage if dedicated Redis not available
     # WARNING: This won't work correctly if Railway scales to multiple web instances
-    limiter = Limiter(
-        key_func=get_remote_address,
-        default_limits=["200/hour", "50/minute"]
-    )
     logger.warning(
         "Rate limiter initialized with in-memory storage. "
         "This will NOT work correctly with multiple web instances. "
@@ -76,73 +105,113 @@ else:
     )
 
 
-async def validate_timecard_login(username: str, password: str) -> tuple[bool, str]:
+# Timecard portal settings used by credential validation
+_PORTAL_BASE_URL = app_config.get("base_url")
+_PORTAL_DOMAIN = app_config.get("default_domain", "MC Network")
+_PORTAL_TIMEOUT = app_config.get("default_timeout", 30000)
+
+# Portal sessions from recent successful validations (5 minute TTL)
+login_sessions = LoginSessionCache(ttl_seconds=300)
+
+# Caps simultaneous portal logins; defaults to the browser pool size so the
+# one-off launch fallback can't start more Chromium processes than the pool holds
+_login_semaphore = asyncio.Semaphore(app_config["max_concurrent_logins"])
+
+
+async def validate_timecard_login(
+    username: str,
+    password: str,
+    browser_pool: Optional[BrowserPool] = None
+) -> tuple[bool, str]:
     """
     Attempt a real login against the timecard portal to validate credentials.
     
+    Uses a pre-warmed context from the browser pool when available, otherwise
+    launches a one-off browser. If the same credentials validated within the
+    last few minutes, their saved portal session is tried first.
+    
     Returns:
         Tuple of (is_valid, error_message). error_message is empty on success.
     """
-    app_config = get_app_config()
-    base_url = app_config.get("base_url")
-    domain = app_config.get("default_domain", "MC Network")
-    headless = app_config.get("headless", True)
-    slow_mo = app_config.get("slow_mo", 0)
-    timeout = app_config.get("default_timeout", 30000)
-
-    def _attempt_login() -> tuple[bool, str]:
-        context = None
-        browser = None
-        # Store credentials in local variables for immediate clearing
-        local_username = username
-        local_password = password
+    # Lazy imports: Playwright is only loaded by workers that validate credentials
+    # (or at startup, when the browser pool is launched)
+    from playwright.async_api import async_playwright
+    from src.play.pages.async_login_page import AsyncLoginPage
+    from src.play.pages.async_dashboard_page import AsyncDashboardPage
+
+    base_url = _PORTAL_BASE_URL
+    domain = _PORTAL_DOMAIN
+    timeout = _PORTAL_TIMEOUT
+    session_key = login_sessions.key(username, password)
+    cached_session = login_sessions.get(session_key)
+
+    async def _resume_session(browser: "Browser") -> bool:
+        storage_state, dashboard_url = cached_session
+        context = await browser.new_context(storage_state=storage_state)
         try:
-            with sync_playwright() as p:
-                browser = p.chromium.launch(headless=headless, slow_mo=slow_mo)
-                context = browser.new_context()
-                page = context.new_page()
-                page.set_default_timeout(timeout)
-
-                login_page = LoginPage(page)
-                login_page.goto(base_url)
-                login_page.wait_for_page_load()
-                login_page.login(local_username, local_password, domain)
-
-                # Clear credentials immediately after login attempt
-                local_username = obfuscate_credential(local_username)
-                local_password = obfuscate_credential(local_password)
-
-                dashboard_page = DashboardPage(page)
-                dashboard_page.wait_for_dashboard_load()
-                return True, ""
+            page = await context.new_page()
+            page.set_default_timeout(timeout)
+            await page.goto(dashboard_url)
+            await AsyncDashboardPage(page).wait_for_dashboard_load(timeout=5000)
+            return True
         except Exception as e:
-            logger.warning(f"Credential validation failed during portal login: {e}")
-            # Clear credentials on error as well
-            try:
-                local_username = obfuscate_credential(local_username)
-                local_password = obfuscate_credential(local_password)
-            except Exception:
-                pass
-            return False, "Invalid username or password. Please double-check and try again."
+            logger.info("Cached portal session no longer valid, doing full login: %s", e)
+            login_sessions.discard(session_key)
+            return False
         finally:
-            # Final credential clearing (defense in depth)
-            try:
-                local_username = obfuscate_credential(local_username)
-                local_password = obfuscate_credential(local_password)
-            except Exception:
-                pass
-            try:
-                if context:
-                    context.close()
-                if browser:
-                    browser.close()
-            except Exception:
-                pass
+            await context.close()
+
+    async def _attempt_login(context: "BrowserContext") -> tuple[bool, str]:
+        try:
+            page = await context.new_page()
+            page.set_default_timeout(timeout)
+
+            login_page = AsyncLoginPage(page)
+            await login_page.goto(base_url)
+            await login_page.wait_for_page_load()
+            await login_page.login(username, password, domain)
+
+            dashboard_page = AsyncDashboardPage(page)
+            await dashboard_page.wait_for_dashboard_load()
+            login_sessions.put(session_key, await context.storage_state(), page.url)
+            return True, ""
+        except Exception as e:
+            logger.warning("Credential validation failed during portal login: %s", e)
+            return False, "Invalid username or password. Please double-check and try again."
 
     try:
-        return await run_in_threadpool(_attempt_login)
+        async with _login_semaphore:
+            if browser_pool is not None:
+                # The pool relaunches a crashed Chromium; if even that fails,
+                # fall through to a one-off browser for this request
+                context = None
+                try:
+                    pooled_browser = await browser_pool.get_browser()
+                    if cached_session and await _resume_session(pooled_browser):
+                        return True, ""
+                    context = await browser_pool.acquire()
+                except Exception as e:
+                    logger.error("Browser pool unavailable, launching a one-off browser: %s", e)
+                if context is not None:
+                    try:
+                        return await _attempt_login(context)
+                    finally:
+                        # Closing the context drops this user's portal session
+                        await browser_pool.release(context)
+
+            async with async_playwright() as p:
+                browser = await p.chromium.launch(
+                    headless=app_config["headless"], slow_mo=app_config["slow_mo"]
+                )
+                try:
+                    if cached_session and await _resume_session(browser):
+                        return True, ""
+                    context = await browser.new_context()
+                    return await _attempt_login(context)
+                finally:
+                    await browser.close()
     except Exception as e:
-        logger.error(f"Error validating credentials with timecard portal: {e}", exc_info=True)
+        logger.error("Error validating credentials with timecard portal: %s", e, exc_info=True)
         return False, "Unable to validate credentials right now. Please try again."
 
 
@@ -151,27 +220,84 @@ async def lifespan(app: FastAPI):
     """Lifespan event handler for startup and shutdown."""
     # Startup
     try:
-        init_db()
-        engine = get_engine()
-        Base.metadata.create_all(bind=engine)
-        logger.info("Database initialized and tables created")
+        init_async_db()
+        engine = get_async_engine()
+        # Schema changes run once per deploy via `python run.py migrate` (src/db/migrate.py),
+        # so workers only verify connectivity here
+        async with engine.connect() as connection:
+            await connection.execute(text("SELECT 1"))
+        logger.info("Database initialized and connectivity verified")
     except Exception as e:
-        logger.error(f"Failed to initialize database: {e}")
+        logger.error("Failed to initialize database: %s", e)
         raise
     
+    # Size the shared threadpool used for sync dependencies and run_in_threadpool calls
+    # (browser work runs on the event loop via async_playwright, so it never holds a slot)
+    anyio.to_thread.current_default_thread_limiter().total_tokens = api_config["threadpool_size"]
+    
+    # Load the rate limit script once; request-time checks are a single EVALSHA
+    try:
+        await rate_limiter.start()
+    except Exception as e:
+        logger.error("Failed to load rate limit script into Redis: %s", e)
+    
+    # Share one KMS encrypt service (and its boto3 client) across requests
+    try:
+        app.state.kms = get_kms_encrypt_service()
+    except Exception as e:
+        app.state.kms = None
+        logger.error("Failed to initialize KMS encrypt service: %s", e)
+    
+    # Prefill single-use data keys so submissions skip the KMS round trip
+    if app.state.kms is not None:
+        app.state.kms.start_dek_pool()
+    
+    # Share one email service (Resend/Mailtrap config and clients) across requests
+    app.state.email_service = None
+    if not RESEND_AVAILABLE:
+        logger.warning("Resend package not available. Email service disabled.")
+    else:
+        try:
+            app.state.email_service = get_shared_email_service()
+        except Exception as e:
+            logger.error("Failed to initialize email service: %s", e)
+    
+    # One long-lived Chromium per worker for credential validation
+    browser_pool = BrowserPool(
+        size=app_config["browser_pool_size"],
+        headless=app_config["headless"],
+        slow_mo=app_config["slow_mo"]
+    )
+    try:
+        await browser_pool.start()
+        app.state.browser_pool = browser_pool
+    except Exception as e:
+        app.state.browser_pool = None
+        logger.error("Failed to start browser pool, falling back to per-request browsers: %s", e)
+    
     yield
     
-    # Shutdown (if needed in the future)
-    pass
+    # Shutdown
+    clear_dek_pool()
+    await dispose_async_db()
+    await rate_limiter.close()
+    if app.state.email_service is not None:
+        app.state.email_service.close()
+    if app.state.browser_pool is not None:
+        try:
+            await app.state.browser_pool.close()
+        except Exception as e:
+            logger.warning("Error closing browser pool: %s", e)
 
 
 # Create FastAPI app with lifespan
-if os.getenv("ENVIRONMENT", "development") == "production":
+if IS_PRODUCTION:
     app = FastAPI(
         title=api_config["title"],
         description=api_config["description"],
         version=api_config["version"],
         lifespan=lifespan,
+        default_response_class=ORJSONResponse,
         docs_url=None, # Disable docs in production
         redoc_url=None, # Disable redoc in production
         openapi_url=None, # Disable openapi in production
@@ -182,27 +308,37 @@ else:
         description=api_config["description"],
         version=api_config["version"],
         lifespan=lifespan,
+        default_response_class=ORJSONResponse,
     )
 
 # Add rate limiter to app
-app.state.limiter = limiter
-app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
+app.state.rate_limiter = rate_limiter
 
 # Internal route protection
-def get_internal_secret() -> Optional[str]:
-    """Get the internal secret from environment variable."""
-    return os.getenv("INTERNAL_SECRET", "change-me-in-production")
+# Pre-serialized 403 body so rejected requests skip json.dumps
+_ACCESS_DENIED_BODY = b'{"detail":"Access denied. This endpoint is internal only."}'
+
+
+# Read once at import; requests compare against the cached bytes
+_INTERNAL_SECRET_BYTES = os.getenv("INTERNAL_SECRET", "change-me-in-production").encode()
 
 
-def get_internal_secret_header(request: Request) -> Optional[str]:
+def is_valid_internal_secret(secret: Optional[str]) -> bool:
+    """Constant-time check of a supplied X-Internal-Secret value."""
+    if secret is None:
+        return False
+    # Compare bytes: compare_digest rejects non-ASCII str input
+    return hmac.compare_digest(secret.encode(), _INTERNAL_SECRET_BYTES)
+
+
+async def get_internal_secret_header(request: Request) -> Optional[str]:
     """Dependency function to get the internal secret header from request."""
     return request.headers.get("X-Internal-Secret")
 
 
-def verify_internal_access(secret: Optional[str] = Depends(get_internal_secret_header)):
+async def verify_internal_access(secret: Optional[str] = Depends(get_internal_secret_header)):
     """Verify that the request has the internal secret header."""
-    expected_secret = get_internal_secret()
-    if secret != expected_secret:
+    if not is_valid_internal_secret(secret):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Access denied. This endpoint is internal only."
@@ -210,47 +346,261 @@ def verify_internal_access(secret: Optional[str] = Depends(get_internal_secret_h
     return True
 
 
-@app.middleware("http")
-async def protect_internal_routes(request: Request, call_next):
-    """Middleware to protect internal routes."""
-    path = request.url.path
-    
-    # Public routes that don't need protection
-    public_routes = [
-        "/api/validate-magic-link",
-        "/api/delete-account",
-        "/docs", 
-        "/openapi.json", 
-        "/redoc"
-    ]
-    
-    # Routes protected by cookie authentication (not public, but don't need internal secret)
-    cookie_protected_routes = [
-        "/api/credentials",
-        "/api/submit-credentials",
-        "/api/confirm-delete-account",
-        "/form",
-        "/delete-account"
-    ]
-    
-    # If it's not a public route or cookie-protected route, check for internal secret
-    is_public = any(path.startswith(route) for route in public_routes)
-    is_cookie_protected = any(path.startswith(route) for route in cookie_protected_routes)
-    
-    if not is_public and not is_cookie_protected:
-        secret = request.headers.get("X-Internal-Secret")
-        expected_secret = get_internal_secret()
-        
-        if secret != expected_secret:
-            return JSONResponse(
+# Public routes that don't need protection
+_PUBLIC_ROUTES = (
+    "/api/validate-magic-link",
+    "/api/delete-account",
+    "/docs",
+    "/openapi.json",
+    "/redoc",
+)
+
+# Routes protected by cookie authentication (not public, but don't need internal secret)
+_COOKIE_PROTECTED_ROUTES = (
+    "/api/credentials",
+    "/api/submit-credentials",
+    "/api/confirm-delete-account",
+    "/form",
+    "/delete-account",
+)
+
+# Matched with a single str.startswith(tuple) call per request
+_SECRET_EXEMPT_ROUTES = _PUBLIC_ROUTES + _COOKIE_PROTECTED_ROUTES
+
+
+class InternalRouteMiddleware:
+    """
+    Pure ASGI middleware protecting internal routes.
+    Exempt paths are passed straight through without wrapping the request,
+    avoiding the extra task and stream hops of @app.middleware("http").
+    """
+    
+    def __init__(self, app):
+        self.app = app
+    
+    async def __call__(self, scope, receive, send):
+        # If it's a public route or cookie-protected route, no internal secret is needed
+        if scope["type"] != "http" or scope["path"].startswith(_SECRET_EXEMPT_ROUTES):
+            await self.app(scope, receive, send)
+            return
+        
+        secret = None
+        for name, value in scope["headers"]:
+            if name == b"x-internal-secret":
+                secret = value
+                break
+        
+        if secret is None or not hmac.compare_digest(secret, _INTERNAL_SECRET_BYTES):
+            response = Response(
+                content=_ACCESS_DENIED_BODY,
                 status_code=status.HTTP_403_FORBIDDEN,
-                content={"detail": "Access denied. This endpoint is internal only."}
+                media_type="application/json"
             )
+            await response(scope, receive, send)
+            return
+        
+        await self.app(scope, receive, send)
+
+
+app.add_middleware(InternalRouteMiddleware)
+
+
+# Bound once so token hashing skips the module attribute lookup
+_sha256 = hashlib.sha256
+
+
+def hash_token(token: str) -> str:
+    """Hash a magic link token for storage and lookup (SHA-256 hex, 64 chars)."""
+    return _sha256(token.encode()).hexdigest()
+
+
+# Matches only our auth cookie in the raw Cookie header (avoids parsing every cookie)
+_COOKIE_PATTERN = re.compile(rf"(?:^|;)\s*{re.escape(COOKIE_NAME)}=([^;]*)")
+
+
+def get_email_service(request: Request) -> EmailService:
+    """
+    Get the shared EmailService, creating it on first use if startup init failed.
     
-    response = await call_next(request)
-    return response
+    Raises:
+        ImportError: If the Resend package is not installed
+        ValueError: If email configuration is missing
+    """
+    email_service = getattr(request.app.state, "email_service", None)
+    if email_service is None:
+        email_service = get_shared_email_service()
+        request.app.state.email_service = email_service
+    return email_service
+
+
+def format_error_details(error_details: Union[str, BaseException, None]) -> Optional[str]:
+    """
+    Render alert error details, formatting an exception's traceback only when needed.
+    
+    Args:
+        error_details: Preformatted details, an exception, or None
+    
+    Returns:
+        The details as text (traceback included for exceptions), or None
+    """
+    if isinstance(error_details, BaseException):
+        return "".join(traceback.format_exception(error_details))
+    return error_details
+
+
+def send_admin_alert_task(
+    email_service: EmailService,
+    subject: str,
+    message: str,
+    error_details: Union[str, BaseException, None] = None
+):
+    """
+    Background task: send an admin alert after the response has gone out.
+    An exception passed as error_details has its traceback formatted here, off the request path.
+    Failures are logged, never raised.
+    """
+    try:
+        email_service.send_admin_alert(subject, message, format_error_details(error_details))
+    except Exception as alert_error:
+        logger.error("Failed to send admin alert: %s", alert_error)
+
+
+def send_magic_link_task(email_service: EmailService, email: str, link: str):
+    """
+    Background task: send the magic link email after the response has gone out.
+    Opens its own sync session for the deletion link (the request's session is closed by then).
+    """
+    SessionLocal = get_session_local()
+    db = SessionLocal()
+    try:
+        email_service.send_magic_link(email, link, db)
+    except Exception as e:
+        logger.error("Failed to send magic link email to %s: %s", email, e, exc_info=True)
+        send_admin_alert_task(
+            email_service,
+            "Magic Link Email Send Failed",
+            f"Failed to send magic link email to {email}. Magic link was created successfully: {link}",
+            e
+        )
+    finally:
+        db.close()
+
+
+def send_credentials_confirmation_task(email_service: EmailService, email: str, first_name: Optional[str]):
+    """
+    Background task: send the credentials confirmation email after the response has gone out.
+    Opens its own sync session for the deletion link (the request's session is closed by then).
+    """
+    SessionLocal = get_session_local()
+    db = SessionLocal()
+    try:
+        if email_service.send_credentials_confirmation(email=email, first_name=first_name, db_session=db):
+            logger.info("Credentials confirmation email sent to %s", email)
+        else:
+            logger.warning("Failed to send credentials confirmation email to %s", email)
+    except Exception as e:
+        logger.error("Error sending credentials confirmation email to %s: %s", email, e)
+    finally:
+        db.close()
+
+
+async def queue_admin_alert(
+    request: Request,
+    background_tasks: BackgroundTasks,
+    subject: str,
+    message: str,
+    error_details: Union[str, BaseException, None] = None
+):
+    """
+    Queue an admin alert on Celery, falling back to a background task in this process.
+    The broker publish is blocking (connect timeouts, retries), so it runs in the threadpool.
+    Never raises.
+    """
+    try:
+        if CELERY_EMAIL_AVAILABLE:
+            try:
+                # Task arguments must be serializable, so exceptions are formatted at enqueue
+                await run_in_threadpool(
+                    send_admin_alert_email.delay, subject, message, format_error_details(error_details)
+                )
+                return
+            except Exception as e:
+                logger.warning("Failed to enqueue admin alert, sending in-process: %s", e)
+        background_tasks.add_task(
+            send_admin_alert_task, get_email_service(request), subject, message, error_details
+        )
+    except Exception as alert_error:
+        logger.error("Failed to send admin alert: %s", alert_error)
+
+
+async def queue_credentials_saved_emails(
+    request: Request,
+    background_tasks: BackgroundTasks,
+    alert_subject: str,
+    alert_message: str,
+    alert_details: Union[str, BaseException, None],
+    email: str,
+    first_name: Optional[str]
+):
+    """
+    Queue the admin alert and the user's confirmation email for a saved credential.
+    Both go to Celery as one group (one producer/connection for both publishes),
+    published from the threadpool since it is a blocking broker round trip,
+    falling back to background tasks in this process. Never raises.
+    """
+    try:
+        if CELERY_EMAIL_AVAILABLE:
+            try:
+                await run_in_threadpool(
+                    group(
+                        send_admin_alert_email.s(alert_subject, alert_message, format_error_details(alert_details)),
+                        send_credentials_confirmation_email.s(email, first_name)
+                    ).apply_async
+                )
+                return
+            except Exception as e:
+                logger.warning("Failed to enqueue credential emails, sending in-process: %s", e)
+        email_service = get_email_service(request)
+        background_tasks.add_task(
+            send_admin_alert_task, email_service, alert_subject, alert_message, alert_details
+        )
+        background_tasks.add_task(
+            send_credentials_confirmation_task, email_service, email, first_name
+        )
+    except Exception as email_error:
+        logger.error("Error queueing credential emails for %s: %s", email, email_error)
+
+
+async def get_kms(request: Request) -> Optional[KMSEncryptService]:
+    """Dependency function to get the shared KMS encrypt service (None if startup init failed)."""
+    return getattr(request.app.state, "kms", None)
 
 
+async def verify_credentials_cookie_dependency(request: Request) -> str:
+    """
+    Dependency function to verify credentials cookie and return email.
+    
+    Raises:
+        HTTPException: If cookie is missing, invalid, or expired
+    """
+    cookie_header = request.headers.get("cookie")
+    match = _COOKIE_PATTERN.search(cookie_header) if cookie_header else None
+    cookie_value = match.group(1).strip() if match else None
+    
+    if not cookie_value:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Authentication required. Please verify."
+        )
+    
+    try:
+        email = verify_credentials_cookie(cookie_value)
+        return email
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail=str(e)
+        )
 
 
 # Pydantic models for magic link and credentials
@@ -288,12 +638,16 @@ class CredentialsResponse(BaseModel):
 # Internal endpoint to generate magic link
 # TODO: Will make this Railway Console CLI script in the future to create a magic link for a user.
 # Also need to make sure that the toke is hashed and not storing the raw token in the db
-@app.post("/api/magic-link", response_model=MagicLinkResponse)
-@limiter.limit("20/hour")  # Limit magic link creation
+@app.post(
+    "/api/magic-link",
+    response_model=MagicLinkResponse,
+    dependencies=[Depends(rate_limit("magic_link_create", 20, 3600))]  # Limit magic link creation
+)
 async def create_magic_link(
     request: Request,
     magic_link_request: MagicLinkRequest,
-    db: Session = Depends(get_db)
+    background_tasks: BackgroundTasks,
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Internal endpoint to generate a magic link and send email to user.
@@ -304,10 +658,11 @@ async def create_magic_link(
         token = secrets.token_urlsafe(32)
 
         # Hash the token
-        hashed_token = hashlib.sha256(token.encode()).hexdigest()
+        hashed_token = hash_token(token)
 
         # Set expiration to 24 hours from now
-        expires_at = datetime.now(timezone.utc) + timedelta(hours=24)
+        now = datetime.now(timezone.utc)
+        expires_at = now + timedelta(hours=24)
         
         # Create magic link record
         magic_link = MagicLink(
@@ -319,49 +674,24 @@ async def create_magic_link(
         )
         
         db.add(magic_link)
-        db.commit()
-        db.refresh(magic_link)
+        await db.commit()
         
-        # Get base URL from environment (backend URL for API endpoint)
-        backend_url = os.getenv("BACKEND_URL", os.getenv("API_URL", "http://localhost:8000"))
-        link = f"{backend_url}/api/validate-magic-link?token={token}"
+        link = f"{BACKEND_URL}/api/validate-magic-link?token={token}"
         
-        logger.info(f"Magic link created: email={magic_link_request.email}, expires_at={expires_at}")
+        logger.info("Magic link created: email=%s, expires_at=%s", magic_link_request.email, expires_at)
         
-        # Send email with magic link
-        email_sent = False
-        email_service = None
-        try:
-            email_service = EmailService()
-            email_sent = email_service.send_magic_link(magic_link_request.email, link, db)
-        except ImportError:
+        # Send email with magic link once the response is out (the Resend call runs in the threadpool)
+        message = "Magic link created successfully (email sending failed)"
+        if not RESEND_AVAILABLE:
             logger.warning("Resend package not available. Email not sent.")
-            # Try to send admin alert
-            try:
-                if email_service:
-                    email_service.send_admin_alert(
-                        "Resend Package Not Available",
-                        f"Failed to send magic link email to {magic_link_request.email} because Resend package is not installed.",
-                        "ImportError: Resend package not available"
-                    )
-            except:
-                pass
-        except Exception as e:
-            # Don't fail the request if email fails, just log it
-            error_traceback = traceback.format_exc()
-            logger.error(f"Failed to send magic link email to {magic_link_request.email}: {e}", exc_info=True)
-            # Send admin alert about email failure
+        else:
             try:
-                if email_service:
-                    email_service.send_admin_alert(
-                        "Magic Link Email Send Failed",
-                        f"Failed to send magic link email to {magic_link_request.email}. Magic link was created successfully: {link}",
-                        error_traceback
-                    )
-            except Exception as alert_error:
-                logger.error(f"Failed to send admin alert: {alert_error}")
-        
-        message = "Magic link created and email sent successfully" if email_sent else "Magic link created successfully (email sending failed)"
+                email_service = get_email_service(request)
+                background_tasks.add_task(send_magic_link_task, email_service, magic_link_request.email, link)
+                message = "Magic link created successfully (email queued for sending)"
+            except Exception as e:
+                # Don't fail the request if email setup fails, just log it
+                logger.error("Failed to queue magic link email to %s: %s", magic_link_request.email, e, exc_info=True)
         
         return MagicLinkResponse(
             success=True,
@@ -371,24 +701,27 @@ async def create_magic_link(
             expires_at=expires_at
         )
     except Exception as e:
-        db.rollback()
-        error_traceback = traceback.format_exc()
-        logger.error(f"Error creating magic link: {e}", exc_info=True)
+        await db.rollback()
+        logger.error("Error creating magic link: %s", e, exc_info=True)
         
-        # Send admin alert about magic link creation failure
+        # Send admin alert about magic link creation failure after the response
+        # (returned rather than raised: background tasks don't run for raised HTTPExceptions)
+        error_tasks = BackgroundTasks()
         try:
-            email_service = EmailService()
-            email_service.send_admin_alert(
+            error_tasks.add_task(
+                send_admin_alert_task,
+                get_email_service(request),
                 "Magic Link Creation Failed",
                 f"Failed to create magic link for email: {magic_link_request.email}",
-                error_traceback
+                e
             )
         except Exception as alert_error:
-            logger.error(f"Failed to send admin alert: {alert_error}")
+            logger.error("Failed to send admin alert: %s", alert_error)
         
-        raise HTTPException(
+        return ORJSONResponse(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="An error occurred while creating the magic link."
+            content={"detail": "An error occurred while creating the magic link."},
+            background=error_tasks
         )
 
 
@@ -408,12 +741,14 @@ def generate_deletion_magic_link(email: str, db: Session) -> str:
     now = datetime.now(timezone.utc)
     
     # Check for existing unused, non-expired deletion link
-    existing_link = db.query(MagicLink).filter(
-        MagicLink.email == email_lower,
-        MagicLink.link_type == MagicLinkType.DELETION,
-        MagicLink.used == False,
-        MagicLink.expires_at > now
-    ).first()
+    existing_link = db.execute(
+        select(MagicLink).where(
+            MagicLink.email == email_lower,
+            MagicLink.link_type == MagicLinkType.DELETION,
+            MagicLink.used == False,
+            MagicLink.expires_at > now
+        ).limit(1)
+    ).scalars().first()
     
     if existing_link:
         # Reuse existing link - we need to return the original token
@@ -421,7 +756,7 @@ def generate_deletion_magic_link(email: str, db: Session) -> str:
         # Actually, we can't get the original token back from the hash
         # So we'll create a new one and mark the old one as used, or just create new ones
         # For simplicity, let's just create a new one each time but clean up old unused ones
-        logger.info(f"Found existing deletion link for {email}, but cannot retrieve original token. Creating new one.")
+        logger.info("Found existing deletion link for %s, but cannot retrieve original token. Creating new one.", email)
         # Mark old one as used to clean up
         existing_link.used = True
         existing_link.used_at = now
@@ -431,7 +766,7 @@ def generate_deletion_magic_link(email: str, db: Session) -> str:
     token = secrets.token_urlsafe(32)
     
     # Hash the token
-    hashed_token = hashlib.sha256(token.encode()).hexdigest()
+    hashed_token = hash_token(token)
     
     # Set expiration to 30 days from now (longer than credentials link since it's permanent)
     expires_at = now + timedelta(days=30)
@@ -448,90 +783,96 @@ def generate_deletion_magic_link(email: str, db: Session) -> str:
     db.add(magic_link)
     db.commit()
     
-    # Get base URL from environment
-    backend_url = os.getenv("BACKEND_URL", os.getenv("API_URL", "http://localhost:8000"))
-    link = f"{backend_url}/api/validate-magic-link?token={token}"
+    link = f"{BACKEND_URL}/api/validate-magic-link?token={token}"
     
-    logger.info(f"Deletion magic link created: email={email}, expires_at={expires_at}")
+    logger.info("Deletion magic link created: email=%s, expires_at=%s", email, expires_at)
     
     return link
 
 
 # Public API endpoint to validate magic link and set cookie
-@app.get("/api/validate-magic-link")
-@limiter.limit("10/hour")  # Limit magic link validation attempts
+@app.get(
+    "/api/validate-magic-link",
+    dependencies=[Depends(rate_limit("magic_link_validate", 10, 3600))]  # Limit magic link validation attempts
+)
 async def validate_magic_link(
     request: Request,
     token: str = Query(..., description="Magic link token"),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Public API endpoint to validate a magic link token.
     Sets a cookie and redirects to credentials form if valid.
     """
-    # Hase incoming token
-    hashed_token = hashlib.sha256(token.encode()).hexdigest()
+    # Hash incoming token
+    hashed_token = hash_token(token)
 
-    # Validate the magic link
-    magic_link = db.query(MagicLink).filter(MagicLink.token == hashed_token).first()
-    
-    if not magic_link:
-        raise HTTPException(
-            status_code=status.HTTP_400_NOT_FOUND,
-            detail="Invalid magic link token."
+    now = datetime.now(timezone.utc)
+
+    # Atomically claim the magic link if it is unused and unexpired
+    # (single round trip, and a link cannot be redeemed twice concurrently)
+    magic_link = (await db.execute(
+        update(MagicLink)
+        .where(
+            MagicLink.token == hashed_token,
+            MagicLink.used == False,
+            MagicLink.expires_at > now
         )
+        .values(used=True, used_at=now)
+        .returning(MagicLink.email, MagicLink.link_type)
+    )).one_or_none()
     
-    if magic_link.used:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="This magic link has already been used."
+    if magic_link is None:
+        await db.rollback()
+        # Look the token up again only to report the right error
+        used = await db.scalar(
+            select(MagicLink.used).where(MagicLink.token == hashed_token)
         )
-    
-    if datetime.now(timezone.utc) > magic_link.expires_at:
+        
+        if used is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Invalid magic link token."
+            )
+        
+        if used:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="This magic link has already been used."
+            )
+        
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="This magic link has expired."
         )
     
-    # Create credentials cookie
+    # Create credentials cookie (the claim is only committed once this succeeds)
     cookie_token = create_credentials_cookie(magic_link.email)
-    
-    # Mark magic link as used
-    magic_link.used = True
-    magic_link.used_at = datetime.now(timezone.utc)
-    db.commit()
+    await db.commit()
     
     # Redirect based on link type
-    if magic_link.link_type == MagicLinkType.DELETION:
-        redirect_url = "/delete-account"
-    else:
-        redirect_url = "/form"
+    redirect_url = _MAGIC_LINK_REDIRECTS.get(magic_link.link_type, "/form")
     
     # Create redirect response with cookie
     response = RedirectResponse(url=redirect_url, status_code=status.HTTP_302_FOUND)
-    
-    # Set cookie with 30 minute expiration
-    response.set_cookie(
-        key=COOKIE_NAME,
-        value=cookie_token,
-        max_age=COOKIE_EXPIRATION_MINUTES * 60,
-        httponly=True,
-        secure=os.getenv("ENVIRONMENT", "development") == "production",
-        samesite="lax",
-        path="/"
+    response.raw_headers.append(
+        (b"set-cookie", _COOKIE_HEADER_TEMPLATE.format(value=cookie_token).encode("latin-1"))
     )
     
-    logger.info(f"Magic link validated and cookie set for email: {magic_link.email}, type: {magic_link.link_type}")
+    logger.info("Magic link validated and cookie set for email: %s, type: %s", magic_link.email, magic_link.link_type)
     
     return response
 
 
 # Cookie-protected endpoint to render deletion confirmation page
-@app.get("/delete-account", response_class=HTMLResponse)
-@limiter.limit("10/hour")  # Limit deletion page access
+@app.get(
+    "/delete-account",
+    response_class=HTMLResponse,
+    dependencies=[Depends(rate_limit("delete_account_page", 10, 3600))]  # Limit deletion page access
+)
 async def get_delete_account_page(
     request: Request,
-    email: str = Depends(verify_credentials_cookie)
+    email: str = Depends(verify_credentials_cookie_dependency)
 ):
     """
     Render account deletion confirmation page. Protected by cookie authentication.
@@ -547,23 +888,29 @@ async def get_delete_account_page(
 
 
 # Cookie-protected endpoint to confirm and execute account deletion
-@app.post("/api/confirm-delete-account", response_class=HTMLResponse)
-@limiter.limit("5/hour")  # Strict limit on deletion confirmations
+@app.post(
+    "/api/confirm-delete-account",
+    response_class=HTMLResponse,
+    dependencies=[Depends(rate_limit("delete_account_confirm", 5, 3600))]  # Strict limit on deletion confirmations
+)
 async def confirm_delete_account(
     request: Request,
-    email: str = Depends(verify_credentials_cookie),
-    db: Session = Depends(get_db)
+    background_tasks: BackgroundTasks,
+    email: str = Depends(verify_credentials_cookie_dependency),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Confirm and execute account deletion. Protected by cookie authentication.
     """
     try:
-        # Find the user
-        user = db.query(User).filter(User.email == email.lower()).first()
+        # Find the user (credentials loaded up front: the delete cascade can't lazy load under asyncio)
+        user = await db.scalar(
+            select(User).where(User.email == email).options(selectinload(User.credentials))
+        )
         
         if not user:
             # User doesn't exist, but don't reveal this for security
-            logger.warning(f"Deletion attempt for non-existent email: {email}")
+            logger.warning("Deletion attempt for non-existent email: %s", email)
             return templates.TemplateResponse(
                 "success.html",
                 {
@@ -576,33 +923,34 @@ async def confirm_delete_account(
         client_ip = get_remote_address(request)
         user_agent = request.headers.get("user-agent", "Unknown")
         user_id = user.user_id
+        timestamp = datetime.now(timezone.utc).isoformat()
         
         logger.info(
-            f"ACCOUNT_DELETION: email={email}, ip={client_ip}, "
-            f"user_agent={user_agent}, user_id={user_id}, "
-            f"timestamp={datetime.now(timezone.utc).isoformat()}"
+            "ACCOUNT_DELETION: email=%s, ip=%s, user_agent=%s, user_id=%s, timestamp=%s",
+            email, client_ip, user_agent, user_id, timestamp
         )
         
         # Delete user (cascade will delete credentials due to relationship)
         # Also need to delete any magic links for this email
-        db.query(MagicLink).filter(MagicLink.email == email.lower()).delete()
+        await db.execute(delete(MagicLink).where(MagicLink.email == email))
         
         # Delete user (this will cascade delete credentials)
-        db.delete(user)
-        db.commit()
+        await db.delete(user)
+        await db.commit()
         
-        logger.info(f"Account deleted successfully: {email}")
+        logger.info("Account deleted successfully: %s", email)
         
-        # Send admin alert about account deletion
+        # Send admin alert about account deletion after the response
         try:
-            email_service = EmailService()
-            email_service.send_admin_alert(
+            background_tasks.add_task(
+                send_admin_alert_task,
+                get_email_service(request),
                 "Account Deletion",
                 f"User {email} deleted their account",
-                f"Email: {email}\nIP: {client_ip}\nUser Agent: {user_agent}\nTime: {datetime.now(timezone.utc).isoformat()}\nUser ID: {user_id}"
+                f"Email: {email}\nIP: {client_ip}\nUser Agent: {user_agent}\nTime: {timestamp}\nUser ID: {user_id}"
             )
         except Exception as alert_error:
-            logger.error(f"Failed to send admin alert for account deletion: {alert_error}")
+            logger.error("Failed to send admin alert for account deletion: %s", alert_error)
         
         # Clear the cookie after deletion
         response = templates.TemplateResponse(
@@ -618,68 +966,57 @@ async def confirm_delete_account(
     except HTTPException:
         raise
     except Exception as e:
-        error_traceback = traceback.format_exc()
-        db.rollback()
-        logger.error(f"Error deleting account: {e}", exc_info=True)
+        await db.rollback()
+        logger.error("Error deleting account: %s", e, exc_info=True)
         
-        # Send admin alert about deletion failure
+        # Send admin alert about deletion failure after the response
+        # (returned rather than raised: background tasks don't run for raised HTTPExceptions)
+        error_tasks = BackgroundTasks()
         try:
-            email_service = EmailService()
-            email_service.send_admin_alert(
+            error_tasks.add_task(
+                send_admin_alert_task,
+                get_email_service(request),
                 "Account Deletion Failed",
                 f"Failed to delete account for email: {email}",
-                error_traceback
+                e
             )
         except Exception as alert_error:
-            logger.error(f"Failed to send admin alert: {alert_error}")
+            logger.error("Failed to send admin alert: %s", alert_error)
         
-        raise HTTPException(
+        return ORJSONResponse(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="An error occurred while deleting your account. Please contact support."
+            content={"detail": "An error occurred while deleting your account. Please contact support."},
+            background=error_tasks
         )
 
 
+# Constant bodies for the internal routes, serialized once at import
+_ROOT_BODY = json.dumps(
+    {"message": "Time Card Sign-Off API", "version": api_config["version"]},
+    separators=(",", ":")
+).encode()
+_HEALTH_BODY = b'{"status":"healthy"}'
+
+
 # Internal routes (protected by middleware)
 @app.get("/")
 async def root():
     """Root endpoint - internal only."""
-    return {"message": "Time Card Sign-Off API", "version": api_config["version"]}
+    return Response(content=_ROOT_BODY, media_type="application/json")
 
 
 @app.get("/health")
 async def health():
     """Health check endpoint - internal only."""
-    return {"status": "healthy"}
-
-
-def verify_credentials_cookie_dependency(request: Request) -> str:
-    """
-    Dependency function to verify credentials cookie and return email.
-    
-    Raises:
-        HTTPException: If cookie is missing, invalid, or expired
-    """
-    cookie_value = request.cookies.get(COOKIE_NAME)
-    
-    if not cookie_value:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Authentication required. Please verify."
-        )
-    
-    try:
-        email = verify_credentials_cookie(cookie_value)
-        return email
-    except ValueError as e:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail=str(e)
-        )
+    return Response(content=_HEALTH_BODY, media_type="application/json")
 
 
 # Public endpoint to render credentials form (protected by cookie)
-@app.get("/form", response_class=HTMLResponse)
-@limiter.limit("30/hour")  # Limit form access
+@app.get(
+    "/form",
+    response_class=HTMLResponse,
+    dependencies=[Depends(rate_limit("credentials_form", 30, 3600))]  # Limit form access
+)
 async def get_credentials_form(
     request: Request,
     email: str = Depends(verify_credentials_cookie_dependency)
@@ -692,12 +1029,21 @@ async def get_credentials_form(
 
 
 # Public endpoint to submit credentials (protected by cookie)
-@app.post("/api/submit-credentials", response_class=HTMLResponse)
-@limiter.limit("5/hour")  # Strict limit on credential submissions
+@app.post(
+    "/api/submit-credentials",
+    response_class=HTMLResponse,
+    dependencies=[Depends(rate_limit("credentials_submit", 5, 3600))]  # Strict limit on credential submissions
+)
 async def submit_credentials(
     request: Request,
+    background_tasks: BackgroundTasks,
     email: str = Depends(verify_credentials_cookie_dependency),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db),
+    kms_service: Optional[KMSEncryptService] = Depends(get_kms),
+    first_name: str = Form(""),
+    last_name: str = Form(""),
+    username: str = Form(""),
+    password: str = Form("")
 ):
     """
     Submit user information and encrypted credentials. Protected by cookie authentication.
@@ -708,14 +1054,12 @@ async def submit_credentials(
     client_ip = get_remote_address(request)
     user_agent = request.headers.get("user-agent", "Unknown")
     logger.info(
-        f"CREDENTIAL_UPDATE_ATTEMPT: email={email}, ip={client_ip}, "
-        f"user_agent={user_agent}, timestamp={datetime.now(timezone.utc).isoformat()}"
+        "CREDENTIAL_UPDATE_ATTEMPT: email=%s, ip=%s, user_agent=%s, timestamp=%s",
+        email, client_ip, user_agent, datetime.now(timezone.utc).isoformat()
     )
-    # Parse form data
-    form_data = await request.form()
     try:
-        first_name = (form_data.get("first_name") or "").strip()
-        last_name = (form_data.get("last_name") or "").strip()
+        first_name = first_name.strip()
+        last_name = last_name.strip()
         if not first_name or not last_name:
             return templates.TemplateResponse(
                 "form.html",
@@ -729,9 +1073,11 @@ async def submit_credentials(
         credentials = CredentialsRequest(
             first_name=first_name,
             last_name=last_name,
-            username=form_data.get("username", ""),
-            password=form_data.get("password", "")
+            username=username,
+            password=password
         )
+        # Only the validated model's copies are used (and cleared) from here on
+        del username, password
     except Exception as e:
         return templates.TemplateResponse(
             "error.html",
@@ -748,10 +1094,11 @@ async def submit_credentials(
         # Validate credentials against the timecard portal before encryption
         login_ok, login_error = await validate_timecard_login(
             credentials.username,
-            credentials.password
+            credentials.password,
+            browser_pool=getattr(request.app.state, "browser_pool", None)
         )
         if not login_ok:
-            logger.info(f"Credential validation failed for email {email}: {login_error}")
+            logger.info("Credential validation failed for email %s: %s", email, login_error)
             return templates.TemplateResponse(
                 "form.html",
                 {
@@ -762,107 +1109,123 @@ async def submit_credentials(
                 status_code=status.HTTP_400_BAD_REQUEST
             )
 
-        # Verify email from cookie matches the user being created/updated
-        # Get or create user with email from cookie
-        user = db.query(User).filter(User.email == email.lower()).first()
+        # One timestamp for everything stored/logged after portal validation
+        now = datetime.now(timezone.utc)
+        timestamp = now.isoformat()
         
-        if not user:
-            user = User(
-                email=email.lower(),
+        # Get or create user with email from cookie in a single upsert
+        # (existing users get their name updated, but not email or user_id).
+        # needs_password is cleared here; the transaction only commits once credentials are stored.
+        # xmax = 0 only for a row this statement inserted.
+        # The existing credential id (if any) is read by a scalar subquery on the
+        # upsert's result so both come back in one round trip, always as one row.
+        upserted_user = (
+            pg_insert(User)
+            .values(
+                email=email,
                 first_name=credentials.first_name,
                 last_name=credentials.last_name
             )
-            db.add(user)
-            db.flush()  # Get user.id
-            logger.info(f"Created new user: {email} with user_id: {user.user_id}")
+            .on_conflict_do_update(
+                index_elements=[User.email],
+                set_={
+                    "first_name": credentials.first_name,
+                    "last_name": credentials.last_name,
+                    "updated_at": now,
+                    "needs_password": False,
+                }
+            )
+            .returning(User.id, User.user_id, literal_column("xmax = 0").label("is_new_user"))
+            .cte("upserted_user")
+        )
+        user_row = (await db.execute(
+            select(
+                upserted_user.c.id,
+                upserted_user.c.user_id,
+                upserted_user.c.is_new_user,
+                select(Credential.id)
+                .where(
+                    Credential.user_db_id == upserted_user.c.id,
+                    Credential.site == "timecard_portal"
+                )
+                .order_by(Credential.id)
+                .limit(1)
+                .scalar_subquery()
+            )
+            .select_from(upserted_user)
+        )).one()
+        user_db_id, user_id, is_new_user, existing_credential_id = user_row
+        
+        if is_new_user:
+            logger.info("Created new user: %s with user_id: %s", email, user_id)
         else:
-            # Update existing user info (but not email or user_id)
-            user.first_name = credentials.first_name
-            user.last_name = credentials.last_name
-            user.updated_at = datetime.now(timezone.utc)
-            logger.info(f"Updated user info: {email}")
+            logger.info("Updated user info: %s", email)
         
-        # Initialize KMS encrypt service
-        kms_service = KMSEncryptService()
+        # Create the shared KMS encrypt service now if startup init failed
+        if kms_service is None:
+            kms_service = await run_in_threadpool(get_kms_encrypt_service)
         
-        # Generate data encryption key
-        plaintext_dek, wrapped_dek = kms_service.generate_data_key()
+        # Get a fresh data encryption key (prefilled in the background when possible).
+        # A pool miss is a blocking KMS round trip, so keep it off the event loop.
+        plaintext_dek, wrapped_dek = await run_in_threadpool(kms_service.acquire_dek)
         
         try:
-            # Encrypt username and password (using original credentials before clearing)
-            # Note: credentials are cleared immediately after encryption completes
-            enc_username, nonce_username = kms_service.encrypt_with_dek(
-                credentials.username, 
-                plaintext_dek
-            )
-            enc_password, nonce_password = kms_service.encrypt_with_dek(
-                credentials.password, 
+            # Encrypt username and password
+            (enc_username, nonce_username), (enc_password, nonce_password) = kms_service.encrypt_many(
+                [credentials.username, credentials.password],
                 plaintext_dek
             )
             
             # Get KMS key ID
             kms_key_id = kms_service.kms_key_id
             
-            # Clear plaintext DEK from memory
-            plaintext_dek = b'\x00' * len(plaintext_dek)
-            del plaintext_dek
-            
-            # Clear credentials from memory immediately after encryption
-            credentials.username = obfuscate_credential(credentials.username)
-            credentials.password = obfuscate_credential(credentials.password)
-            
         except Exception as e:
-            # Clear credentials on encryption error as well
-            try:
-                credentials.username = obfuscate_credential(credentials.username)
-                credentials.password = obfuscate_credential(credentials.password)
-            except Exception:
-                pass
-            error_traceback = traceback.format_exc()
-            logger.error(f"Error encrypting credentials: {e}", exc_info=True)
-            db.rollback()
+            logger.error("Error encrypting credentials: %s", e, exc_info=True)
+            await db.rollback()
             
             # Send admin alert about encryption failure
-            try:
-                email_service = EmailService()
-                email_service.send_admin_alert(
-                    "Credential Encryption Failed",
-                    f"Failed to encrypt credentials for user: {email}",
-                    error_traceback
-                )
-            except Exception as alert_error:
-                logger.error(f"Failed to send admin alert: {alert_error}")
+            await queue_admin_alert(
+                request,
+                background_tasks,
+                "Credential Encryption Failed",
+                f"Failed to encrypt credentials for user: {email}",
+                e
+            )
             
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail="Failed to encrypt credentials. Please try again."
             )
-        
-        # Check if credential already exists for this user
-        existing_credential = db.query(Credential).filter(
-            Credential.user_db_id == user.id,
-            Credential.site == "timecard_portal"
-        ).first()
+        finally:
+            # Zero the single-use plaintext DEK; only the wrapped copy is stored
+            secure_wipe(plaintext_dek)
         
         credential_id = None
         is_new_credential = False
-        if existing_credential:
-            # Update existing credential
-            existing_credential.enc_username = enc_username
-            existing_credential.nonce_username = nonce_username
-            existing_credential.enc_password = enc_password
-            existing_credential.nonce_password = nonce_password
-            existing_credential.dek_wrapped = wrapped_dek
-            existing_credential.kms_key_id = kms_key_id
-            existing_credential.dek_version = existing_credential.dek_version + 1
-            existing_credential.updated_at = datetime.now(timezone.utc)
-            credential_id = existing_credential.id
-            logger.info(f"Updated credentials for user: {email}")
+        if existing_credential_id is not None:
+            # Update existing credential in a single statement
+            await db.execute(
+                update(Credential)
+                .where(Credential.id == existing_credential_id)
+                .values(
+                    enc_username=enc_username,
+                    nonce_username=nonce_username,
+                    enc_password=enc_password,
+                    nonce_password=nonce_password,
+                    dek_wrapped=wrapped_dek,
+                    kms_key_id=kms_key_id,
+                    dek_version=Credential.dek_version + 1,
+                    updated_at=now
+                )
+            )
+            credential_id = existing_credential_id
+            logger.info("Updated credentials for user: %s", email)
         else:
-            # Create new credential record
+            # Create new credential record (id generated here, so no flush is needed to read it)
             credential = Credential(
-                user_db_id=user.id,
-                user_id=user.user_id,
+                id=uuid4(),
+                user_db_id=user_db_id,
+                user_id=user_id,
                 site="timecard_portal",
                 enc_username=enc_username,
                 nonce_username=nonce_username,
@@ -873,51 +1236,31 @@ async def submit_credentials(
                 dek_version=1
             )
             db.add(credential)
-            db.flush()  # Flush to get the credential ID
             credential_id = credential.id
             is_new_credential = True
-            logger.info(f"Created new credentials for user: {email}")
+            logger.info("Created new credentials for user: %s", email)
         
-        # Update user's needs_password flag
-        user.needs_password = False
-        
-        db.commit()
+        await db.commit()
         
         # Audit log successful credential create/update
         action_type = "CREATE" if is_new_credential else "UPDATE"
         logger.info(
-            f"CREDENTIAL_{action_type}_SUCCESS: email={email}, ip={client_ip}, "
-            f"user_id={user.user_id}, credential_id={credential_id}, "
-            f"timestamp={datetime.now(timezone.utc).isoformat()}"
+            "CREDENTIAL_%s_SUCCESS: email=%s, ip=%s, user_id=%s, credential_id=%s, timestamp=%s",
+            action_type, email, client_ip, user_id, credential_id, timestamp
         )
         
-        # Send admin alert about credential create/update
-        try:
-            email_service = EmailService()
-            action_text = "created" if is_new_credential else "updated"
-            email_service.send_admin_alert(
-                f"Credential {action_text.title()}",
-                f"User {email} {action_text} their credentials",
-                f"Action: {action_text.upper()}\nEmail: {email}\nIP: {client_ip}\nUser Agent: {user_agent}\nTime: {datetime.now(timezone.utc).isoformat()}\nUser ID: {user.user_id}\nCredential ID: {credential_id}"
-            )
-        except Exception as alert_error:
-            logger.error(f"Failed to send admin alert for credential {action_text}: {alert_error}")
-        
-        # Send confirmation email to user with deletion link
-        try:
-            email_service = EmailService()
-            email_sent = email_service.send_credentials_confirmation(
-                email=email,
-                first_name=user.first_name,
-                db_session=db
-            )
-            if email_sent:
-                logger.info(f"Credentials confirmation email sent to {email}")
-            else:
-                logger.warning(f"Failed to send credentials confirmation email to {email}")
-        except Exception as email_error:
-            logger.error(f"Error sending credentials confirmation email to {email}: {email_error}")
-            # Don't fail the request if email fails
+        # Send admin alert about credential create/update and the user's confirmation
+        # email with deletion link (queued together; sent after the response)
+        action_text = "created" if is_new_credential else "updated"
+        await queue_credentials_saved_emails(
+            request,
+            background_tasks,
+            f"Credential {action_text.title()}",
+            f"User {email} {action_text} their credentials",
+            f"Action: {action_text.upper()}\nEmail: {email}\nIP: {client_ip}\nUser Agent: {user_agent}\nTime: {timestamp}\nUser ID: {user_id}\nCredential ID: {credential_id}",
+            email,
+            credentials.first_name
+        )
         
         return templates.TemplateResponse(
             "success.html",
@@ -928,7 +1271,7 @@ async def submit_credentials(
         )
     
     except HTTPException as e:
-        db.rollback()
+        await db.rollback()
         return templates.TemplateResponse(
             "error.html",
             {
@@ -940,20 +1283,17 @@ async def submit_credentials(
             status_code=e.status_code
         )
     except Exception as e:
-        error_traceback = traceback.format_exc()
-        db.rollback()
-        logger.error(f"Error submitting credentials: {e}", exc_info=True)
+        await db.rollback()
+        logger.error("Error submitting credentials: %s", e, exc_info=True)
         
         # Send admin alert about credential submission failure
-        try:
-            email_service = EmailService()
-            email_service.send_admin_alert(
-                "Credential Submission Failed",
-                f"Failed to submit credentials for user: {email}",
-                error_traceback
-            )
-        except Exception as alert_error:
-            logger.error(f"Failed to send admin alert: {alert_error}")
+        await queue_admin_alert(
+            request,
+            background_tasks,
+            "Credential Submission Failed",
+            f"Failed to submit credentials for user: {email}",
+            e
+        )
         
         return templates.TemplateResponse(
             "error.html",
@@ -965,17 +1305,4 @@ async def submit_credentials(
             },
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR
         )
-    finally:
-        # Safety: Ensure credentials are obfuscated even if any exception occurs
-        # This is defense in depth - credentials may already be obfuscated if encryption succeeded
-        try:
-            # Check if credentials exists (it should, but be defensive)
-            if 'credentials' in locals() and credentials is not None:
-                if hasattr(credentials, 'username') and credentials.username:
-                    credentials.username = obfuscate_credential(credentials.username)
-                if hasattr(credentials, 'password') and credentials.password:
-                    credentials.password = obfuscate_credential(credentials.password)
-        except Exception:
-            # Best effort - don't fail if obfuscation fails
-            pass
 
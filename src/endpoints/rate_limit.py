@@ -0,0 +1,187 @@
+"""
+Sliding-window rate limiting backed by a single Redis Lua script.
+
+Each check is one EVALSHA round trip: the script trims hits older than the
+window, counts what is left and records the new hit only if it is under the
+limit, all atomically, so limits hold across multiple web instances.
+"""
+import time
+import secrets
+import logging
+from collections import deque
+from typing import Optional
+
+from fastapi import HTTPException, Request, status
+
+logger = logging.getLogger(__name__)
+
+# Try to import redis.asyncio (optional: falls back to per-process limits)
+try:
+    from redis.asyncio import Redis
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+    Redis = None
+
+
+# KEYS[1] = bucket key; ARGV = now_ms, window_ms, limit, unique member for this hit
+_SLIDING_WINDOW_LUA = """
+local key = KEYS[1]
+local now = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+local limit = tonumber(ARGV[3])
+redis.call('ZREMRANGEBYSCORE', key, 0, now - window)
+if redis.call('ZCARD', key) < limit then
+    redis.call('ZADD', key, now, ARGV[4])
+    redis.call('PEXPIRE', key, window)
+    return 1
+end
+return 0
+"""
+
+# How often the in-memory fallback drops buckets whose window has lapsed
+_LOCAL_SWEEP_INTERVAL_MS = 60_000
+
+
+def get_remote_address(request: Request) -> str:
+    """
+    Get the client IP address for a request.
+
+    Args:
+        request: The incoming request
+
+    Returns:
+        The client host, or 127.0.0.1 if it is unavailable
+    """
+    if not request.client or not request.client.host:
+        return "127.0.0.1"
+    return request.client.host
+
+
+class SlidingWindowRateLimiter:
+    """
+    Rolling-window rate limiter using Redis when configured, in-memory otherwise.
+    """
+
+    def __init__(self, redis_url: Optional[str] = None):
+        """
+        Initialize the rate limiter.
+
+        Args:
+            redis_url: Redis URL for shared limits (None for per-process in-memory limits)
+        """
+        self._redis = None
+        self._script = None
+        self._local: dict[str, deque] = {}
+        # Per-key expiry (ms), mirroring the Lua script's PEXPIRE
+        self._local_expires: dict[str, int] = {}
+        self._next_sweep_ms = 0
+
+        if redis_url and REDIS_AVAILABLE:
+            self._redis = Redis.from_url(redis_url)
+            # register_script runs EVALSHA and reloads the script on NOSCRIPT
+            self._script = self._redis.register_script(_SLIDING_WINDOW_LUA)
+        elif redis_url:
+            logger.warning("redis package not available. Using in-memory rate limiting.")
+
+    @property
+    def uses_redis(self) -> bool:
+        """Whether limits are shared through Redis."""
+        return self._redis is not None
+
+    async def start(self):
+        """Upload the Lua script once so request-time checks are a bare EVALSHA."""
+        if self._redis is not None:
+            await self._redis.script_load(_SLIDING_WINDOW_LUA)
+
+    async def close(self):
+        """Close the Redis connection pool."""
+        if self._redis is not None:
+            await self._redis.aclose()
+
+    async def hit(self, key: str, limit: int, window_seconds: int) -> bool:
+        """
+        Record a hit for a key if it is under the limit.
+
+        Args:
+            key: Bucket key (e.g. rl:{ip}:{bucket})
+            limit: Maximum hits allowed within the window
+            window_seconds: Window length in seconds
+
+        Returns:
+            True if the hit is allowed, False if the limit is exceeded
+        """
+        now_ms = int(time.time() * 1000)
+        window_ms = window_seconds * 1000
+
+        if self._script is not None:
+            try:
+                allowed = await self._script(
+                    keys=[key],
+                    args=[now_ms, window_ms, limit, f"{now_ms}-{secrets.token_hex(4)}"]
+                )
+                return bool(allowed)
+            except Exception as e:
+                # Don't lock users out if Redis is briefly unavailable
+                logger.warning("Redis rate limit check failed, using in-memory window: %s", e)
+
+        return self._hit_local(key, limit, now_ms, window_ms)
+
+    def _hit_local(self, key: str, limit: int, now_ms: int, window_ms: int) -> bool:
+        """Same sliding-window algorithm as the Lua script, for this process only."""
+        if now_ms >= self._next_sweep_ms:
+            self._sweep_local(now_ms)
+
+        hits = self._local.get(key)
+        if hits is None:
+            hits = self._local[key] = deque()
+
+        cutoff = now_ms - window_ms
+        while hits and hits[0] <= cutoff:
+            hits.popleft()
+
+        if len(hits) < limit:
+            hits.append(now_ms)
+            self._local_expires[key] = now_ms + window_ms
+            return True
+        if not hits:
+            # limit <= 0: nothing was recorded, so don't keep the bucket
+            del self._local[key]
+        return False
+
+    def _sweep_local(self, now_ms: int) -> None:
+        """Drop in-memory buckets whose newest hit has left the window."""
+        expired = [key for key, expires in self._local_expires.items() if expires <= now_ms]
+        for key in expired:
+            del self._local_expires[key]
+            self._local.pop(key, None)
+        self._next_sweep_ms = now_ms + _LOCAL_SWEEP_INTERVAL_MS
+
+
+def rate_limit(bucket: str, limit: int, per: int):
+    """
+    Create a FastAPI dependency enforcing a per-client-IP rate limit.
+
+    Args:
+        bucket: Name of the limit (keeps endpoints' counters separate)
+        limit: Maximum requests allowed per window
+        per: Window length in seconds
+
+    Returns:
+        An async dependency raising HTTP 429 when the limit is exceeded
+    """
+    detail = f"Rate limit exceeded: {limit} per {per} seconds"
+
+    async def dependency(request: Request) -> None:
+        limiter: Optional[SlidingWindowRateLimiter] = getattr(request.app.state, "rate_limiter", None)
+        if limiter is None:
+            return
+        key = f"rl:{get_remote_address(request)}:{bucket}"
+        if not await limiter.hit(key, limit, per):
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail=detail,
+                headers={"Retry-After": str(per)}
+            )
+
+    return dependency
@@ -0,0 +1,61 @@
+"""
+Tests for reading the credentials auth cookie straight from the Cookie header.
+
+Run from the project root:
+
+```
+python -m pytest src/endpoints/tests/test_cookie_auth.py
+```
+"""
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException
+
+from src.auth.cookies import COOKIE_NAME, create_credentials_cookie
+from src.endpoints.main import _COOKIE_PATTERN, verify_credentials_cookie_dependency
+
+
+def _cookie_value(header: str):
+    match = _COOKIE_PATTERN.search(header)
+    return match.group(1).strip() if match else None
+
+
+@pytest.mark.parametrize(
+    "header, expected",
+    [
+        (f"{COOKIE_NAME}=abc.def", "abc.def"),
+        (f"session=1; {COOKIE_NAME}=abc.def; theme=dark", "abc.def"),
+        (f"session=1;{COOKIE_NAME}=abc.def", "abc.def"),
+        (f"session=1; {COOKIE_NAME}=", ""),
+        (f"x{COOKIE_NAME}=forged; theme=dark", None),
+        (f"session={COOKIE_NAME}=forged", None),
+        ("session=1; theme=dark", None),
+    ],
+)
+def test_cookie_pattern_matches_only_our_cookie(header, expected):
+    assert _cookie_value(header) == expected
+
+
+def _request(cookie_header=None):
+    headers = {"cookie": cookie_header} if cookie_header is not None else {}
+    return SimpleNamespace(headers=headers)
+
+
+@pytest.fixture
+def cookie_secret(monkeypatch):
+    monkeypatch.setenv("COOKIE_SECRET_KEY", "test-secret")
+
+
+def test_dependency_returns_email_from_valid_cookie(cookie_secret):
+    token = create_credentials_cookie("User@Example.com")
+    email = asyncio.run(verify_credentials_cookie_dependency(_request(f"theme=dark; {COOKIE_NAME}={token}")))
+    assert email == "user@example.com"
+
+
+@pytest.mark.parametrize("cookie_header", [None, "theme=dark", f"{COOKIE_NAME}=", f"{COOKIE_NAME}=not-a-token"])
+def test_dependency_rejects_missing_or_invalid_cookie(cookie_secret, cookie_header):
+    with pytest.raises(HTTPException) as exc_info:
+        asyncio.run(verify_credentials_cookie_dependency(_request(cookie_header)))
+    assert exc_info.value.status_code == 401
@@ -0,0 +1,119 @@
+"""
+Tests for the sliding-window rate limiter (in-memory fallback and the 429 dependency).
+
+Run from the project root:
+
+```
+python -m pytest src/endpoints/tests/test_rate_limit.py
+```
+"""
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException
+
+from src.endpoints import rate_limit
+from src.endpoints.rate_limit import SlidingWindowRateLimiter, rate_limit as rate_limit_dependency
+
+
+class _Clock:
+    """Stand-in for time.time() that tests move forward by hand."""
+
+    def __init__(self, now: float = 1_000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = _Clock()
+    monkeypatch.setattr(rate_limit.time, "time", clock)
+    return clock
+
+
+def _hit(limiter: SlidingWindowRateLimiter, key: str = "rl:1.2.3.4:test", limit: int = 3, window: int = 60) -> bool:
+    return asyncio.run(limiter.hit(key, limit, window))
+
+
+def test_allows_hits_under_the_limit(clock):
+    limiter = SlidingWindowRateLimiter()
+    assert [_hit(limiter) for _ in range(3)] == [True, True, True]
+
+
+def test_rejects_hits_over_the_limit(clock):
+    limiter = SlidingWindowRateLimiter()
+    for _ in range(3):
+        _hit(limiter)
+    assert _hit(limiter) is False
+    # Other keys keep their own budget
+    assert _hit(limiter, key="rl:5.6.7.8:test") is True
+
+
+def test_window_rolls_forward(clock):
+    limiter = SlidingWindowRateLimiter()
+    _hit(limiter)
+    clock.now += 30
+    _hit(limiter)
+    _hit(limiter)
+    assert _hit(limiter) is False
+
+    # The first hit leaves the window; the two later ones still count
+    clock.now += 31
+    assert _hit(limiter) is True
+    assert _hit(limiter) is False
+
+
+def test_falls_back_to_memory_when_redis_fails(clock):
+    limiter = SlidingWindowRateLimiter()
+    calls = []
+
+    async def failing_script(keys, args):
+        calls.append(keys)
+        raise ConnectionError("redis down")
+
+    limiter._script = failing_script
+    assert [_hit(limiter) for _ in range(4)] == [True, True, True, False]
+    assert len(calls) == 4
+
+
+def test_sweep_drops_expired_buckets(clock):
+    limiter = SlidingWindowRateLimiter()
+    _hit(limiter, key="old", window=10)
+    _hit(limiter, key="recent", window=600)
+    assert set(limiter._local) == {"old", "recent"}
+
+    clock.now += rate_limit._LOCAL_SWEEP_INTERVAL_MS / 1000
+    _hit(limiter, key="new", window=10)
+    assert set(limiter._local) == {"recent", "new"}
+    assert set(limiter._local_expires) == {"recent", "new"}
+
+
+def test_zero_limit_keeps_no_bucket(clock):
+    limiter = SlidingWindowRateLimiter()
+    assert _hit(limiter, limit=0) is False
+    assert limiter._local == {}
+
+
+def test_dependency_raises_429_with_retry_after(clock):
+    limiter = SlidingWindowRateLimiter()
+    request = SimpleNamespace(
+        app=SimpleNamespace(state=SimpleNamespace(rate_limiter=limiter)),
+        client=SimpleNamespace(host="1.2.3.4"),
+    )
+    dependency = rate_limit_dependency("submit", limit=2, per=60)
+
+    asyncio.run(dependency(request))
+    asyncio.run(dependency(request))
+    with pytest.raises(HTTPException) as exc_info:
+        asyncio.run(dependency(request))
+
+    assert exc_info.value.status_code == 429
+    assert exc_info.value.headers == {"Retry-After": "60"}
+
+
+def test_dependency_is_a_no_op_without_a_limiter():
+    request = SimpleNamespace(app=SimpleNamespace(state=SimpleNamespace()), client=None)
+    asyncio.run(rate_limit_dependency("submit", limit=0, per=60)(request))
@@ -2,6 +2,7 @@
 AWS KMS configuration for loading credentials and key ID from environment variables.
 """
 import os
+from functools import lru_cache
 from typing import Dict, Any, Optional
 import logging
 
@@ -15,6 +16,7 @@ except ImportError:
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=2)
 def get_kms_config(mode: str = "encrypt") -> Dict[str, Any]:
     """
     Get AWS KMS configuration from environment variables.
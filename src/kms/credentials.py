@@ -4,10 +4,12 @@ Used by celery worker to retrieve and decrypt credentials for timecard automatio
 """
 from typing import Optional, Tuple
 import logging
+from sqlalchemy import select, and_
 from sqlalchemy.orm import Session
 
 from src.db.models import User, Credential
-from .service import KMSDecryptService
+from .service import get_kms_decrypt_service
+from .utils import secure_wipe
 
 logger = logging.getLogger(__name__)
 
@@ -32,64 +34,59 @@ def decrypt_user_credentials(
         ValueError: If user not found or credentials not found
         Exception: If decryption fails
     """
-    # Get user
+    # Get user email and credential record in one round trip
+    # (outer join so a missing user and missing credentials stay distinguishable)
     if user_id:
-        user = db.query(User).filter(User.id == user_id).first()
+        user_filter = User.id == user_id
     elif user_email:
-        user = db.query(User).filter(User.email == user_email.lower()).first()
+        user_filter = User.email == user_email.lower()
     else:
         raise ValueError("Either user_email or user_id must be provided")
     
-    if not user:
-        raise ValueError(f"User not found: {user_email or user_id}")
-    
-    # Get credential record
-    credential = db.query(Credential).filter(
-        Credential.user_db_id == user.id,
-        Credential.site == "timecard_portal"
+    row = db.execute(
+        select(User.email, Credential)
+        .outerjoin(
+            Credential,
+            and_(Credential.user_db_id == User.id, Credential.site == "timecard_portal")
+        )
+        .where(user_filter)
+        .limit(1)
     ).first()
     
-    if not credential:
-        raise ValueError(f"No credentials found for user: {user.email}")
+    if row is None:
+        raise ValueError(f"User not found: {user_email or user_id}")
+    
+    email, credential = row
+    if credential is None:
+        raise ValueError(f"No credentials found for user: {email}")
     
-    # Initialize KMS decrypt service
-    kms_service = KMSDecryptService()
+    # Shared KMS decrypt service (one boto3 client per worker process)
+    kms_service = get_kms_decrypt_service()
     
     try:
-        # Decrypt the wrapped DEK
+        # Decrypt the wrapped DEK (returned as a bytearray so it can be wiped in place)
         plaintext_dek = kms_service.decrypt_dek(credential.dek_wrapped)
         
         try:
-            # Decrypt username and password
-            username = kms_service.decrypt_with_dek(
-                credential.enc_username,
-                credential.nonce_username,
-                plaintext_dek
-            )
-            password = kms_service.decrypt_with_dek(
-                credential.enc_password,
-                credential.nonce_password,
+            # Decrypt username and password (one cipher for both)
+            username, password = kms_service.decrypt_many(
+                [
+                    (credential.enc_username, credential.nonce_username),
+                    (credential.enc_password, credential.nonce_password),
+                ],
                 plaintext_dek
             )
             
-            # Clear plaintext DEK from memory
-            plaintext_dek = b'\x00' * len(plaintext_dek)
-            del plaintext_dek
-            
-            logger.info(f"Successfully decrypted credentials for user: {user.email}")
+            logger.info("Successfully decrypted credentials for user: %s", email)
             
             return username, password
         
         finally:
-            # Ensure DEK is cleared even if decryption fails
-            try:
-                plaintext_dek = b'\x00' * len(plaintext_dek)
-                del plaintext_dek
-            except:
-                pass
+            # Zero the plaintext DEK whether or not decryption succeeded
+            secure_wipe(plaintext_dek)
     
     except Exception as e:
-        logger.error(f"Failed to decrypt credentials for user {user.email}: {e}")
+        logger.error("Failed to decrypt credentials for user %s: %s", email, e)
         raise
 
 
@@ -115,14 +112,6 @@ def get_user_credentials_for_signoff(
     """
     username, password = decrypt_user_credentials(db, user_email=user_email, user_id=user_id)
     
-    # Get user for domain if needed
-    if user_id:
-        user = db.query(User).filter(User.id == user_id).first()
-    elif user_email:
-        user = db.query(User).filter(User.email == user_email.lower()).first()
-    else:
-        user = None
-    
     # Default domain (can be customized based on your needs)
     domain = "MC Network"  # Default domain
     
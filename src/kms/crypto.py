@@ -3,9 +3,11 @@ AES-GCM encryption and decryption utilities.
 """
 from cryptography.hazmat.primitives.ciphers.aead import AESGCM
 from cryptography.hazmat.backends import default_backend
-import secrets
+import os
 import logging
 
+from .utils import secure_wipe
+
 logger = logging.getLogger(__name__)
 
 # Standard nonce size for GCM is 12 bytes (96 bits)
@@ -14,6 +16,12 @@ NONCE_SIZE = 12
 KEY_SIZE = 32
 
 
+def _gen_nonces(n: int) -> list[bytes]:
+    """Draw n random GCM nonces with a single os.urandom call."""
+    buf = os.urandom(NONCE_SIZE * n)
+    return [buf[i * NONCE_SIZE:(i + 1) * NONCE_SIZE] for i in range(n)]
+
+
 def encrypt_aes_gcm(plaintext: str, key: bytes) -> tuple[bytes, bytes]:
     """
     Encrypt plaintext using AES-GCM.
@@ -32,19 +40,59 @@ def encrypt_aes_gcm(plaintext: str, key: bytes) -> tuple[bytes, bytes]:
         raise ValueError(f"Key must be {KEY_SIZE} bytes for AES-256, got {len(key)} bytes")
     
     # Generate a random nonce
-    nonce = secrets.token_bytes(NONCE_SIZE)
+    nonce = os.urandom(NONCE_SIZE)
     
     # Create AES-GCM cipher
     aesgcm = AESGCM(key)
     
     # Encrypt the plaintext
-    # AESGCM.encrypt expects bytes, and returns ciphertext
-    plaintext_bytes = plaintext.encode('utf-8')
-    ciphertext = aesgcm.encrypt(nonce, plaintext_bytes, None)
+    # Encode into a bytearray so the UTF-8 copy can be zeroed afterwards
+    plaintext_bytes = bytearray(plaintext, 'utf-8')
+    try:
+        ciphertext = aesgcm.encrypt(nonce, plaintext_bytes, None)
+    finally:
+        secure_wipe(plaintext_bytes)
     
     return ciphertext, nonce
 
 
+def encrypt_many_aes_gcm(plaintexts: list[str], key: bytes) -> list[tuple[bytes, bytes]]:
+    """
+    Encrypt several plaintexts with the same key using AES-GCM.
+    
+    Nonces for all plaintexts are drawn in a single random read and the
+    cipher is constructed once.
+    
+    Args:
+        plaintexts: The plaintext strings to encrypt
+        key: The encryption key (must be 32 bytes for AES-256)
+    
+    Returns:
+        List of (ciphertext, nonce) tuples, in the same order as plaintexts
+    
+    Raises:
+        ValueError: If key size is incorrect
+    """
+    if len(key) != KEY_SIZE:
+        raise ValueError(f"Key must be {KEY_SIZE} bytes for AES-256, got {len(key)} bytes")
+    
+    # Generate all nonces at once
+    nonces = _gen_nonces(len(plaintexts))
+    
+    aesgcm = AESGCM(key)
+    
+    results = []
+    for plaintext, nonce in zip(plaintexts, nonces):
+        plaintext_bytes = bytearray(plaintext, 'utf-8')
+        try:
+            ciphertext = aesgcm.encrypt(nonce, plaintext_bytes, None)
+        finally:
+            secure_wipe(plaintext_bytes)
+        results.append((ciphertext, nonce))
+    
+    return results
+
+
 def decrypt_aes_gcm(ciphertext: bytes, nonce: bytes, key: bytes) -> str:
     """
     Decrypt ciphertext using AES-GCM.
@@ -76,3 +124,34 @@ def decrypt_aes_gcm(ciphertext: bytes, nonce: bytes, key: bytes) -> str:
     # Convert back to string
     return plaintext_bytes.decode('utf-8')
 
+
+
+def decrypt_many_aes_gcm(items: list[tuple[bytes, bytes]], key: bytes) -> list[str]:
+    """
+    Decrypt several ciphertexts encrypted with the same key using AES-GCM.
+    
+    The cipher (and its key schedule) is constructed once for all items.
+    
+    Args:
+        items: (ciphertext, nonce) tuples to decrypt
+        key: The decryption key (must be 32 bytes for AES-256)
+    
+    Returns:
+        List of decrypted plaintext strings, in the same order as items
+    
+    Raises:
+        ValueError: If key or nonce size is incorrect
+        cryptography.exceptions.InvalidTag: If decryption fails (wrong key, corrupted data, etc.)
+    """
+    if len(key) != KEY_SIZE:
+        raise ValueError(f"Key must be {KEY_SIZE} bytes for AES-256, got {len(key)} bytes")
+    
+    aesgcm = AESGCM(key)
+    
+    plaintexts = []
+    for ciphertext, nonce in items:
+        if len(nonce) != NONCE_SIZE:
+            raise ValueError(f"Nonce must be {NONCE_SIZE} bytes, got {len(nonce)} bytes")
+        plaintexts.append(aesgcm.decrypt(nonce, ciphertext, None).decode('utf-8'))
+    
+    return plaintexts
@@ -2,15 +2,108 @@
 AWS KMS service for encryption and decryption operations.
 """
 import boto3
+from botocore.config import Config
 from botocore.exceptions import ClientError
-from typing import Tuple
+from functools import lru_cache
+from typing import Callable, Optional, Tuple
 import logging
+import queue
+import threading
 
 from .config import get_kms_config
-from .crypto import encrypt_aes_gcm, decrypt_aes_gcm
+from .crypto import encrypt_aes_gcm, encrypt_many_aes_gcm, decrypt_aes_gcm, decrypt_many_aes_gcm
+from .utils import secure_wipe
 
 logger = logging.getLogger(__name__)
 
+# Shared client settings: pooled keep-alive HTTPS connections to KMS and adaptive retries
+_KMS_CLIENT_CONFIG = Config(
+    max_pool_connections=50,
+    retries={"max_attempts": 3, "mode": "adaptive"},
+    tcp_keepalive=True,
+)
+
+
+class _DEKPool:
+    """
+    Prefilled queue of single-use KMS data keys.
+    
+    Each (plaintext_dek, wrapped_dek) pair is handed out exactly once, so every
+    credential record still gets its own DEK. One long-lived refill thread tops
+    the queue back up after each get(), keeping the KMS round trip off requests.
+    """
+    
+    def __init__(self, maxsize: int = 8, retry_seconds: float = 5):
+        self.retry_seconds = retry_seconds
+        self._queue: "queue.Queue[Tuple[bytearray, bytes]]" = queue.Queue(maxsize=maxsize)
+        self._lock = threading.Lock()
+        self._refill_needed = threading.Event()
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._generate: Optional[Callable[[], Tuple[bytearray, bytes]]] = None
+    
+    def start(self, generate: Callable[[], Tuple[bytearray, bytes]]) -> None:
+        """Start the refill thread (no-op if already running)."""
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._generate = generate
+            self._stopped.clear()
+            self._refill_needed.set()
+            self._thread = threading.Thread(target=self._refill_loop, name="kms-dek-refill", daemon=True)
+            self._thread.start()
+    
+    def get(self) -> Optional[Tuple[bytearray, bytes]]:
+        """Take one unused (plaintext_dek, wrapped_dek), or None if the queue is empty."""
+        try:
+            dek = self._queue.get_nowait()
+        except queue.Empty:
+            dek = None
+        self._refill_needed.set()
+        return dek
+    
+    def _refill_loop(self) -> None:
+        """Generate DEKs until the queue is full, then wait for the next get()."""
+        while not self._stopped.is_set():
+            self._refill_needed.wait()
+            self._refill_needed.clear()
+            while not self._stopped.is_set() and not self._queue.full():
+                try:
+                    dek = self._generate()
+                except Exception as e:
+                    logger.warning("DEK pool refill failed: %s", e)
+                    self._stopped.wait(self.retry_seconds)
+                    self._refill_needed.set()
+                    break
+                try:
+                    self._queue.put_nowait(dek)
+                except queue.Full:
+                    secure_wipe(dek[0])
+                    break
+    
+    def stop(self) -> None:
+        """Stop the refill thread and zero every pooled plaintext DEK."""
+        with self._lock:
+            thread, self._thread = self._thread, None
+            self._stopped.set()
+            self._refill_needed.set()
+        if thread is not None:
+            thread.join(timeout=5)
+        while True:
+            try:
+                plaintext_dek, _ = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            secure_wipe(plaintext_dek)
+
+
+_dek_pool = _DEKPool()
+
+
+def clear_dek_pool() -> None:
+    """Stop refilling and zero any pooled plaintext DEKs (call on application shutdown)."""
+    _dek_pool.stop()
+
 
 class KMSEncryptService:
     """
@@ -25,17 +118,19 @@ class KMSEncryptService:
             'kms',
             aws_access_key_id=config["access_key_id"],
             aws_secret_access_key=config["secret_access_key"],
-            region_name=config["region"]
+            region_name=config["region"],
+            config=_KMS_CLIENT_CONFIG
         )
         self.kms_key_id = config["kms_key_id"]
     
-    def generate_data_key(self) -> Tuple[bytes, bytes]:
+    def generate_data_key(self) -> Tuple[bytearray, bytes]:
         """
         Generate a data encryption key (DEK) using AWS KMS.
         
         Returns:
             Tuple of (plaintext_dek, wrapped_dek)
-            - plaintext_dek: The DEK in plaintext (32 bytes for AES-256)
+            - plaintext_dek: The DEK in plaintext (32 bytes for AES-256) as a bytearray,
+              so the caller can zero it with secure_wipe() when done
             - wrapped_dek: The DEK encrypted by KMS (ciphertext blob)
         
         Raises:
@@ -47,17 +142,36 @@ class KMSEncryptService:
                 KeySpec='AES_256'  # Generate a 256-bit key
             )
             
-            plaintext_dek = response['Plaintext']
+            plaintext_dek = bytearray(response['Plaintext'])
             wrapped_dek = response['CiphertextBlob']
             
-            logger.info(f"Generated data key using KMS key: {self.kms_key_id}")
+            logger.info("Generated data key using KMS key: %s", self.kms_key_id)
             
             return plaintext_dek, wrapped_dek
         
         except ClientError as e:
-            logger.error(f"Failed to generate data key: {e}")
+            logger.error("Failed to generate data key: %s", e)
             raise
     
+    def acquire_dek(self) -> Tuple[bytearray, bytes]:
+        """
+        Get an unused data encryption key, from the prefilled pool when possible.
+        
+        Returns:
+            Tuple of (plaintext_dek, wrapped_dek), same as generate_data_key()
+        
+        Raises:
+            ClientError: If KMS operation fails
+        """
+        pooled = _dek_pool.get()
+        if pooled is not None:
+            return pooled
+        return self.generate_data_key()
+    
+    def start_dek_pool(self) -> None:
+        """Start prefilling single-use DEKs in the background (e.g. at application startup)."""
+        _dek_pool.start(self.generate_data_key)
+    
     def encrypt_with_dek(self, plaintext: str, dek: bytes) -> Tuple[bytes, bytes]:
         """
         Encrypt data using AES-GCM with a plaintext DEK.
@@ -70,6 +184,19 @@ class KMSEncryptService:
             Tuple of (ciphertext, nonce)
         """
         return encrypt_aes_gcm(plaintext, dek)
+    
+    def encrypt_many(self, plaintexts: list[str], dek: bytes) -> list[tuple[bytes, bytes]]:
+        """
+        Encrypt several values using AES-GCM with the same plaintext DEK.
+        
+        Args:
+            plaintexts: The data to encrypt
+            dek: The plaintext data encryption key
+        
+        Returns:
+            List of (ciphertext, nonce) tuples, in the same order as plaintexts
+        """
+        return encrypt_many_aes_gcm(plaintexts, dek)
 
 
 class KMSDecryptService:
@@ -85,11 +212,12 @@ class KMSDecryptService:
             'kms',
             aws_access_key_id=config["access_key_id"],
             aws_secret_access_key=config["secret_access_key"],
-            region_name=config["region"]
+            region_name=config["region"],
+            config=_KMS_CLIENT_CONFIG
         )
         self.kms_key_id = config["kms_key_id"]
     
-    def decrypt_dek(self, wrapped_dek: bytes) -> bytes:
+    def decrypt_dek(self, wrapped_dek: bytes) -> bytearray:
         """
         Decrypt a wrapped data encryption key using AWS KMS.
         
@@ -97,7 +225,8 @@ class KMSDecryptService:
             wrapped_dek: The encrypted DEK (ciphertext blob from KMS)
         
         Returns:
-            The plaintext DEK (32 bytes for AES-256)
+            The plaintext DEK (32 bytes for AES-256) as a bytearray, so the
+            caller can zero it with secure_wipe() when done
         
         Raises:
             ClientError: If KMS operation fails
@@ -107,14 +236,14 @@ class KMSDecryptService:
                 CiphertextBlob=wrapped_dek
             )
             
-            plaintext_dek = response['Plaintext']
+            plaintext_dek = bytearray(response['Plaintext'])
             
-            logger.info(f"Decrypted data key using KMS key: {self.kms_key_id}")
+            logger.info("Decrypted data key using KMS key: %s", self.kms_key_id)
             
             return plaintext_dek
         
         except ClientError as e:
-            logger.error(f"Failed to decrypt data key: {e}")
+            logger.error("Failed to decrypt data key: %s", e)
             raise
     
     def decrypt_with_dek(self, ciphertext: bytes, nonce: bytes, dek: bytes) -> str:
@@ -130,4 +259,35 @@ class KMSDecryptService:
             The decrypted plaintext string
         """
         return decrypt_aes_gcm(ciphertext, nonce, dek)
+    
+    def decrypt_many(self, items: list[tuple[bytes, bytes]], dek: bytes) -> list[str]:
+        """
+        Decrypt several values using AES-GCM with the same plaintext DEK.
+        
+        Args:
+            items: (ciphertext, nonce) tuples to decrypt
+            dek: The plaintext data encryption key
+        
+        Returns:
+            List of decrypted plaintext strings, in the same order as items
+        """
+        return decrypt_many_aes_gcm(items, dek)
+
+
 
+@lru_cache(maxsize=1)
+def get_kms_encrypt_service() -> KMSEncryptService:
+    """
+    Get the process-wide KMSEncryptService (created on first call).
+    botocore clients are thread-safe, so one instance serves all requests.
+    """
+    return KMSEncryptService()
+
+
+@lru_cache(maxsize=1)
+def get_kms_decrypt_service() -> KMSDecryptService:
+    """
+    Get the process-wide KMSDecryptService (created on first call).
+    botocore clients are thread-safe, so one instance serves all tasks.
+    """
+    return KMSDecryptService()
@@ -0,0 +1,144 @@
+"""
+Tests for the prefilled pool of single-use KMS data keys.
+
+Run from the project root:
+
+```
+python -m pytest src/kms/tests/test_dek_pool.py
+```
+"""
+import itertools
+import os
+import threading
+import time
+
+import pytest
+
+from src.kms import service
+from src.kms.service import KMSEncryptService, _DEKPool
+from src.kms.utils import secure_wipe
+
+
+def _wait_for(condition, timeout: float = 2.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            raise AssertionError("condition not met in time")
+        time.sleep(0.01)
+
+
+class _FakeKMS:
+    """Counts generate_data_key calls and hands out distinct keys."""
+
+    def __init__(self):
+        self._counter = itertools.count()
+        self.lock = threading.Lock()
+        self.generated = []
+
+    def generate(self):
+        with self.lock:
+            dek = (bytearray(os.urandom(32)), b"wrapped-%d" % next(self._counter))
+            self.generated.append(dek)
+            return dek
+
+
+@pytest.fixture
+def pool():
+    pool = _DEKPool(maxsize=3, retry_seconds=0.01)
+    yield pool
+    pool.stop()
+
+
+def test_prefills_up_to_maxsize(pool):
+    kms = _FakeKMS()
+    pool.start(kms.generate)
+    _wait_for(lambda: pool._queue.full())
+    time.sleep(0.05)
+    assert len(kms.generated) == 3
+
+
+def test_each_dek_is_handed_out_once(pool):
+    kms = _FakeKMS()
+    pool.start(kms.generate)
+
+    wrapped = []
+    for _ in range(10):
+        _wait_for(lambda: not pool._queue.empty())
+        wrapped.append(pool.get()[1])
+
+    assert len(set(wrapped)) == len(wrapped)
+
+
+def test_get_returns_none_when_empty():
+    assert _DEKPool().get() is None
+
+
+def test_refill_retries_after_kms_errors(pool):
+    kms = _FakeKMS()
+    failures = iter([RuntimeError("throttled"), RuntimeError("throttled")])
+
+    def flaky_generate():
+        error = next(failures, None)
+        if error is not None:
+            raise error
+        return kms.generate()
+
+    pool.start(flaky_generate)
+    _wait_for(lambda: pool._queue.full())
+
+
+def test_stop_joins_the_refill_thread(pool):
+    pool.start(_FakeKMS().generate)
+    thread = pool._thread
+    pool.stop()
+    assert not thread.is_alive()
+    assert pool._queue.empty()
+
+
+def test_acquire_dek_falls_back_to_kms_when_pool_is_empty(monkeypatch):
+    monkeypatch.setattr(service, "_dek_pool", _DEKPool())
+    kms = _FakeKMS()
+    encrypt_service = object.__new__(KMSEncryptService)
+    encrypt_service.generate_data_key = kms.generate
+
+    plaintext_dek, wrapped_dek = encrypt_service.acquire_dek()
+    assert (plaintext_dek, wrapped_dek) == kms.generated[0]
+
+
+def test_stop_wipes_pooled_plaintext_deks(pool):
+    kms = _FakeKMS()
+    pool.start(kms.generate)
+    _wait_for(lambda: pool._queue.full())
+
+    pool.stop()
+    assert kms.generated
+    for plaintext_dek, _ in kms.generated:
+        assert plaintext_dek == bytearray(32)
+
+
+def test_handed_out_dek_is_left_to_the_caller(pool):
+    kms = _FakeKMS()
+    pool.start(kms.generate)
+    _wait_for(lambda: not pool._queue.empty())
+
+    plaintext_dek, _ = pool.get()
+    pool.stop()
+    # Only the caller wipes a DEK it took; stop() must not zero it mid-encryption
+    assert plaintext_dek != bytearray(32)
+
+
+def test_generate_data_key_returns_a_wipeable_bytearray():
+    class _Client:
+        def generate_data_key(self, KeyId, KeySpec):
+            return {"Plaintext": b"\x01" * 32, "CiphertextBlob": b"wrapped"}
+
+    encrypt_service = object.__new__(KMSEncryptService)
+    encrypt_service.kms_client = _Client()
+    encrypt_service.kms_key_id = "test-key"
+
+    plaintext_dek, wrapped_dek = encrypt_service.generate_data_key()
+    assert isinstance(plaintext_dek, bytearray)
+    assert wrapped_dek == b"wrapped"
+
+    secure_wipe(plaintext_dek)
+    assert plaintext_dek == bytearray(32)
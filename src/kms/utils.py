@@ -1,24 +1,20 @@
 """
 Security utilities for credential handling.
 """
-import random
+import ctypes
 
 
-def obfuscate_credential(value: str) -> str:
+def secure_wipe(buf: bytearray) -> None:
     """
-    Obfuscate a credential by overwriting with random-length null bytes.
+    Zero a mutable buffer in place.
     
-    This prevents attackers from inferring the original credential length
-    if they dump memory. Uses a random length between 8-64 characters.
+    Writes through ctypes.memset (the explicit_bzero equivalent) so the
+    plaintext bytes are actually overwritten rather than just unreferenced.
     
     Args:
-        value: The credential string to obfuscate
-        
-    Returns:
-        String of null bytes with random length
+        buf: The buffer holding secret bytes
     """
-    # Use random length between 8-64 to obfuscate original length
-    # This range covers most password lengths without being suspiciously long
-    random_length = random.randint(8, 64)
-    return "\x00" * random_length
+    n = len(buf)
+    if n:
+        ctypes.memset((ctypes.c_char * n).from_buffer(buf), 0, n)
 
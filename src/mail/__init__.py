@@ -1,11 +1,12 @@
 """
 Email module for sending notifications via Resend API.
 """
-from .email_service import EmailService
+from .email_service import EmailService, get_shared_email_service
 from .config import get_email_config
 
 __all__ = [
     "EmailService",
+    "get_shared_email_service",
     "get_email_config",
 ]
 
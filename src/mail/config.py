@@ -2,6 +2,7 @@
 Email configuration for Resend API and Mailtrap (for admin emails).
 """
 import os
+from functools import lru_cache
 from typing import Dict, Any
 import logging
 
@@ -15,6 +16,7 @@ except ImportError:
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=1)
 def get_email_config() -> Dict[str, Any]:
     """
     Get email configuration from environment variables.
@@ -41,6 +43,7 @@ def get_email_config() -> Dict[str, Any]:
         "admin_email": os.getenv("ADMIN_EMAIL"),  # Optional: admin email for alerts
         "mailtrap_token": os.getenv("MAILTRAP_API_TOKEN"),  # Optional: Mailtrap API token for admin emails
         "mailtrap_from_email": os.getenv("MAILTRAP_FROM_EMAIL", "hello@admin.llued.com"),  # Optional: Mailtrap sender email
-        "mailtrap_from_name": os.getenv("MAILTRAP_FROM_NAME", "Time Card Automation")  # Optional: Mailtrap sender name
+        "mailtrap_from_name": os.getenv("MAILTRAP_FROM_NAME", "Time Card Automation"),  # Optional: Mailtrap sender name
+        "batch_enabled": os.getenv("RESEND_BATCH_ENABLED", "true").lower() == "true"  # Use Resend's batch endpoint for multi-user sends
     }
 
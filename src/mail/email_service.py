@@ -5,7 +5,13 @@ Admin emails are sent via Mailtrap.
 import logging
 import base64
 import os
-from typing import List, Optional
+import threading
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Mapping, Optional, Tuple, Union
+from markupsafe import escape
+import requests
+from requests.adapters import HTTPAdapter
 from sqlalchemy.orm import Session
 from src.signoff_models import SignoffResult, SignoffUser
 from src.mail.config import get_email_config
@@ -20,6 +26,13 @@ except ImportError:
     RESEND_AVAILABLE = False
     logger.warning("Resend package not available. Email functionality will be disabled.")
 
+# Optional SIMD base64 encoder for screenshot attachments (falls back to stdlib base64)
+try:
+    import pybase64
+    PYBASE64_AVAILABLE = True
+except ImportError:
+    PYBASE64_AVAILABLE = False
+
 try:
     import mailtrap as mt
     MAILTRAP_AVAILABLE = True
@@ -28,6 +41,83 @@ except ImportError:
     logger.warning("Mailtrap package not available. Admin email functionality will be disabled.")
 
 
+if RESEND_AVAILABLE:
+    class _PooledRequestsClient(resend.HTTPClient):
+        """
+        Resend HTTP client backed by one keep-alive requests.Session.
+        
+        Resend's default client calls requests.request(), which opens a new
+        TCP+TLS connection to api.resend.com for every email.
+        """
+
+        def __init__(self, timeout: int = 30):
+            self._timeout = timeout
+            self._session = requests.Session()
+            self._session.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=20))
+
+        def request(
+            self,
+            method: str,
+            url: str,
+            headers: Mapping[str, str],
+            json: Optional[Union[Dict[str, object], List[object]]] = None,
+        ) -> Tuple[bytes, int, Mapping[str, str]]:
+            try:
+                resp = self._session.request(
+                    method=method,
+                    url=url,
+                    headers=headers,
+                    json=json,
+                    timeout=self._timeout,
+                )
+                return resp.content, resp.status_code, resp.headers
+            except requests.RequestException as e:
+                # Resend wraps this in a ResendError, same as with its default client
+                raise RuntimeError(f"Request failed: {e}") from e
+
+        def close(self):
+            """Close the pooled connections."""
+            self._session.close()
+
+
+_http_client_lock = threading.Lock()
+
+
+def _install_pooled_http_client():
+    """Make Resend send through a process-wide pooled session (idempotent)."""
+    with _http_client_lock:
+        if not isinstance(resend.default_http_client, _PooledRequestsClient):
+            resend.default_http_client = _PooledRequestsClient()
+
+
+def encode_attachment(data: bytes) -> str:
+    """
+    Encode attachment bytes for Resend.
+    
+    Resend's JSON API takes attachment content as a base64 string (or a list of
+    ints, which is far larger), so the raw bytes are encoded exactly once here,
+    with pybase64's vectorized encoder when it is installed.
+    
+    Args:
+        data: The raw file contents
+    
+    Returns:
+        The base64-encoded content
+    """
+    if PYBASE64_AVAILABLE:
+        return pybase64.b64encode_as_string(data)
+    return base64.b64encode(data).decode('ascii')
+
+
+# Sentinel for _build_signoff_params: screenshot not loaded by the caller
+_NOT_PREFETCHED = object()
+
+# Maximum emails per Resend batch request
+RESEND_BATCH_SIZE = 100
+# Maximum concurrent individual sends in send_signoff_results (within the session's pool size)
+MAX_PARALLEL_SENDS = 16
+
+
 class EmailService:
     """Service for sending emails using Resend API."""
 
@@ -36,11 +126,29 @@ class EmailService:
         if not RESEND_AVAILABLE:
             raise ImportError("Resend package is not installed. Install with: pip install resend")
         
+        # Reuse keep-alive HTTPS connections to Resend across sends and instances
+        _install_pooled_http_client()
+        
         email_config = get_email_config()
         # Set the API key at module level for Resend
         resend.api_key = email_config["api_key"]
         self.from_email = email_config["from_email"]
         self.from_name = email_config.get("from_name", "Time Card Automation")  # type: ignore
+        self.batch_enabled = email_config.get("batch_enabled", True)
+        # Admin alert (Mailtrap) settings, read once here rather than on every alert
+        self.admin_email = email_config.get("admin_email")
+        self.mailtrap_token = email_config.get("mailtrap_token")
+        self.mailtrap_from_email = email_config.get("mailtrap_from_email", "hello@demomailtrap.co")
+        self.mailtrap_from_name = email_config.get("mailtrap_from_name", "Time Card Automation")
+        # One Mailtrap client reused for every alert
+        self._mailtrap_client = None
+        if MAILTRAP_AVAILABLE and self.mailtrap_token:
+            self._mailtrap_client = mt.MailtrapClient(token=self.mailtrap_token)
+
+    def close(self):
+        """Close the pooled HTTPS connections to Resend (e.g. on application shutdown)."""
+        if isinstance(resend.default_http_client, _PooledRequestsClient):
+            resend.default_http_client.close()
 
     def _get_deletion_link(self, email: str, db_session: Optional[Session] = None) -> Optional[str]:
         """
@@ -55,7 +163,7 @@ class EmailService:
             The full URL for account deletion, or None if db_session is not provided
         """
         if db_session is None:
-            logger.warning(f"Cannot generate deletion link for {email}: database session not available")
+            logger.warning("Cannot generate deletion link for %s: database session not available", email)
             return None
         
         # Import here to avoid circular imports
@@ -63,9 +171,117 @@ class EmailService:
         try:
             return generate_deletion_magic_link(email, db_session)
         except Exception as e:
-            logger.error(f"Failed to generate deletion magic link for {email}: {e}")
+            logger.error("Failed to generate deletion magic link for %s: %s", email, e)
             return None
 
+    def _load_screenshot(self, result: SignoffResult, bucket_service=None) -> Optional[bytes]:
+        """
+        Load a result's screenshot, from the bucket first and then the local file.
+        
+        Args:
+            result: The SignoffResult whose screenshot to load
+            bucket_service: BucketService to read from (None to skip the bucket)
+        
+        Returns:
+            The screenshot bytes, or None if it is not available
+        """
+        screenshot_bytes = None
+        if bucket_service:
+            screenshot_bytes = bucket_service.get_screenshot(result.user)
+        
+        # If not in bucket, try local file
+        if not screenshot_bytes and result.screenshot_path:
+            try:
+                with open(result.screenshot_path, 'rb') as f:
+                    screenshot_bytes = f.read()
+            except Exception as local_error:
+                logger.warning("Failed to read local screenshot file: %s", local_error)
+        
+        return screenshot_bytes
+
+    def _prefetch_screenshots(self, results: List[SignoffResult]) -> Dict[int, Optional[bytes]]:
+        """
+        Load screenshots for all successful results concurrently.
+        
+        Args:
+            results: The SignoffResult objects being emailed
+        
+        Returns:
+            Mapping of index in results to screenshot bytes (None if unavailable)
+        """
+        indexes = [index for index, result in enumerate(results) if result.success]
+        if not indexes:
+            return {}
+        
+        bucket_service = get_bucket_service()
+        
+        def load(index: int) -> Optional[bytes]:
+            try:
+                return self._load_screenshot(results[index], bucket_service)
+            except Exception as e:
+                logger.warning("Failed to load screenshot for %s: %s", results[index].user.email, e)
+                return None
+        
+        with ThreadPoolExecutor(max_workers=min(MAX_PARALLEL_SENDS, len(indexes))) as executor:
+            return dict(zip(indexes, executor.map(load, indexes)))
+
+    def _build_signoff_params(
+        self,
+        result: SignoffResult,
+        db_session: Optional[Session] = None,
+        screenshot: Union[bytes, None, object] = _NOT_PREFETCHED
+    ) -> "tuple[resend.Emails.SendParams, bool]":
+        """
+        Build the Resend send params for a sign-off result email.
+        
+        Args:
+            result: The SignoffResult object containing sign-off information
+            db_session: Database session (optional - deletion link will be omitted if not provided)
+            screenshot: Already-loaded screenshot bytes (or None if unavailable); loaded here if omitted
+        
+        Returns:
+            Tuple of (params, screenshot_attached)
+        """
+        if result.success:
+            subject, html_content = self.format_success_email(result, db_session)
+        else:
+            subject, html_content = self.format_error_email(result, db_session)
+        
+        params: resend.Emails.SendParams = {
+            "from": f"{self.from_name} <{self.from_email}>",
+            "to": [result.user.email],
+            "subject": subject,
+            "html": html_content
+        }
+        
+        # Always try to attach screenshot (blue thumbs up icon) unless signoff completely failed
+        # Screenshot should be available for all successful signoffs (including "already signed off")
+        screenshot_attached = False
+        if result.success:  # Only attach screenshots for successful signoffs
+            try:
+                if screenshot is _NOT_PREFETCHED:
+                    screenshot_bytes = self._load_screenshot(result, get_bucket_service())
+                else:
+                    screenshot_bytes = screenshot
+                
+                # Attach screenshot if available (should always be available for successful signoffs)
+                if screenshot_bytes:
+                    params["attachments"] = [{
+                        "filename": f"{result.user.email}_signoff_confirmed.png",
+                        "content": encode_attachment(screenshot_bytes),
+                        "type": "image/png"
+                    }]
+                    screenshot_attached = True
+                    logger.info("Attaching blue thumbs up screenshot to email for %s", result.user.email)
+                else:
+                    logger.warning("No screenshot available for successful signoff - email sent without attachment")
+            except Exception as attach_error:
+                logger.warning("Failed to attach screenshot to email: %s", attach_error)
+                # Continue without attachment rather than failing
+        # Note: For failed signoffs, we don't attach screenshots (as per requirement)
+        
+        return params, screenshot_attached
+
     def send_signoff_result(self, result: SignoffResult, db_session: Optional[Session] = None) -> bool:
         """
         Send email to user with their sign-off result.
@@ -78,66 +294,91 @@ class EmailService:
             True if email sent successfully, False otherwise
         """
         try:
-            if result.success:
-                subject, html_content = self.format_success_email(result, db_session)
-            else:
-                subject, html_content = self.format_error_email(result, db_session)
-            
-            params: resend.Emails.SendParams = {
-                "from": f"{self.from_name} <{self.from_email}>",
-                "to": [result.user.email],
-                "subject": subject,
-                "html": html_content
-            }
-            
-            # Always try to attach screenshot (blue thumbs up icon) unless signoff completely failed
-            # Screenshot should be available for all successful signoffs (including "already signed off")
-            screenshot_attached = False
-            if result.success:  # Only attach screenshots for successful signoffs
-                try:
-                    # First try to get screenshot from bucket
-                    bucket_service = get_bucket_service()
-                    screenshot_base64 = None
-                    
-                    if bucket_service:
-                        screenshot_base64 = bucket_service.get_screenshot_base64(result.user)
-                    
-                    # If not in bucket, try local file
-                    if not screenshot_base64 and result.screenshot_path:
-                        try:
-                            with open(result.screenshot_path, 'rb') as f:
-                                screenshot_bytes = f.read()
-                                screenshot_base64 = base64.b64encode(screenshot_bytes).decode('utf-8')
-                        except Exception as local_error:
-                            logger.warning(f"Failed to read local screenshot file: {local_error}")
-                    
-                    # Attach screenshot if available (should always be available for successful signoffs)
-                    if screenshot_base64:
-                        params["attachments"] = [{
-                            "filename": f"{result.user.email}_signoff_confirmed.png",
-                            "content": screenshot_base64,
-                            "type": "image/png"
-                        }]
-                        screenshot_attached = True
-                        logger.info(f"Attaching blue thumbs up screenshot to email for {result.user.email}")
-                    else:
-                        logger.warning(f"No screenshot available for successful signoff - email sent without attachment")
-                except Exception as attach_error:
-                    logger.warning(f"Failed to attach screenshot to email: {attach_error}")
-                    # Continue without attachment rather than failing
-            # Note: For failed signoffs, we don't attach screenshots (as per requirement)
+            params, screenshot_attached = self._build_signoff_params(result, db_session)
             
             email = resend.Emails.send(params)
             
             # Resend returns a TypedDict, so access id as a dictionary key
             email_id = email.get("id", "unknown")
             attachment_note = " (with screenshot)" if screenshot_attached else ""
-            logger.info(f"Email sent successfully to {result.user.email}{attachment_note}. Email ID: {email_id}")
+            logger.info("Email sent successfully to %s%s. Email ID: %s", result.user.email, attachment_note, email_id)
+            return True
+        except Exception as e:
+            logger.error("Error sending email to %s: %s", result.user.email, e)
+            return False
+
+    def _send_prepared(self, email: str, params: "resend.Emails.SendParams") -> bool:
+        """Send one already-built email; failures are logged and reported as False."""
+        try:
+            response = resend.Emails.send(params)
+            attachment_note = " (with screenshot)" if params.get("attachments") else ""
+            logger.info("Email sent successfully to %s%s. Email ID: %s", email, attachment_note, response.get("id", "unknown"))
             return True
         except Exception as e:
-            logger.error(f"Error sending email to {result.user.email}: {e}")
+            logger.error("Error sending email to %s: %s", email, e)
             return False
 
+    def send_signoff_results(self, results: List[SignoffResult], db_session: Optional[Session] = None) -> List[bool]:
+        """
+        Send sign-off result emails to several users.
+        
+        Emails without attachments go out through Resend's batch endpoint, up to
+        RESEND_BATCH_SIZE per request. Resend's batch API does not accept attachments,
+        so emails carrying a screenshot (or all emails, if batching is disabled) are
+        sent individually, up to MAX_PARALLEL_SENDS at a time over the pooled session.
+        Screenshots are prefetched concurrently; params are then built sequentially,
+        since db_session is not thread-safe.
+        
+        Args:
+            results: The SignoffResult objects to email
+            db_session: Database session (optional - deletion links will be omitted if not provided)
+        
+        Returns:
+            List of per-result success flags, in the same order as results
+        """
+        # Fetch all screenshots up front, in parallel, so storage GETs don't run one by one
+        screenshots = self._prefetch_screenshots(results)
+        
+        sent = [False] * len(results)
+        batch: List[tuple[int, "resend.Emails.SendParams"]] = []
+        individual: List[tuple[int, "resend.Emails.SendParams"]] = []
+        for index, result in enumerate(results):
+            try:
+                params, screenshot_attached = self._build_signoff_params(
+                    result, db_session, screenshots.get(index)
+                )
+            except Exception as e:
+                logger.error("Error sending email to %s: %s", result.user.email, e)
+                continue
+            
+            if self.batch_enabled and not screenshot_attached:
+                batch.append((index, params))
+            else:
+                individual.append((index, params))
+        
+        if individual:
+            with ThreadPoolExecutor(max_workers=min(MAX_PARALLEL_SENDS, len(individual))) as executor:
+                outcomes = executor.map(
+                    lambda item: self._send_prepared(results[item[0]].user.email, item[1]),
+                    individual
+                )
+                for (index, _), ok in zip(individual, outcomes):
+                    sent[index] = ok
+        
+        for start in range(0, len(batch), RESEND_BATCH_SIZE):
+            chunk = batch[start:start + RESEND_BATCH_SIZE]
+            try:
+                response = resend.Batch.send([params for _, params in chunk])
+            except Exception as e:
+                logger.error("Error sending batch of %s email(s): %s", len(chunk), e)
+                continue
+            
+            for (index, _), email in zip(chunk, response.get("data", [])):
+                logger.info("Email sent successfully to %s. Email ID: %s", results[index].user.email, email.get("id", "unknown"))
+                sent[index] = True
+        
+        return sent
+
     def format_success_email(self, result: SignoffResult, db_session: Optional[Session] = None) -> tuple[str, str]:
         """
         Format email template for successful sign-off.
@@ -159,19 +400,19 @@ class EmailService:
         <html>
         <body style="font-family: Arial, sans-serif; line-height: 1.6; color: #333;">
             <h2 style="color: #28a745;">Time Card Sign-Off Successful</h2>
-            <p>Hello {user_name},</p>
+            <p>Hello {escape(user_name)},</p>
             <p>Your time card has been successfully signed off.</p>
             <div style="background-color: #f8f9fa; padding: 15px; border-radius: 5px; margin: 20px 0;">
-                <p><strong>Username:</strong> {result.user.username}</p>
+                <p><strong>Username:</strong> {escape(result.user.username)}</p>
                 <p><strong>Timestamp:</strong> {timestamp}</p>
                 <p><strong>Status:</strong> <span style="color: #28a745;">Success</span></p>
             </div>
-            <p>{result.message}</p>
+            <p>{escape(result.message)}</p>
             <hr style="border: none; border-top: 1px solid #eee; margin: 30px 0;">
             <p style="margin-top: 30px; color: #666; font-size: 0.9em;">
                 This is an automated message from the Time Card Sign-Off system.
             </p>
-            {f'<p style="margin-top: 20px; color: #666; font-size: 0.85em;"><a href="{deletion_link}" style="color: #dc3545; text-decoration: none;">Delete my account</a> - If you no longer wish to use this service, you can permanently delete your account using this link.</p>' if deletion_link else ''}
+            {f'<p style="margin-top: 20px; color: #666; font-size: 0.85em;"><a href="{escape(deletion_link)}" style="color: #dc3545; text-decoration: none;">Delete my account</a> - If you no longer wish to use this service, you can permanently delete your account using this link.</p>' if deletion_link else ''}
         </body>
         </html>
         """
@@ -201,23 +442,23 @@ class EmailService:
         <html>
         <body style="font-family: Arial, sans-serif; line-height: 1.6; color: #333;">
             <h2 style="color: #dc3545;">Time Card Sign-Off Failed</h2>
-            <p>Hello {user_name},</p>
+            <p>Hello {escape(user_name)},</p>
             <p>Unfortunately, there was an error signing off your time card.</p>
             <div style="background-color: #f8f9fa; padding: 15px; border-radius: 5px; margin: 20px 0;">
-                <p><strong>Username:</strong> {result.user.username}</p>
+                <p><strong>Username:</strong> {escape(result.user.username)}</p>
                 <p><strong>Timestamp:</strong> {timestamp}</p>
                 <p><strong>Status:</strong> <span style="color: #dc3545;">Failed</span></p>
             </div>
             <div style="background-color: #fff3cd; padding: 15px; border-left: 4px solid #ffc107; margin: 20px 0;">
                 <p><strong>Error Details:</strong></p>
-                <p>{error_details}</p>
+                <p>{escape(error_details)}</p>
             </div>
             <p>Please try signing off manually or contact support if the issue persists.</p>
             <hr style="border: none; border-top: 1px solid #eee; margin: 30px 0;">
             <p style="margin-top: 30px; color: #666; font-size: 0.9em;">
                 This is an automated message from the Time Card Sign-Off system.
             </p>
-            {f'<p style="margin-top: 20px; color: #666; font-size: 0.85em;"><a href="{deletion_link}" style="color: #dc3545; text-decoration: none;">Delete my account</a> - If you no longer wish to use this service, you can permanently delete your account using this link.</p>' if deletion_link else ''}
+            {f'<p style="margin-top: 20px; color: #666; font-size: 0.85em;"><a href="{escape(deletion_link)}" style="color: #dc3545; text-decoration: none;">Delete my account</a> - If you no longer wish to use this service, you can permanently delete your account using this link.</p>' if deletion_link else ''}
         </body>
         </html>
         """
@@ -234,12 +475,29 @@ class EmailService:
         Returns:
             Tuple of (subject, html_content)
         """
-        successful = sum(1 for r in results if r.success)
+        # Render rows and count successes in one pass; rows are collected and joined
+        # once (+= would copy the growing report on every row)
+        rows = []
+        successful = 0
+        for result in results:
+            successful += result.success
+            status_color = "#28a745" if result.success else "#dc3545"
+            status_text = "Success" if result.success else "Failed"
+            user_name = result.user.name or result.user.username
+            
+            rows.append(f"""
+                    <tr>
+                        <td style="padding: 10px; border: 1px solid #ddd;">{escape(user_name)}</td>
+                        <td style="padding: 10px; border: 1px solid #ddd; color: {status_color};"><strong>{status_text}</strong></td>
+                        <td style="padding: 10px; border: 1px solid #ddd;">{escape(result.message[:100])}</td>
+                    </tr>
+            """)
+        
         failed = len(results) - successful
         
         subject = f"Time Card Sign-Off Summary - {successful} Successful, {failed} Failed"
         
-        html_content = f"""
+        header = f"""
         <html>
         <body style="font-family: Arial, sans-serif; line-height: 1.6; color: #333;">
             <h2>Time Card Sign-Off Summary Report</h2>
@@ -261,20 +519,7 @@ class EmailService:
                 <tbody>
         """
         
-        for result in results:
-            status_color = "#28a745" if result.success else "#dc3545"
-            status_text = "Success" if result.success else "Failed"
-            user_name = result.user.name or result.user.username
-            
-            html_content += f"""
-                    <tr>
-                        <td style="padding: 10px; border: 1px solid #ddd;">{user_name}</td>
-                        <td style="padding: 10px; border: 1px solid #ddd; color: {status_color};"><strong>{status_text}</strong></td>
-                        <td style="padding: 10px; border: 1px solid #ddd;">{result.message[:100]}</td>
-                    </tr>
-            """
-        
-        html_content += """
+        footer = """
                 </tbody>
             </table>
             <p style="margin-top: 30px; color: #666; font-size: 0.9em;">
@@ -284,7 +529,7 @@ class EmailService:
         </html>
         """
         
-        return subject, html_content
+        return subject, "".join([header, *rows, footer])
 
     def send_magic_link(self, email: str, magic_link: str, db_session: Optional[Session] = None) -> bool:
         """
@@ -309,17 +554,17 @@ class EmailService:
                     <p>Hello,</p>
                     <p>Click the button below to set up your time card credentials:</p>
                     <div style="text-align: center; margin: 30px 0;">
-                        <a href="{magic_link}" style="background-color: #007bff; color: white; padding: 12px 24px; text-decoration: none; border-radius: 5px; display: inline-block; font-weight: bold;">Set Up Credentials</a>
+                        <a href="{escape(magic_link)}" style="background-color: #007bff; color: white; padding: 12px 24px; text-decoration: none; border-radius: 5px; display: inline-block; font-weight: bold;">Set Up Credentials</a>
                     </div>
                     <p>Or copy and paste this link into your browser:</p>
-                    <p style="word-break: break-all; background-color: #f8f9fa; padding: 10px; border-radius: 5px; font-family: monospace; font-size: 0.9em;">{magic_link}</p>
+                    <p style="word-break: break-all; background-color: #f8f9fa; padding: 10px; border-radius: 5px; font-family: monospace; font-size: 0.9em;">{escape(magic_link)}</p>
                     <p style="color: #666; font-size: 0.9em; margin-top: 30px;">
                         <strong>Note:</strong> This link will expire in 24 hours.
                     </p>
                     <p style="color: #666; font-size: 0.9em; margin-top: 20px;">
                         If you did not request this link, please ignore this email.
                     </p>
-                    {f'<hr style="border: none; border-top: 1px solid #eee; margin: 30px 0;"><p style="margin-top: 20px; color: #666; font-size: 0.85em;"><a href="{deletion_link}" style="color: #dc3545; text-decoration: none;">Delete my account</a> - If you no longer wish to use this service, you can permanently delete your account using this link.</p>' if deletion_link else ''}
+                    {f'<hr style="border: none; border-top: 1px solid #eee; margin: 30px 0;"><p style="margin-top: 20px; color: #666; font-size: 0.85em;"><a href="{escape(deletion_link)}" style="color: #dc3545; text-decoration: none;">Delete my account</a> - If you no longer wish to use this service, you can permanently delete your account using this link.</p>' if deletion_link else ''}
                 </div>
             </body>
             </html>
@@ -334,10 +579,10 @@ class EmailService:
             
             email_result = resend.Emails.send(params)
             email_id = email_result.get("id", "unknown")
-            logger.info(f"Magic link email sent successfully to {email}. Email ID: {email_id}")
+            logger.info("Magic link email sent successfully to %s. Email ID: %s", email, email_id)
             return True
         except Exception as e:
-            logger.error(f"Error sending magic link email to {email}: {e}")
+            logger.error("Error sending magic link email to %s: %s", email, e)
             return False
 
     def send_credentials_confirmation(self, email: str, first_name: Optional[str] = None, db_session: Optional[Session] = None) -> bool:
@@ -362,7 +607,7 @@ class EmailService:
             <body style="font-family: Arial, sans-serif; line-height: 1.6; color: #333;">
                 <div style="max-width: 600px; margin: 0 auto; padding: 20px;">
                     <h2 style="color: #28a745;">✓ Credentials Saved Successfully</h2>
-                    <p>Hello {user_name},</p>
+                    <p>Hello {escape(user_name)},</p>
                     <p>Your time card credentials have been successfully saved and encrypted.</p>
                     <p>Your account is now set up and ready for automated time card sign-off.</p>
                     <div style="background-color: #f8f9fa; padding: 15px; border-radius: 5px; margin: 20px 0;">
@@ -373,7 +618,7 @@ class EmailService:
                             <li>You'll receive email notifications for each sign-off attempt</li>
                         </ul>
                     </div>
-                    {f'<hr style="border: none; border-top: 1px solid #eee; margin: 30px 0;"><p style="margin-top: 20px; color: #666; font-size: 0.85em;"><a href="{deletion_link}" style="color: #dc3545; text-decoration: none;">Delete my account</a> - If you no longer wish to use this service, you can permanently delete your account using this link.</p>' if deletion_link else ''}
+                    {f'<hr style="border: none; border-top: 1px solid #eee; margin: 30px 0;"><p style="margin-top: 20px; color: #666; font-size: 0.85em;"><a href="{escape(deletion_link)}" style="color: #dc3545; text-decoration: none;">Delete my account</a> - If you no longer wish to use this service, you can permanently delete your account using this link.</p>' if deletion_link else ''}
                 </div>
             </body>
             </html>
@@ -388,10 +633,10 @@ class EmailService:
             
             email_result = resend.Emails.send(params)
             email_id = email_result.get("id", "unknown")
-            logger.info(f"Credentials confirmation email sent successfully to {email}. Email ID: {email_id}")
+            logger.info("Credentials confirmation email sent successfully to %s. Email ID: %s", email, email_id)
             return True
         except Exception as e:
-            logger.error(f"Error sending credentials confirmation email to {email}: {e}")
+            logger.error("Error sending credentials confirmation email to %s: %s", email, e)
             return False
 
     def send_admin_alert(self, subject: str, message: str, error_details: Optional[str] = None) -> bool:
@@ -412,15 +657,13 @@ class EmailService:
                 logger.warning("Mailtrap package not available. Admin alerts will not be sent.")
                 return False
             
-            email_config = get_email_config()
-            admin_email = email_config.get("admin_email")
-            mailtrap_token = email_config.get("mailtrap_token")
+            admin_email = self.admin_email
             
             if not admin_email:
                 logger.warning("ADMIN_EMAIL not configured. Admin alerts will not be sent.")
                 return False
             
-            if not mailtrap_token:
+            if not self.mailtrap_token:
                 logger.warning("MAILTRAP_API_TOKEN not configured. Admin alerts will not be sent.")
                 return False
             
@@ -429,10 +672,10 @@ class EmailService:
             <html>
             <body style="font-family: Arial, sans-serif; line-height: 1.6; color: #333;">
                 <div style="max-width: 600px; margin: 0 auto; padding: 20px;">
-                    <h2 style="color: #dc3545;">⚠️ Admin Alert: {subject}</h2>
+                    <h2 style="color: #dc3545;">⚠️ Admin Alert: {escape(subject)}</h2>
                     <div style="background-color: #fff3cd; padding: 15px; border-left: 4px solid #ffc107; margin: 20px 0;">
                         <p style="margin: 0;"><strong>Message:</strong></p>
-                        <p style="margin: 10px 0 0 0;">{message}</p>
+                        <p style="margin: 10px 0 0 0;">{escape(message)}</p>
                     </div>
             """
             
@@ -440,7 +683,7 @@ class EmailService:
                 html_content += f"""
                     <div style="background-color: #f8f9fa; padding: 15px; border-radius: 5px; margin: 20px 0;">
                         <p style="margin: 0;"><strong>Error Details:</strong></p>
-                        <pre style="background-color: #ffffff; padding: 10px; border: 1px solid #ddd; border-radius: 3px; overflow-x: auto; font-size: 0.85em; white-space: pre-wrap; word-wrap: break-word;">{error_details}</pre>
+                        <pre style="background-color: #ffffff; padding: 10px; border: 1px solid #ddd; border-radius: 3px; overflow-x: auto; font-size: 0.85em; white-space: pre-wrap; word-wrap: break-word;">{escape(error_details)}</pre>
                     </div>
                 """
             
@@ -459,13 +702,9 @@ class EmailService:
                 text_content += f"\nError Details:\n{error_details}\n"
             text_content += "\nThis is an automated alert from the Time Card Sign-Off system."
             
-            # Get Mailtrap configuration
-            mailtrap_from_email = email_config.get("mailtrap_from_email", "hello@demomailtrap.co")
-            mailtrap_from_name = email_config.get("mailtrap_from_name", "Time Card Automation")
-            
             # Create Mailtrap mail object
             mail = mt.Mail(
-                sender=mt.Address(email=mailtrap_from_email, name=mailtrap_from_name),
+                sender=mt.Address(email=self.mailtrap_from_email, name=self.mailtrap_from_name),
                 to=[mt.Address(email=admin_email)],
                 subject=f"[ALERT] {subject}",
                 text=text_content,
@@ -474,12 +713,25 @@ class EmailService:
             )
             
             # Send via Mailtrap
-            client = mt.MailtrapClient(token=mailtrap_token)
-            response = client.send(mail)
+            response = self._mailtrap_client.send(mail)
             
-            logger.info(f"Admin alert email sent successfully to {admin_email} via Mailtrap. Response: {response}")
+            logger.info("Admin alert email sent successfully to %s via Mailtrap. Response: %s", admin_email, response)
             return True
         except Exception as e:
-            logger.error(f"Error sending admin alert email via Mailtrap: {e}")
+            logger.error("Error sending admin alert email via Mailtrap: %s", e)
             return False
 
+
+@lru_cache(maxsize=1)
+def get_shared_email_service() -> EmailService:
+    """
+    Get the process-wide EmailService (created on first call).
+    Use this rather than EmailService() so every caller shares one configured
+    instance and its pooled connections. Call get_shared_email_service.cache_clear()
+    to rebuild it (e.g. in tests after changing configuration).
+    
+    Raises:
+        ImportError: If the Resend package is not installed
+        ValueError: If email configuration is missing
+    """
+    return EmailService()
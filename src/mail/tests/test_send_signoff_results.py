@@ -0,0 +1,146 @@
+"""
+Tests for batching sign-off result emails and reporting per-result failures.
+
+Resend is replaced with recording stand-ins, so nothing is sent.
+
+Run from the project root:
+
+```
+python -m pytest src/mail/tests/test_send_signoff_results.py
+```
+"""
+from datetime import datetime
+
+import pytest
+
+from src.mail import email_service as email_service_module
+from src.mail.email_service import EmailService, RESEND_BATCH_SIZE
+from src.signoff_models import SignoffResult, SignoffUser
+from src.signoff_timecard import send_result_emails
+
+
+def _result(index: int, success: bool = True) -> SignoffResult:
+    user = SignoffUser(username="", password="", email=f"user{index}@example.com")
+    return SignoffResult(user=user, success=success, message="ok", timestamp=datetime.now())
+
+
+class _Batch:
+    """Stand-in for resend.Batch recording each batch request."""
+
+    def __init__(self, fail_on_call=None):
+        self.calls = []
+        self.fail_on_call = fail_on_call
+
+    def send(self, params):
+        self.calls.append([p["to"][0] for p in params])
+        if len(self.calls) == self.fail_on_call:
+            raise RuntimeError("Resend unavailable")
+        return {"data": [{"id": f"email-{i}"} for i in range(len(params))]}
+
+
+@pytest.fixture
+def service(monkeypatch):
+    service = object.__new__(EmailService)
+    service.batch_enabled = True
+    service.individually_sent = []
+    service.attach_for = set()
+    service.build_fails_for = set()
+    service.send_fails_for = set()
+
+    def build(result, db_session=None, screenshot=None):
+        if result.user.email in service.build_fails_for:
+            raise ValueError("template error")
+        params = {"to": [result.user.email], "subject": "Sign-off", "html": ""}
+        return params, result.user.email in service.attach_for
+
+    def send_prepared(email, params):
+        service.individually_sent.append(email)
+        return email not in service.send_fails_for
+
+    monkeypatch.setattr(service, "_prefetch_screenshots", lambda results: {})
+    monkeypatch.setattr(service, "_build_signoff_params", build)
+    monkeypatch.setattr(service, "_send_prepared", send_prepared)
+    return service
+
+
+@pytest.fixture
+def batch(monkeypatch):
+    batch = _Batch()
+    monkeypatch.setattr(email_service_module.resend, "Batch", batch)
+    return batch
+
+
+def test_batches_are_chunked_by_resend_limit(service, batch):
+    results = [_result(i) for i in range(RESEND_BATCH_SIZE * 2 + 50)]
+
+    sent = service.send_signoff_results(results)
+
+    assert [len(call) for call in batch.calls] == [RESEND_BATCH_SIZE, RESEND_BATCH_SIZE, 50]
+    assert [email for call in batch.calls for email in call] == [r.user.email for r in results]
+    assert sent == [True] * len(results)
+    assert service.individually_sent == []
+
+
+def test_failed_batch_only_fails_its_own_results(service, monkeypatch):
+    batch = _Batch(fail_on_call=2)
+    monkeypatch.setattr(email_service_module.resend, "Batch", batch)
+    results = [_result(i) for i in range(RESEND_BATCH_SIZE + 10)]
+
+    sent = service.send_signoff_results(results)
+
+    assert sent == [True] * RESEND_BATCH_SIZE + [False] * 10
+
+
+def test_attachments_and_disabled_batching_send_individually(service, batch):
+    results = [_result(i) for i in range(4)]
+    service.attach_for = {"user1@example.com"}
+    service.send_fails_for = {"user1@example.com"}
+
+    sent = service.send_signoff_results(results)
+
+    assert service.individually_sent == ["user1@example.com"]
+    assert batch.calls == [["user0@example.com", "user2@example.com", "user3@example.com"]]
+    assert sent == [True, False, True, True]
+
+    service.batch_enabled = False
+    service.individually_sent = []
+    sent = service.send_signoff_results(results)
+    assert sorted(service.individually_sent) == [r.user.email for r in results]
+    assert len(batch.calls) == 1
+
+
+def test_build_failure_is_reported_for_that_result(service, batch):
+    results = [_result(i) for i in range(3)]
+    service.build_fails_for = {"user2@example.com"}
+
+    assert service.send_signoff_results(results) == [True, True, False]
+
+
+class _ResultsService:
+    def __init__(self, outcome):
+        self.outcome = outcome
+
+    def send_signoff_results(self, results):
+        if isinstance(self.outcome, Exception):
+            raise self.outcome
+        return self.outcome
+
+
+def test_send_result_emails_counts_each_failed_send(caplog):
+    results = [_result(i) for i in range(3)]
+
+    failed = send_result_emails(_ResultsService([True, False, False]), results)
+
+    assert failed == 2
+    assert "user1@example.com" in caplog.text
+    assert "user2@example.com" in caplog.text
+
+
+def test_send_result_emails_counts_everything_failed_on_error():
+    results = [_result(i) for i in range(3)]
+    assert send_result_emails(_ResultsService(RuntimeError("boom")), results) == 3
+
+
+def test_send_result_emails_without_service_or_results():
+    assert send_result_emails(None, [_result(0)]) == 0
+    assert send_result_emails(_ResultsService([]), []) == 0
@@ -0,0 +1,188 @@
+"""
+Long-lived Playwright browser pool for credential validation.
+
+One Chromium instance is launched per web worker process and hands out
+pre-warmed browser contexts, so a validation only pays for navigation
+instead of a full browser launch.
+"""
+import asyncio
+import hashlib
+import hmac
+import logging
+import secrets
+import time
+from typing import Any, Dict, Optional, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from playwright.async_api import Playwright, Browser, BrowserContext
+
+logger = logging.getLogger(__name__)
+
+
+class BrowserPool:
+    """Pool of isolated browser contexts backed by a single Chromium browser."""
+
+    def __init__(self, size: int = 2, headless: bool = True, slow_mo: int = 0):
+        """
+        Args:
+            size: Number of pre-warmed contexts (also the max concurrent validations)
+            headless: Launch Chromium headless
+            slow_mo: Slow down Playwright operations by this many milliseconds
+        """
+        self.size = size
+        self.headless = headless
+        self.slow_mo = slow_mo
+        self._playwright: Optional["Playwright"] = None
+        self._browser: Optional["Browser"] = None
+        # A None entry is a free slot whose context must be created on acquire
+        self._queue: "asyncio.Queue[Optional[BrowserContext]]" = asyncio.Queue()
+        # Serializes relaunching Chromium after it crashes or is killed
+        self._relaunch_lock = asyncio.Lock()
+
+    async def start(self) -> None:
+        """Launch Chromium and pre-warm the contexts."""
+        # Imported here so importing this module doesn't load the Playwright driver
+        from playwright.async_api import async_playwright
+        
+        self._playwright = await async_playwright().start()
+        self._browser = await self._playwright.chromium.launch(
+            headless=self.headless, slow_mo=self.slow_mo
+        )
+        for _ in range(self.size):
+            self._queue.put_nowait(await self._browser.new_context())
+        logger.info("Browser pool started with %s contexts", self.size)
+
+    @property
+    def browser(self) -> "Browser":
+        """The shared browser, for one-off contexts (e.g. with storage state)."""
+        return self._browser
+
+    async def get_browser(self) -> "Browser":
+        """The shared browser, relaunched first if it has crashed or been killed."""
+        await self._ensure_browser()
+        return self._browser
+
+    async def _ensure_browser(self) -> None:
+        """
+        Relaunch Chromium if it is no longer connected (e.g. OOM-killed).
+        
+        Contexts from the dead browser are dropped lazily by acquire()/release().
+        """
+        if self._browser is not None and self._browser.is_connected():
+            return
+        async with self._relaunch_lock:
+            # Another waiter may have relaunched it already
+            if self._browser is not None and self._browser.is_connected():
+                return
+            logger.warning("Pooled browser is disconnected, relaunching Chromium")
+            try:
+                self._browser = await self._playwright.chromium.launch(
+                    headless=self.headless, slow_mo=self.slow_mo
+                )
+            except Exception:
+                # The Playwright driver may have died with the browser; restart it too
+                from playwright.async_api import async_playwright
+                try:
+                    await self._playwright.stop()
+                except Exception:
+                    pass
+                self._playwright = await async_playwright().start()
+                self._browser = await self._playwright.chromium.launch(
+                    headless=self.headless, slow_mo=self.slow_mo
+                )
+
+    def _is_live(self, context: "BrowserContext") -> bool:
+        """Whether a context belongs to the current, connected browser."""
+        return context.browser is self._browser and self._browser.is_connected()
+
+    async def acquire(self) -> "BrowserContext":
+        """Wait for a free context and return it. Must be given back with release()."""
+        context = await self._queue.get()
+        try:
+            await self._ensure_browser()
+            if context is not None and not self._is_live(context):
+                # Left over from a browser that has since died
+                context = None
+            if context is None:
+                context = await self._browser.new_context()
+        except Exception:
+            self._queue.put_nowait(None)
+            raise
+        return context
+
+    async def release(self, context: "BrowserContext") -> None:
+        """Discard a used context (dropping its cookies/storage) and refill its slot."""
+        if not self._is_live(context):
+            # Its browser is gone; the slot is refilled on the next acquire()
+            self._queue.put_nowait(None)
+            return
+        try:
+            await context.close()
+        except Exception as e:
+            logger.warning("Failed to close browser context: %s", e)
+        try:
+            self._queue.put_nowait(await self._browser.new_context())
+        except Exception as e:
+            logger.warning("Failed to pre-warm replacement browser context: %s", e)
+            self._queue.put_nowait(None)
+
+    async def close(self) -> None:
+        """Close all contexts, the browser, and Playwright."""
+        while not self._queue.empty():
+            context = self._queue.get_nowait()
+            if context is not None:
+                try:
+                    await context.close()
+                except Exception:
+                    pass
+        if self._browser:
+            try:
+                await self._browser.close()
+            except Exception as e:
+                logger.warning("Error closing pooled browser: %s", e)
+        if self._playwright:
+            await self._playwright.stop()
+        logger.info("Browser pool closed")
+
+
+class LoginSessionCache:
+    """
+    Short-lived cache of portal session state after successful logins.
+    
+    Entries are keyed by an HMAC of the credentials with a per-process random
+    key, so neither the credentials nor an unsalted hash of them is held.
+    """
+
+    def __init__(self, ttl_seconds: float = 300, maxsize: int = 256):
+        self.ttl_seconds = ttl_seconds
+        self.maxsize = maxsize
+        self._hmac_key = secrets.token_bytes(32)
+        self._entries: Dict[str, Tuple[Dict[str, Any], str, float]] = {}
+
+    def key(self, username: str, password: str) -> str:
+        """Derive the cache key for a username/password pair."""
+        return hmac.new(
+            self._hmac_key, f"{username}\x00{password}".encode("utf-8"), hashlib.sha256
+        ).hexdigest()
+
+    def get(self, key: str) -> Optional[Tuple[Dict[str, Any], str]]:
+        """Return (storage_state, dashboard_url) if cached and fresh, else None."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        storage_state, dashboard_url, expires_at = entry
+        if time.monotonic() > expires_at:
+            self._entries.pop(key, None)
+            return None
+        return storage_state, dashboard_url
+
+    def put(self, key: str, storage_state: Dict[str, Any], dashboard_url: str) -> None:
+        """Cache the session state captured after a successful login."""
+        if len(self._entries) >= self.maxsize:
+            # Drop the oldest entry (dicts keep insertion order)
+            self._entries.pop(next(iter(self._entries)))
+        self._entries[key] = (storage_state, dashboard_url, time.monotonic() + self.ttl_seconds)
+
+    def discard(self, key: str) -> None:
+        """Forget a cached session (e.g. it no longer authenticates)."""
+        self._entries.pop(key, None)
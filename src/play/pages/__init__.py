@@ -5,6 +5,9 @@ from .login_page import LoginPage
 from .dashboard_page import DashboardPage
 from .employee_page import EmployeePage
 from .signoff_confirmation_page import SignOffConfirmationPage
+from .async_base_page import AsyncBasePage
+from .async_login_page import AsyncLoginPage
+from .async_dashboard_page import AsyncDashboardPage
 
 __all__ = [
     "BasePage",
@@ -12,5 +15,8 @@ __all__ = [
     "DashboardPage",
     "EmployeePage",
     "SignOffConfirmationPage",
+    "AsyncBasePage",
+    "AsyncLoginPage",
+    "AsyncDashboardPage",
 ]
 
@@ -0,0 +1,67 @@
+"""
+Async page object model for the API Base Page.
+Mirrors the parts of BasePage needed when driving Playwright's async API
+from the FastAPI event loop.
+"""
+
+from playwright.async_api import Page, Locator
+from typing import Callable, Union
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncBasePage:
+    """Represents the Base page (async API)"""
+
+    def __init__(self, page: Page) -> None:
+        self.page = page
+
+    async def wait_for_element(
+        self,
+        locator_or_getter: Union[Locator, Callable[[], Locator]],
+        state: str = "visible",
+        timeout: int = 10000
+    ) -> Locator:
+        """
+        Wait for an element to reach a specific state.
+        
+        Args:
+            locator_or_getter: Either a Locator or a callable (e.g., property) that returns a Locator
+            state: The state to wait for - "visible", "attached", "detached", "hidden" (default: "visible")
+            timeout: Maximum time to wait in milliseconds (default: 10000)
+        
+        Returns:
+            The Locator that was waited for (useful for chaining)
+        
+        Raises:
+            TimeoutError: If element doesn't reach the state within timeout
+        """
+        if callable(locator_or_getter):
+            locator = locator_or_getter()
+        else:
+            locator = locator_or_getter
+        
+        await locator.wait_for(state=state, timeout=timeout)
+        return locator
+
+    async def is_element_visible(
+            self,
+            locator_or_getter: Union[Locator, Callable[[], Locator]],
+            timeout: int = 5000
+        ) -> bool:
+        """
+        Check if an element is visible on the page (Non-blocking check).
+        
+        Args:
+            locator_or_getter: eiter a Locator or a calllable that returns a Locator
+            timeout: Maximum time to wait in milliseconds
+        
+        Returns:
+            True if element is visible, False otherwise
+        """
+        try:
+            await self.wait_for_element(locator_or_getter, state='visible', timeout=timeout)
+            return True
+        except Exception:
+            return False
@@ -0,0 +1,24 @@
+"""
+Async Page Object Model for API Healthcare Dashboard Page.
+Used by the FastAPI credential validation, which runs on the event loop.
+"""
+from playwright.async_api import Page, Locator
+from src.play.pages.async_base_page import AsyncBasePage
+
+
+class AsyncDashboardPage(AsyncBasePage):
+    """Represents the Dashboard page after login (async API)."""
+
+    def __init__(self, page: Page):
+        super().__init__(page)
+
+    async def wait_for_dashboard_load(self, timeout: int = 10000) -> None:
+        """Wait for the dashboard to load completely."""
+        # Wait for navigation bar - this is the reliable check
+        await self.wait_for_element(self.nav_bar, timeout=timeout)
+
+    @property
+    def nav_bar(self) -> Locator:
+        """Get the navigation bar element."""
+        # PrimeNG menubar with id navBar
+        return self.page.locator("#navBar, .primary-navbar").first
@@ -0,0 +1,73 @@
+"""
+Async Page Object Model for API Healthcare Login Page.
+Used by the FastAPI credential validation, which runs on the event loop.
+"""
+from playwright.async_api import Page, Locator
+from typing import Literal
+
+from src.play.pages.async_base_page import AsyncBasePage
+
+
+class AsyncLoginPage(AsyncBasePage):
+    """Represents the API Healthcare login page (async API)."""
+    
+    # Domain options available on the login page
+    Domain = Literal["LLU Network", "MC Network", "System Authentication"]
+    
+    def __init__(self, page: Page):
+        self.page = page
+        self._login_url = "/APIHC/TASS/WebPortal/APIHealthcare_LLCA419_Live_External/Login.aspx"
+    
+    async def goto(self, base_url: str = None) -> None:
+        """
+        Navigate to the login page.
+        
+        Args:
+            base_url: Optional base URL. If not provided, uses relative path.
+        """
+        if base_url:
+            await self.page.goto(f"{base_url}{self._login_url}")
+        else:
+            await self.page.goto(self._login_url)
+    
+    @property
+    def username_input(self) -> Locator:
+        """Get the username input field."""
+        return self.page.locator("#formContentPlaceHolder_userNameField").first
+    
+    @property
+    def password_input(self) -> Locator:
+        """Get the password input field."""
+        return self.page.locator("#formContentPlaceHolder_passwordField").first
+    
+    @property
+    def domain_select(self) -> Locator:
+        """Get the domain dropdown selector."""
+        return self.page.locator("#formContentPlaceHolder_directoryField").first
+    
+    @property
+    def sign_in_button(self) -> Locator:
+        """Get the Sign In button."""
+        return self.page.get_by_role("button", name="Sign In").or_(
+            self.page.locator("#formContentPlaceHolder_loginApiButton")
+        ).first
+    
+    async def login(self, username: str, password: str, domain: Domain = "MC Network") -> None:
+        """
+        Perform complete login flow.
+        
+        Args:
+            username: Username to login with
+            password: Password to login with
+            domain: Domain to select (default: "MC Network")
+        """
+        await self.username_input.fill(username)
+        await self.password_input.fill(password)
+        await self.domain_select.select_option(label=domain)
+        await self.sign_in_button.click()
+    
+    async def wait_for_page_load(self) -> None:
+        """Wait for the login page to load completely."""
+        # Username input may have display:none initially, so wait for "attached"
+        await self.wait_for_element(self.username_input, state="attached")
+        await self.wait_for_element(self.sign_in_button, state="attached")
@@ -44,7 +44,7 @@ class BasePage:
         
         screenshot_path = screenshot_dir / filename
         self.page.screenshot(path=str(screenshot_path), full_page=full_page)
-        logger.info(f"Screenshot saved to {screenshot_path}")
+        logger.info("Screenshot saved to %s", screenshot_path)
         return str(screenshot_path)
 
     def handle_alert(self, accept: bool = True, prompt_text: Optional[str] = None) -> Optional[str]:
@@ -72,7 +72,7 @@ class BasePage:
                 
                 return message
         except Exception as e:
-            logger.error(f"Error handling alert: {e}")
+            logger.error("Error handling alert: %s", e)
             return None
 
     def is_element_visible(
@@ -100,7 +100,7 @@ class DashboardPage(BasePage):
             self.wait_for_element(employee_tab_li, timeout=30000)
             logger.info("Successfully navigated to Employee page")
         except Exception as e:
-            logger.error(f"Error navigating to Employee tab: {e}")
+            logger.error("Error navigating to Employee tab: %s", e)
             raise
 
     def navigate_to_tab(self, tab_name: str) -> None:
@@ -115,16 +115,16 @@ class DashboardPage(BasePage):
         try:
             # Check if already active
             if self.is_tab_active(tab_name):
-                logger.info(f"{tab_name} tab is already active")
+                logger.info("%s tab is already active", tab_name)
                 return
             
-            logger.info(f"Navigating to {tab_name} tab")
+            logger.info("Navigating to %s tab", tab_name)
             # Verify the tab exists and is clickable (should be inactive-menu initially)
             tab_inactive = self.page.locator(
                 f"#navBar li.p-menuitem.inactive-menu:has(a:has(span.p-menuitem-text:has-text('{tab_name}')))"
             ).first
             if not tab_inactive.is_visible(timeout=5000):
-                logger.warning(f"{tab_name} tab not found in inactive state, proceeding anyway")
+                logger.warning("%s tab not found in inactive state, proceeding anyway", tab_name)
             
             tab_locator = self.page.locator(
                 f"#navBar a[role='menuitem']:has(span.p-menuitem-text:has-text('{tab_name}'))"
@@ -137,9 +137,9 @@ class DashboardPage(BasePage):
                 f"#navBar li.p-menuitem.active-menu:has(a:has(span.p-menuitem-text:has-text('{tab_name}')))"
             )
             self.wait_for_element(tab_li, timeout=30000)
-            logger.info(f"Successfully navigated to {tab_name} page")
+            logger.info("Successfully navigated to %s page", tab_name)
         except Exception as e:
-            logger.error(f"Error navigating to {tab_name} tab: {e}")
+            logger.error("Error navigating to %s tab: %s", tab_name, e)
             raise
 
     def is_tab_active(self, tab_name: str) -> bool:
@@ -179,7 +179,7 @@ class EmployeePage(BasePage):
             logger.info("New window opened for sign-off confirmation")
             return new_page
         except Exception as e:
-            logger.error(f"Error clicking Employee sign Off button: {e}")
+            logger.error("Error clicking Employee sign Off button: %s", e)
             self.take_screenshot("employee_sign_off_error")
             raise
 
@@ -212,7 +212,7 @@ class EmployeePage(BasePage):
             if icon_locator.count() > 0:
                 calc_icon = icon_locator.first
                 found_in_frame = "Employee Navigator_iframe"
-                logger.info(f"Found calculator icon in iframe: {found_in_frame}")
+                logger.info("Found calculator icon in iframe: %s", found_in_frame)
             else:
                 # Try without title filter as fallback
                 frame_locator = self.page.frame_locator('iframe[id="Employee Navigator_iframe"]')
@@ -220,11 +220,11 @@ class EmployeePage(BasePage):
                 if icon_locator.count() > 0:
                     calc_icon = icon_locator.first
                     found_in_frame = "Employee Navigator_iframe"
-                    logger.info(f"Found calculator icon in iframe (without title filter): {found_in_frame}")
+                    logger.info("Found calculator icon in iframe (without title filter): %s", found_in_frame)
                 else:
                     calc_icon = None
         except Exception as e:
-            logger.debug(f"Error getting calculator icon: {e}")
+            logger.debug("Error getting calculator icon: %s", e)
             calc_icon = None
         
         # Fallback: If not found in iframe, try main page
@@ -249,11 +249,11 @@ class EmployeePage(BasePage):
             try:
                 iframe_element = self.page.locator(f'iframe[id="{found_in_frame}"]')
                 iframe_element.scroll_into_view_if_needed(timeout=5000)
-                logger.debug(f"Scrolled iframe {found_in_frame} into view")
+                logger.debug("Scrolled iframe %s into view", found_in_frame)
                 # Small delay to let iframe settle after scrolling
                 self.page.wait_for_timeout(200)
             except Exception as e:
-                logger.debug(f"Could not scroll iframe into view: {e}")
+                logger.debug("Could not scroll iframe into view: %s", e)
         
         # Wait for icon to be visible and attached
         try:
@@ -263,7 +263,7 @@ class EmployeePage(BasePage):
                 # Try scrolling it into view
                 calc_icon.first.scroll_into_view_if_needed(timeout=5000)
         except Exception as e:
-            logger.warning(f"Error waiting for calculator icon: {e}")
+            logger.warning("Error waiting for calculator icon: %s", e)
             return self.take_screenshot("calc_tooltip_wait_error")
         
         # Get the tooltip text from the title attribute BEFORE hovering
@@ -273,20 +273,20 @@ class EmployeePage(BasePage):
         try:
             tooltip_text = calc_icon.first.get_attribute("title")
             if tooltip_text:
-                logger.info(f"Found tooltip text: {tooltip_text}")
+                logger.info("Found tooltip text: %s", tooltip_text)
             else:
                 logger.warning("No title attribute found on calculator icon")
         except Exception as e:
-            logger.warning(f"Could not get tooltip text: {e}")
+            logger.warning("Could not get tooltip text: %s", e)
         
         # Get the bounding box of the icon to position the tooltip
         icon_bbox = None
         try:
             icon_bbox = calc_icon.first.bounding_box()
             if icon_bbox:
-                logger.debug(f"Icon bounding box: {icon_bbox}")
+                logger.debug("Icon bounding box: %s", icon_bbox)
         except Exception as e:
-            logger.warning(f"Could not get icon bounding box: {e}")
+            logger.warning("Could not get icon bounding box: %s", e)
         
         # Hover over the icon to trigger any hover STATES (ie underlined text)
         # Will not need for the blue thumbs up icon, as it will not have any hover states
@@ -297,7 +297,7 @@ class EmployeePage(BasePage):
             calc_icon.first.hover(timeout=10000)
             logger.debug("Hover successful")
         except Exception as e:
-            logger.warning(f"Error hovering over calculator icon: {e}")
+            logger.warning("Error hovering over calculator icon: %s", e)
             # Take screenshot anyway
             return self.take_screenshot("calc_tooltip_hover_error")
         
@@ -362,7 +362,7 @@ class EmployeePage(BasePage):
                 self.page.wait_for_timeout(100)
                 
             except Exception as e:
-                logger.warning(f"Could not create custom tooltip: {e}")
+                logger.warning("Could not create custom tooltip: %s", e)
                 import traceback
                 traceback.print_exc()
         
@@ -382,7 +382,7 @@ class EmployeePage(BasePage):
             self.page.evaluate(remove_tooltip_js)
             logger.debug("Removed custom tooltip from DOM")
         except Exception as e:
-            logger.debug(f"Could not remove tooltip: {e}")
+            logger.debug("Could not remove tooltip: %s", e)
         
         return screenshot_path
 
@@ -423,7 +423,7 @@ class EmployeePage(BasePage):
             if icon_locator.count() > 0:
                 thumbs_up_icon = icon_locator.first
                 found_in_frame = "Employee Navigator_iframe"
-                logger.info(f"Found blue thumbs up icon in iframe: {found_in_frame}")
+                logger.info("Found blue thumbs up icon in iframe: %s", found_in_frame)
             else:
                 # Try without title filter as fallback
                 logger.info("Trying to find blue thumbs up icon without title filter...")
@@ -432,11 +432,11 @@ class EmployeePage(BasePage):
                 if icon_locator.count() > 0:
                     thumbs_up_icon = icon_locator.first
                     found_in_frame = "Employee Navigator_iframe"
-                    logger.info(f"Found blue thumbs up icon in iframe (without title filter): {found_in_frame}")
+                    logger.info("Found blue thumbs up icon in iframe (without title filter): %s", found_in_frame)
                 else:
                     thumbs_up_icon = None
         except Exception as e:
-                logger.warning(f"Error finding blue thumbs up icon: {e}")
+                logger.warning("Error finding blue thumbs up icon: %s", e)
                 thumbs_up_icon = None
         
         # Check if we found the icon
@@ -451,11 +451,11 @@ class EmployeePage(BasePage):
             try:
                 iframe_element = self.page.locator(f'iframe[id="{found_in_frame}"]')
                 iframe_element.scroll_into_view_if_needed(timeout=5000)
-                logger.debug(f"Scrolled iframe {found_in_frame} into view")
+                logger.debug("Scrolled iframe %s into view", found_in_frame)
                 # Small delay to let iframe settle after scrolling
                 self.page.wait_for_timeout(200)
             except Exception as e:
-                logger.debug(f"Could not scroll iframe into view: {e}")
+                logger.debug("Could not scroll iframe into view: %s", e)
         
         # Wait for icon to be visible and attached
         try:
@@ -465,7 +465,7 @@ class EmployeePage(BasePage):
                 # Try scrolling it into view
                 thumbs_up_icon.first.scroll_into_view_if_needed(timeout=5000)
         except Exception as e:
-            logger.warning(f"Error waiting for blue thumbs up icon: {e}")
+            logger.warning("Error waiting for blue thumbs up icon: %s", e)
             return self.take_screenshot("blue_thumbs_up_wait_error")
         
         # Get the tooltip text from the title attribute BEFORE hovering
@@ -475,20 +475,20 @@ class EmployeePage(BasePage):
         try:
             tooltip_text = thumbs_up_icon.first.get_attribute("title")
             if tooltip_text:
-                logger.info(f"Found tooltip text: {tooltip_text}")
+                logger.info("Found tooltip text: %s", tooltip_text)
             else:
                 logger.warning("No title attribute found on blue thumbs up icon")
         except Exception as e:
-            logger.warning(f"Could not get tooltip text: {e}")
+            logger.warning("Could not get tooltip text: %s", e)
         
         # Get the bounding box of the icon to position the tooltip
         icon_bbox = None
         try:
             icon_bbox = thumbs_up_icon.first.bounding_box()
             if icon_bbox:
-                logger.debug(f"Icon bounding box: {icon_bbox}")
+                logger.debug("Icon bounding box: %s", icon_bbox)
         except Exception as e:
-            logger.warning(f"Could not get icon bounding box: {e}")
+            logger.warning("Could not get icon bounding box: %s", e)
             # Take screenshot anyway
             return self.take_screenshot("blue_thumbs_up_tooltip_text_error")
         
@@ -553,7 +553,7 @@ class EmployeePage(BasePage):
                 # Small delay to ensure tooltip is rendered
                 self.page.wait_for_timeout(100)
             except Exception as e:
-                logger.warning(f"Could not create custom tooltip: {e}")
+                logger.warning("Could not create custom tooltip: %s", e)
                 import traceback
                 traceback.print_exc()
         
@@ -573,6 +573,6 @@ class EmployeePage(BasePage):
             self.page.evaluate(remove_tooltip_js)
             logger.debug("Removed custom tooltip from DOM")
         except Exception as e:
-            logger.debug(f"Could not remove tooltip: {e}")
+            logger.debug("Could not remove tooltip: %s", e)
         
         return screenshot_path
\ No newline at end of file
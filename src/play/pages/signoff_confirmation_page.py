@@ -72,7 +72,7 @@ class SignOffConfirmationPage(BasePage):
             self.approve_button.click()
             logger.info("Sign-off confirmed - window will close and return to employee page")
         except Exception as e:
-            logger.error(f"Error confirming sign-off: {e}")
+            logger.error("Error confirming sign-off: %s", e)
             self.take_screenshot("confirm_sign_off_error")
             raise
 
@@ -106,7 +106,7 @@ class SignOffConfirmationPage(BasePage):
             if "closed" in str(e).lower() or "TargetClosedError" in str(type(e).__name__):
                 logger.info("Sign-off cancelled - window closed (expected behavior)")
             else:
-                logger.error(f"Error cancelling sign-off: {e}")
+                logger.error("Error cancelling sign-off: %s", e)
                 raise
 
 
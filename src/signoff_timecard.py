@@ -12,13 +12,12 @@ from playwright.sync_api import sync_playwright, Browser, Page
 
 from src.config import load_users, get_app_config, validate_config
 from src.signoff_models import SignoffUser, SignoffResult
-from src.mail.email_service import EmailService
+from src.mail.email_service import get_shared_email_service
 from src.utils import setup_logging, format_result_message, get_screenshot_path, get_persistent_screenshot_path
 from src.play.pages.login_page import LoginPage
 from src.play.pages.dashboard_page import DashboardPage
 from src.play.pages.employee_page import EmployeePage
 from src.play.pages.signoff_confirmation_page import SignOffConfirmationPage
-from src.kms.utils import obfuscate_credential
 from src.storage import get_bucket_service
 
 logger = logging.getLogger(__name__)
@@ -44,7 +43,7 @@ def sign_off_for_user(user: SignoffUser, browser: Browser, base_url: str, headle
     screenshot_path = None
     
     try:
-        logger.info(f"Starting sign-off process for user: {user.email}")
+        logger.info("Starting sign-off process for user: %s", user.email)
         
         # Create browser context
         context = browser.new_context()
@@ -57,7 +56,7 @@ def sign_off_for_user(user: SignoffUser, browser: Browser, base_url: str, headle
         login_page.wait_for_page_load()
         
         # Perform login
-        logger.info(f"Logging in for user: {user.email}")
+        logger.info("Logging in for user: %s", user.email)
         login_page.login(
             username=user.username,
             password=user.password,
@@ -70,7 +69,7 @@ def sign_off_for_user(user: SignoffUser, browser: Browser, base_url: str, headle
         # Check for login errors before proceeding
         if login_page.has_login_error():
             error_message = login_page.get_login_error_message() or "Login failed - invalid credentials"
-            logger.error(f"Login error detected for {user.email}: {error_message}")
+            logger.error("Login error detected for %s: %s", user.email, error_message)
             screenshot_path = get_screenshot_path(user, "login_error")
             page.screenshot(path=screenshot_path, full_page=True)
             
@@ -84,8 +83,8 @@ def sign_off_for_user(user: SignoffUser, browser: Browser, base_url: str, headle
             )
             # Clear plaintext credentials
             try:
-                user.password = obfuscate_credential(user.password)
-                user.username = obfuscate_credential(user.username)
+                user.password = ""
+                user.username = ""
             except Exception:
                 pass
             return result
@@ -104,14 +103,14 @@ def sign_off_for_user(user: SignoffUser, browser: Browser, base_url: str, headle
         
         # Check if user has already signed off
         if employee_page.is_already_signed_off():
-            logger.info(f"User {user.email} has already signed off their timecard")
+            logger.info("User %s has already signed off their timecard", user.email)
             
             # Capture blue thumbs up icon screenshot (confirmation of signoff)
             screenshot_path = None
             try:
                 # Use the specialized method to capture blue thumbs up icon with tooltip
                 screenshot_path = employee_page.capture_blue_thumbs_up_tooltip()
-                logger.info(f"Blue thumbs up icon screenshot saved to {screenshot_path}")
+                logger.info("Blue thumbs up icon screenshot saved to %s", screenshot_path)
                 
                 # Move to persistent location and upload to Railway Bucket if available
                 persistent_path = get_persistent_screenshot_path(user)
@@ -129,24 +128,24 @@ def sign_off_for_user(user: SignoffUser, browser: Browser, base_url: str, headle
                     try:
                         s3_key = bucket_service.upload_screenshot(screenshot_path, user)
                         if s3_key:
-                            logger.info(f"Screenshot uploaded to bucket: {s3_key}")
+                            logger.info("Screenshot uploaded to bucket: %s", s3_key)
                             # Optionally delete local file to save space
                             Path(screenshot_path).unlink(missing_ok=True)
                             screenshot_path = None  # Local file deleted, stored in bucket
                     except Exception as upload_error:
-                        logger.warning(f"Failed to upload screenshot to bucket: {upload_error}")
+                        logger.warning("Failed to upload screenshot to bucket: %s", upload_error)
                         # Keep local file as fallback
                 else:
                     logger.debug("Bucket service not available, keeping local screenshot")
             except Exception as screenshot_error:
-                logger.error(f"Failed to capture blue thumbs up screenshot: {screenshot_error}")
+                logger.error("Failed to capture blue thumbs up screenshot: %s", screenshot_error)
                 # Try fallback: take full page screenshot
                 try:
                     screenshot_path = get_persistent_screenshot_path(user)
                     page.screenshot(path=screenshot_path, full_page=True)
-                    logger.info(f"Fallback screenshot saved to {screenshot_path}")
+                    logger.info("Fallback screenshot saved to %s", screenshot_path)
                 except Exception as fallback_error:
-                    logger.error(f"Failed to take fallback screenshot: {fallback_error}")
+                    logger.error("Failed to take fallback screenshot: %s", fallback_error)
                     screenshot_path = None
             
             result = SignoffResult(
@@ -158,8 +157,8 @@ def sign_off_for_user(user: SignoffUser, browser: Browser, base_url: str, headle
             )
             # Clear plaintext credentials
             try:
-                user.password = obfuscate_credential(user.password)
-                user.username = obfuscate_credential(user.username)
+                user.password = ""
+                user.username = ""
             except Exception:
                 pass
             return result
@@ -188,14 +187,14 @@ def sign_off_for_user(user: SignoffUser, browser: Browser, base_url: str, headle
             # If the window closed, this will fail, which indicates success
             confirmation_page.approve_button.is_visible(timeout=1000)
             # If we get here, the window is still open - this might indicate an issue
-            logger.warning(f"Confirmation window still open after approve click for {user.email}")
+            logger.warning("Confirmation window still open after approve click for %s", user.email)
             success = False
             message = "Sign-off confirmation window did not close"
             screenshot_path = get_screenshot_path(user, "signoff_issue")
             confirmation_page.take_screenshot(screenshot_path.split("/")[-1])
         except Exception:
             # Window closed - this is expected and indicates success
-            logger.info(f"Confirmation window closed - sign-off successful for {user.email}")
+            logger.info("Confirmation window closed - sign-off successful for %s", user.email)
             
             # Wait for employee page to update (button changes to "Un-Sign Off" and blue thumbs up appears)
             # This ensures we capture the blue thumbs up icon
@@ -214,7 +213,7 @@ def sign_off_for_user(user: SignoffUser, browser: Browser, base_url: str, headle
                     logger.warning("Blue thumbs up icon not yet visible, waiting...")
                     page.wait_for_timeout(1000)  # Additional wait for icon to appear
             except Exception as wait_error:
-                logger.warning(f"Could not verify employee page update: {wait_error}")
+                logger.warning("Could not verify employee page update: %s", wait_error)
                 # Continue anyway - page may have updated
             
             # Capture blue thumbs up icon screenshot (confirmation of signoff)
@@ -222,7 +221,7 @@ def sign_off_for_user(user: SignoffUser, browser: Browser, base_url: str, headle
             try:
                 # Use the specialized method to capture blue thumbs up icon with tooltip
                 screenshot_path = employee_page.capture_blue_thumbs_up_tooltip()
-                logger.info(f"Blue thumbs up icon screenshot saved to {screenshot_path}")
+                logger.info("Blue thumbs up icon screenshot saved to %s", screenshot_path)
                 
                 # Move to persistent location and upload to Railway Bucket if available
                 persistent_path = get_persistent_screenshot_path(user)
@@ -240,24 +239,24 @@ def sign_off_for_user(user: SignoffUser, browser: Browser, base_url: str, headle
                     try:
                         s3_key = bucket_service.upload_screenshot(screenshot_path, user)
                         if s3_key:
-                            logger.info(f"Screenshot uploaded to bucket: {s3_key}")
+                            logger.info("Screenshot uploaded to bucket: %s", s3_key)
                             # Optionally delete local file to save space
                             Path(screenshot_path).unlink(missing_ok=True)
                             screenshot_path = None  # Local file deleted, stored in bucket
                     except Exception as upload_error:
-                        logger.warning(f"Failed to upload screenshot to bucket: {upload_error}")
+                        logger.warning("Failed to upload screenshot to bucket: %s", upload_error)
                         # Keep local file as fallback
                 else:
                     logger.debug("Bucket service not available, keeping local screenshot")
             except Exception as screenshot_error:
-                logger.error(f"Failed to capture blue thumbs up screenshot: {screenshot_error}")
+                logger.error("Failed to capture blue thumbs up screenshot: %s", screenshot_error)
                 # Try fallback: take full page screenshot
                 try:
                     screenshot_path = get_persistent_screenshot_path(user)
                     page.screenshot(path=screenshot_path, full_page=True)
-                    logger.info(f"Fallback screenshot saved to {screenshot_path}")
+                    logger.info("Fallback screenshot saved to %s", screenshot_path)
                 except Exception as fallback_error:
-                    logger.error(f"Failed to take fallback screenshot: {fallback_error}")
+                    logger.error("Failed to take fallback screenshot: %s", fallback_error)
                     screenshot_path = None
             
             success = True
@@ -279,12 +278,11 @@ def sign_off_for_user(user: SignoffUser, browser: Browser, base_url: str, headle
             screenshot_path=screenshot_path
         )
         
-        # Clear plaintext credentials from user object after login (success or failure)
-        # This helps minimize the time plaintext credentials exist in memory
-        # Uses random-length obfuscation to prevent length inference
+        # Drop the user object's references to the plaintext credentials after login
+        # (success or failure) so they aren't carried along with the result
         try:
-            user.password = obfuscate_credential(user.password)
-            user.username = obfuscate_credential(user.username)
+            user.password = ""
+            user.username = ""
         except Exception:
             pass  # Best effort - don't fail if clearing fails
         
@@ -293,7 +291,7 @@ def sign_off_for_user(user: SignoffUser, browser: Browser, base_url: str, headle
     except Exception as e:
         error_msg = str(e)
         error_type = type(e).__name__
-        logger.error(f"Error during sign-off for {user.email}: {error_msg}", exc_info=True)
+        logger.error("Error during sign-off for %s: %s", user.email, error_msg, exc_info=True)
         
         # Take screenshot on error
         screenshot_path = None
@@ -302,7 +300,7 @@ def sign_off_for_user(user: SignoffUser, browser: Browser, base_url: str, headle
                 screenshot_path = get_screenshot_path(user, "error")
                 page.screenshot(path=screenshot_path, full_page=True)
         except Exception as screenshot_error:
-            logger.error(f"Failed to take screenshot: {screenshot_error}")
+            logger.error("Failed to take screenshot: %s", screenshot_error)
         
         # Check for login errors if we're still on the login page
         login_error_detected = False
@@ -352,11 +350,10 @@ def sign_off_for_user(user: SignoffUser, browser: Browser, base_url: str, headle
             error=categorized_error
         )
         
-        # Clear plaintext credentials from user object on error
-        # Uses random-length obfuscation to prevent length inference
+        # Drop the user object's references to the plaintext credentials on error
         try:
-            user.password = obfuscate_credential(user.password)
-            user.username = obfuscate_credential(user.username)
+            user.password = ""
+            user.username = ""
         except Exception:
             pass  # Best effort - don't fail if clearing fails
         
@@ -371,27 +368,47 @@ def sign_off_for_user(user: SignoffUser, browser: Browser, base_url: str, headle
             if context:
                 context.close()
             
-            # Clear plaintext credentials (defense in depth - may already be cleared)
-            # This ensures credentials are cleared even if previous clearing failed
-            # Note: We overwrite (not delete) because these are required dataclass fields
-            # Overwriting ensures the memory is cleared even if the object persists
-            # Uses random-length obfuscation to prevent length inference
+            # Drop plaintext credential references (defense in depth - may already be cleared)
+            # Note: We overwrite (not delete) because these are required dataclass fields.
+            # Python strings are immutable, so this cannot erase the original values.
             try:
                 if hasattr(user, 'password'):
-                    # Check if password is not already cleared (not all null bytes)
-                    if user.password and not all(c == '\x00' for c in user.password):
-                        # Overwrite with random-length null bytes (obfuscates original length)
-                        user.password = obfuscate_credential(user.password)
+                    user.password = ""
                 if hasattr(user, 'username'):
-                    # Check if username is not already cleared (not all null bytes)
-                    if user.username and not all(c == '\x00' for c in user.username):
-                        # Overwrite with random-length null bytes (obfuscates original length)
-                        user.username = obfuscate_credential(user.username)
+                    user.username = ""
             except Exception:
                 pass  # Best effort - credentials may already be cleared or attribute may not exist
                 
         except Exception as e:
-            logger.warning(f"Error during cleanup: {e}")
+            logger.warning("Error during cleanup: %s", e)
+
+
+def send_result_emails(email_service, results: list[SignoffResult]) -> int:
+    """
+    Email each user their sign-off result, logging every send that fails.
+    
+    Args:
+        email_service: The EmailService to send with (None disables notifications)
+        results: The SignoffResult objects to email
+    
+    Returns:
+        Number of results whose email was not sent
+    """
+    if not email_service or not results:
+        return 0
+    
+    try:
+        sent = email_service.send_signoff_results(results)
+    except Exception as e:
+        logger.error("Failed to send email notifications: %s", e, exc_info=True)
+        return len(results)
+    
+    failed = 0
+    for result, ok in zip(results, sent):
+        if not ok:
+            failed += 1
+            logger.error("Email notification not sent to %s", result.user.email)
+    return failed
 
 
 def main():
@@ -420,7 +437,7 @@ def main():
         if args.user:
             users = [u for u in users if u.username == args.user]
             if not users:
-                logger.error(f"User '{args.user}' not found in configuration")
+                logger.error("User '%s' not found in configuration", args.user)
                 sys.exit(1)
         
         # Get app configuration
@@ -429,59 +446,59 @@ def main():
         headless = args.headless or app_config["headless"]
         slow_mo = app_config["slow_mo"]
         
-        logger.info(f"Processing {len(users)} user(s)")
-        logger.info(f"Base URL: {base_url}")
-        logger.info(f"Headless mode: {headless}")
+        logger.info("Processing %s user(s)", len(users))
+        logger.info("Base URL: %s", base_url)
+        logger.info("Headless mode: %s", headless)
         
         # Initialize email service
         try:
-            email_service = EmailService()
+            email_service = get_shared_email_service()
             logger.info("Email service initialized")
         except Exception as e:
-            logger.error(f"Failed to initialize email service: {e}")
+            logger.error("Failed to initialize email service: %s", e)
             logger.warning("Continuing without email notifications")
             email_service = None
         
         # Process each user
         results = []
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=headless, slow_mo=slow_mo)
-            
-            try:
-                for user in users:
-                    logger.info(f"\n{'='*60}")
-                    logger.info(f"Processing user: {user.email}")
-                    logger.info(f"{'='*60}")
-                    
-                    result = sign_off_for_user(user, browser, base_url, headless, slow_mo)
-                    results.append(result)
-                    
-                    # Log result
-                    logger.info(format_result_message(result))
-                    
-                    # Send email notification
-                    if email_service:
-                        try:
-                            email_service.send_signoff_result(result)
-                        except Exception as e:
-                            logger.error(f"Failed to send email to {user.email}: {e}")
-                    
-                    logger.info(f"Completed processing for {user.email}\n")
-            
-            finally:
-                browser.close()
+        try:
+            with sync_playwright() as p:
+                browser = p.chromium.launch(headless=headless, slow_mo=slow_mo)
+                
+                try:
+                    for user in users:
+                        logger.info("\n%s", "=" * 60)
+                        logger.info("Processing user: %s", user.email)
+                        logger.info("%s", "=" * 60)
+                        
+                        result = sign_off_for_user(user, browser, base_url, headless, slow_mo)
+                        results.append(result)
+                        
+                        # Log result
+                        logger.info(format_result_message(result))
+                        
+                        logger.info("Completed processing for %s\n", user.email)
+                
+                finally:
+                    browser.close()
+        finally:
+            # Emails are sent once the browser is closed (batched where Resend allows).
+            # This also runs if the run stops partway, so users already processed
+            # still get their result.
+            email_failures = send_result_emails(email_service, results)
         
         # Print summary
         successful = sum(1 for r in results if r.success)
         failed = len(results) - successful
         
-        logger.info(f"\n{'='*60}")
+        logger.info("\n%s", "=" * 60)
         logger.info("SUMMARY")
-        logger.info(f"{'='*60}")
-        logger.info(f"Total users processed: {len(results)}")
-        logger.info(f"Successful: {successful}")
-        logger.info(f"Failed: {failed}")
-        logger.info(f"{'='*60}\n")
+        logger.info("%s", "=" * 60)
+        logger.info("Total users processed: %s", len(results))
+        logger.info("Successful: %s", successful)
+        logger.info("Failed: %s", failed)
+        logger.info("Emails not sent: %s", email_failures)
+        logger.info("%s\n", "=" * 60)
         
         # Exit with appropriate code
         if failed > 0:
@@ -493,7 +510,7 @@ def main():
         logger.info("\nInterrupted by user")
         sys.exit(130)
     except Exception as e:
-        logger.error(f"Fatal error: {e}", exc_info=True)
+        logger.error("Fatal error: %s", e, exc_info=True)
         sys.exit(1)
 
 
@@ -62,7 +62,7 @@ class BucketService:
             config=Config(signature_version='s3v4')
         )
         
-        logger.info(f"Bucket service initialized for bucket: {self.bucket_name}")
+        logger.info("Bucket service initialized for bucket: %s", self.bucket_name)
     
     def upload_file(self, local_path: str, s3_key: str, content_type: Optional[str] = None) -> bool:
         """
@@ -87,16 +87,16 @@ class BucketService:
                 s3_key,
                 ExtraArgs=extra_args if extra_args else None
             )
-            logger.info(f"File uploaded to bucket: {s3_key}")
+            logger.info("File uploaded to bucket: %s", s3_key)
             return True
         except FileNotFoundError:
-            logger.error(f"Local file not found: {local_path}")
+            logger.error("Local file not found: %s", local_path)
             return False
         except (ClientError, BotoCoreError) as e:
-            logger.error(f"Failed to upload file to bucket: {e}")
+            logger.error("Failed to upload file to bucket: %s", e)
             return False
         except Exception as e:
-            logger.error(f"Unexpected error uploading file: {e}")
+            logger.error("Unexpected error uploading file: %s", e)
             return False
     
     def download_file(self, s3_key: str, local_path: Optional[str] = None) -> Optional[bytes]:
@@ -118,19 +118,19 @@ class BucketService:
                 Path(local_path).parent.mkdir(parents=True, exist_ok=True)
                 with open(local_path, 'wb') as f:
                     f.write(file_content)
-                logger.info(f"File downloaded from bucket to: {local_path}")
+                logger.info("File downloaded from bucket to: %s", local_path)
                 return file_content
             else:
-                logger.info(f"File downloaded from bucket: {s3_key}")
+                logger.info("File downloaded from bucket: %s", s3_key)
                 return file_content
         except self.s3_client.exceptions.NoSuchKey:
-            logger.warning(f"File not found in bucket: {s3_key}")
+            logger.warning("File not found in bucket: %s", s3_key)
             return None
         except (ClientError, BotoCoreError) as e:
-            logger.error(f"Failed to download file from bucket: {e}")
+            logger.error("Failed to download file from bucket: %s", e)
             return None
         except Exception as e:
-            logger.error(f"Unexpected error downloading file: {e}")
+            logger.error("Unexpected error downloading file: %s", e)
             return None
     
     def file_exists(self, s3_key: str) -> bool:
@@ -149,7 +149,7 @@ class BucketService:
         except self.s3_client.exceptions.NoSuchKey:
             return False
         except (ClientError, BotoCoreError) as e:
-            logger.error(f"Error checking file existence: {e}")
+            logger.error("Error checking file existence: %s", e)
             return False
     
     def delete_file(self, s3_key: str) -> bool:
@@ -164,10 +164,10 @@ class BucketService:
         """
         try:
             self.s3_client.delete_object(Bucket=self.bucket_name, Key=s3_key)
-            logger.info(f"File deleted from bucket: {s3_key}")
+            logger.info("File deleted from bucket: %s", s3_key)
             return True
         except (ClientError, BotoCoreError) as e:
-            logger.error(f"Failed to delete file from bucket: {e}")
+            logger.error("Failed to delete file from bucket: %s", e)
             return False
     
     def generate_presigned_url(self, s3_key: str, expires_in: int = 3600) -> Optional[str]:
@@ -187,10 +187,10 @@ class BucketService:
                 Params={'Bucket': self.bucket_name, 'Key': s3_key},
                 ExpiresIn=expires_in
             )
-            logger.debug(f"Generated presigned URL for {s3_key} (expires in {expires_in}s)")
+            logger.debug("Generated presigned URL for %s (expires in %ss)", s3_key, expires_in)
             return url
         except (ClientError, BotoCoreError) as e:
-            logger.error(f"Failed to generate presigned URL: {e}")
+            logger.error("Failed to generate presigned URL: %s", e)
             return None
     
     def upload_screenshot(self, local_path: str, user: Union["SignoffUser", "DBUser"]) -> Optional[str]:
@@ -257,6 +257,6 @@ def get_bucket_service() -> Optional[BucketService]:
     try:
         return BucketService()
     except (ImportError, ValueError) as e:
-        logger.debug(f"Bucket service not available: {e}")
+        logger.debug("Bucket service not available: %s", e)
         return None
 
@@ -151,14 +151,14 @@ def retry(max_attempts: int = 3, delay: float = 1.0, backoff: float = 2.0):
                     if attempt < max_attempts - 1:
                         logger = logging.getLogger(__name__)
                         logger.warning(
-                            f"Attempt {attempt + 1} failed for {func.__name__}: {e}. "
-                            f"Retrying in {current_delay} seconds..."
+                            "Attempt %s failed for %s: %s. Retrying in %s seconds...",
+                            attempt + 1, func.__name__, e, current_delay
                         )
                         time.sleep(current_delay)
                         current_delay *= backoff
                     else:
                         logger = logging.getLogger(__name__)
-                        logger.error(f"All {max_attempts} attempts failed for {func.__name__}")
+                        logger.error("All %s attempts failed for %s", max_attempts, func.__name__)
             
             raise last_exception
         return wrapper